@@ -1,4 +1,85 @@
+"""Live dashboard: merged ESPN + NBA scoreboard with regime eval.
+
+All sessions share one ``LiveBoard`` per (date, preferred source)
+(``st.cache_resource``), which polls upstream only when its data is stale
+for the games' status, so reruns and extra viewers add no API load. Boards
+are keyed on the actual date, so "today" after midnight is a new board
+rather than last night's finals. Each game's rows are cached by (board,
+game, version) with ``st.cache_data``: only games whose state changed are
+re-rendered. The tables refresh in a fragment on the board's current TTL.
+
+Usage:
+    streamlit run app.py
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
 import streamlit as st
-from src.ui.panels.live_scoreboard import render_scoreboard
 
-st.text(render_scoreboard(states=[]))
+from src.runtime.live_board import LiveBoard
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src.ui.panels.game_eval import EVAL_HEADER, eval_row
+from src.ui.panels.live_scoreboard import SCOREBOARD_HEADER, scoreboard_row
+
+MIN_REFRESH = 2.0  # seconds
+IDLE_REFRESH = 60.0  # all games final: only re-check occasionally
+
+
+@st.cache_resource(show_spinner=False)
+def live_board(date: str, prefer: str) -> LiveBoard:
+    """One shared board per (date, preferred source) for every session."""
+    return LiveBoard(date, poller=MergedScoreboard(prefer=prefer))
+
+
+@st.cache_data(max_entries=2000, show_spinner=False)
+def game_rows(date: str, prefer: str, game_id: str, version: int, _state) -> tuple[str, str]:
+    """Scoreboard and eval lines for one game version (state is not hashed).
+
+    Versions count per board, so the key includes the board's (date, prefer).
+    """
+    return scoreboard_row(_state), eval_row(_state)
+
+
+def _run_every(ttl: float | None) -> float:
+    return IDLE_REFRESH if ttl is None else max(MIN_REFRESH, ttl)
+
+
+def _table(header: str, rows: list[str], empty: str) -> str:
+    if not rows:
+        return empty
+    return "\n".join([header, "-" * len(header), *rows])
+
+
+st.set_page_config(page_title="nba-engine-lab", layout="wide")
+st.title("nba-engine-lab — live")
+
+with st.sidebar:
+    day = st.date_input("Date", value=dt.date.today())
+    prefer = st.radio("Prefer on ties", ("nba", "espn"), horizontal=True)
+date = day.strftime("%Y%m%d")
+board = live_board(date, prefer)
+run_every = _run_every(board.get().ttl)
+
+
+@st.fragment(run_every=run_every)
+def render():
+    snap = board.get()
+    if _run_every(snap.ttl) != run_every:
+        st.rerun()  # status changed (e.g. pregame -> live): redefine on the new TTL
+    rows = [game_rows(date, prefer, s.game_id, snap.versions[s.game_id], s) for s in snap.states]
+
+    st.subheader("Scoreboard")
+    st.text(_table(SCOREBOARD_HEADER, [r[0] for r in rows], "No games found."))
+    st.subheader("Game eval")
+    st.text(_table(EVAL_HEADER, [r[1] for r in rows], "No games to evaluate."))
+
+    for source, error in snap.errors.items():
+        st.warning(f"{source} scoreboard failed: {error}")
+    age = board.clock() - snap.fetched_at
+    ttl = "final" if snap.ttl is None else f"refresh {snap.ttl:.0f}s"
+    st.caption(f"{len(snap.states)} games | data age {age:.0f}s ({ttl}) | upstream polls {board.polls}")
+
+
+render()
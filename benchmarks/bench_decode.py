@@ -0,0 +1,92 @@
+"""JSON decode benchmark: each installed backend over ESPN and NBA payloads.
+
+Uses the payloads of a ``--record`` recording when given (one sample per
+URL, the largest), else synthetic scoreboards and PBP. ``requests`` is the
+baseline (``resp.json()``: charset detection + str decode + stdlib json).
+
+Usage:
+    python -m benchmarks.bench_decode
+    python -m benchmarks.bench_decode --recording nights/2026-02-28.jsonl.gz
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.fixtures import (
+    synthetic_espn_pbp,
+    synthetic_espn_scoreboard,
+    synthetic_nba_pbp,
+    synthetic_nba_scoreboard,
+)
+from src.data import json_decode
+from src.data.recorder import read_recording, record_body
+
+
+def recorded_payloads(path: str) -> dict[str, list[bytes]]:
+    """Largest recorded 200 body per URL, grouped by source."""
+    largest: dict[tuple[str, str], bytes] = {}
+    for record in read_recording(path):
+        if record.get("status") != 200:
+            continue
+        key = (record["source"], record["url"])
+        body = record_body(record)
+        if len(body) > len(largest.get(key, b"")):
+            largest[key] = body
+    out: dict[str, list[bytes]] = {}
+    for (source, _), body in largest.items():
+        out.setdefault(source, []).append(body)
+    return out
+
+
+def synthetic_payloads() -> dict[str, list[bytes]]:
+    encode = lambda d: json.dumps(d).encode()  # noqa: E731
+    return {
+        "espn": [encode(synthetic_espn_scoreboard()), encode(synthetic_espn_pbp("401", n_plays=500))],
+        "nba": [encode(synthetic_nba_scoreboard()), encode(synthetic_nba_pbp("0022400001", n_actions=600))],
+    }
+
+
+def _requests_baseline(content: bytes):
+    return json.loads(content.decode("utf-8"))
+
+
+def run(payloads: dict[str, list[bytes]], repeat: int = 20) -> list[tuple[str, str, float, float]]:
+    """Rows of (source, backend, mean ms per payload, MB/s)."""
+    decoders = [("requests", _requests_baseline)]
+    for name in json_decode.available_backends():
+        decoders.append((name, json_decode._load_backend(name)))
+    rows = []
+    for source, bodies in sorted(payloads.items()):
+        total_bytes = sum(len(b) for b in bodies) * repeat
+        for name, loads in decoders:
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for body in bodies:
+                    loads(body)
+            elapsed = time.perf_counter() - start
+            rows.append((source, name, elapsed * 1000 / (repeat * len(bodies)), total_bytes / elapsed / 1e6))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="recording written with --record")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = recorded_payloads(args.recording) if args.recording else synthetic_payloads()
+    print(f"{'Source':<6} {'Backend':<10} {'ms/payload':>11} {'MB/s':>8}")
+    print("-" * 38)
+    for source, name, ms, mbps in run(payloads, args.repeat):
+        print(f"{source:<6} {name:<10} {ms:>11.2f} {mbps:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Import-time benchmark: cost of importing each entry point, with budgets.
+
+For every entry point (runner scripts, ``app.py``, the most used library
+modules) runs a fresh ``python -X importtime`` that executes only the
+entry's top-level imports, and reports the total import time of what
+those imports add (interpreter startup excluded) plus any heavy
+dependency they load eagerly. ``--check`` exits 1 when an entry exceeds
+its budget or loads a heavy dependency at import.
+
+Heavy dependencies (requests, NumPy, pyarrow, nba_api, JSON backends, ...)
+must be imported on first use instead. ``app.py`` is measured on top of
+``streamlit``, which ``streamlit run`` has loaded already.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+HEAVY = ("requests", "urllib3", "certifi", "numpy", "pandas", "pyarrow", "nba_api",
+         "streamlit", "orjson", "ujson")
+
+
+@dataclass(frozen=True)
+class Entry:
+    """One thing people import or run, with its import-time budget."""
+
+    name: str  # repo-relative script path, or a dotted module name
+    budget_ms: float
+    preload: tuple[str, ...] = ()  # imported first and not counted (already loaded at runtime)
+
+
+# Budgets sit ~2x over a warm local run but only ~1.25x over a cold one (no
+# bytecode yet), so they are a ``--check`` gate for comparable machines, not a
+# unit test. An eager ``import requests`` (~40ms) or ``import numpy`` (~30ms)
+# still trips them; tests/test_import_time.py checks heavy imports directly.
+ENTRY_POINTS = (
+    Entry("experiments/espn_feed/run.py", 25),
+    Entry("experiments/nba_feed/run.py", 25),
+    Entry("experiments/merged_feed/run.py", 30),
+    Entry("experiments/backfill/run.py", 40),
+    Entry("experiments/state_hub/run.py", 60),
+    Entry("app.py", 30, preload=("streamlit",)),
+    Entry("src.ui.panels.game_eval", 15),
+    Entry("src.ui.panels.live_scoreboard", 15),
+    Entry("src.data.espn_scoreboard", 20),
+    Entry("src.data.nba_scoreboard", 20),
+    Entry("src.runtime.merged_scoreboard", 25),
+    Entry("src.state.regime_batch", 15),
+)
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class Measurement:
+    name: str
+    ms: float
+    heavy: list[str]  # heavy top-level packages the entry imported eagerly
+    budget_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return self.ms <= self.budget_ms and not self.heavy
+
+
+def import_code(entry: Entry) -> str:
+    """Python source with just the entry's top-level import statements."""
+    if entry.name.endswith(".py"):
+        with open(os.path.join(REPO, entry.name)) as f:
+            tree = ast.parse(f.read())
+        nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))
+                 and not (isinstance(n, ast.ImportFrom) and n.module == "__future__")]
+        return "\n".join(ast.unparse(n) for n in nodes)
+    return f"import {entry.name}"
+
+
+def _roots(stderr: str) -> dict[str, int]:
+    """Top-level imports in ``-X importtime`` output: name -> cumulative us."""
+    roots = {}
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if m and len(m.group(3)) == 1:
+            roots[m.group(4)] = roots.get(m.group(4), 0) + int(m.group(2))
+    return roots
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": REPO, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _startup() -> frozenset[str]:
+    """Modules the bare interpreter imports before any entry code runs."""
+    return frozenset(_roots(_run("pass").stderr))
+
+
+def measure(entry: Entry, runs: int = 3) -> Measurement:
+    """Best of ``runs`` fresh interpreters (the minimum is the least noisy)."""
+    preload = "\n".join(f"import {m}" for m in entry.preload)
+    code = "\n".join([
+        "import sys", preload, "_before = set(sys.modules)", import_code(entry),
+        "import json",
+        f"print(json.dumps(sorted({{m.split('.')[0] for m in set(sys.modules) - _before}} & {set(HEAVY)!r})))",
+    ])
+    best, heavy = None, []
+    for _ in range(runs):
+        proc = _run(code)
+        skip = _startup() | set(entry.preload)
+        total = sum(us for name, us in _roots(proc.stderr).items()
+                    if name not in skip and name.split(".")[0] not in entry.preload)
+        best = total if best is None else min(best, total)
+        heavy = json.loads(proc.stdout.strip().splitlines()[-1])
+    return Measurement(entry.name, best / 1000, heavy, entry.budget_ms)
+
+
+def run(entries=ENTRY_POINTS, runs: int = 3) -> list[Measurement]:
+    return [measure(e, runs) for e in entries]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--check", action="store_true", help="exit 1 if any entry is over budget")
+    args = parser.parse_args(argv)
+
+    results = run(runs=args.runs)
+    print(f"{'Entry point':<34} {'Import ms':>10} {'Budget':>7}  Heavy at import")
+    print("-" * 72)
+    for r in results:
+        flag = "" if r.ok else "  <-- FAIL"
+        print(f"{r.name:<34} {r.ms:>10.1f} {r.budget_ms:>7.0f}  {', '.join(r.heavy) or '-'}{flag}")
+    if args.check and not all(r.ok for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
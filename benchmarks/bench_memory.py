@@ -0,0 +1,92 @@
+"""Memory benchmark: bytes per event / per snapshot for each representation.
+
+Compares list[PBPEvent] vs list[CompactPBPEvent] vs PBPEventBatch, and
+GameState vs CompactGameState, on synthetic multi-game PBP.
+
+Usage:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --games 50 --events 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import os
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.fixtures import synthetic_nba_pbp, synthetic_nba_scoreboard
+from src.adapters.pbp_compact import PBPEventBatch, to_compact
+from src.adapters.playbyplay_adapter import normalize_nba_pbp
+from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
+from src.state.game_state import CompactGameState
+
+
+def _held_bytes(build) -> tuple[int, object]:
+    """Bytes still allocated after ``build()`` returns (its temporaries freed)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held, result
+
+
+def _season_events(games: int, events: int, convert):
+    def build():
+        out = []
+        for g in range(games):
+            raw = synthetic_nba_pbp(game_id=f"00224{g:05d}", n_actions=events, seed=g)
+            out.append(convert(normalize_nba_pbp(raw)))
+        return out
+    return build
+
+
+def run(games: int = 20, events: int = 500) -> list[tuple[str, float]]:
+    total = games * events
+    rows = []
+    for label, convert in (
+        ("list[PBPEvent]", lambda evs: evs),
+        ("list[CompactPBPEvent]", to_compact),
+        ("PBPEventBatch", PBPEventBatch.from_events),
+    ):
+        held, _ = _held_bytes(_season_events(games, events, convert))
+        rows.append((label, held / total))
+
+    n_states = games * 15
+    for label, convert in (
+        ("GameState", lambda states: states),
+        ("CompactGameState", lambda states: [CompactGameState.from_state(s) for s in states]),
+    ):
+        def build():
+            return [convert(normalize_nba_scoreboard(synthetic_nba_scoreboard(seed=i)))
+                    for i in range(games)]
+        held, _ = _held_bytes(build)
+        rows.append((label, held / n_states))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--events", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = run(args.games, args.events)
+    print(f"{'Representation':<24} {'Bytes/item':>12}")
+    print("-" * 37)
+    for label, per_item in rows:
+        print(f"{label:<24} {per_item:>12.1f}")
+    full_season = 1230 * 500
+    print()
+    for label, per_item in rows[:3]:
+        print(f"Full season ({full_season:,} events) as {label}: {per_item * full_season / 2**20:,.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
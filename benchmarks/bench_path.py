@@ -0,0 +1,338 @@
+"""Path benchmark: data → adapters → state → ui, with stored baselines.
+
+Times every stage on realistic inputs: JSON decode, the scoreboard and PBP
+normalizers, ``classify_regime``, ``render_scoreboard`` and
+``render_eval`` on 15-game slates and 600-action PBP, plus a season batch
+(decode + normalize every game's PBP). Inputs are synthetic, or the
+payloads of a ``--record`` recording when given.
+
+Each case reports throughput, latency percentiles (p50 / p95 / p99 per
+call) and peak traced allocation per call. ``--save`` writes the results
+as the baseline, tagged with the machine and the input kind (synthetic or
+recording). ``--check`` compares against it and exits 1 when a case's p50
+or allocation regresses past the tolerance. It refuses a baseline taken on
+other inputs. Against a baseline from another machine it checks
+allocations only, since timings are machine specific (re-save with
+``--save``).
+
+Usage:
+    python -m benchmarks.bench_path
+    python -m benchmarks.bench_path --check
+    python -m benchmarks.bench_path --save
+    python -m benchmarks.bench_path --recording nights/2026-02-28.jsonl.gz --season-games 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.fixtures import (
+    synthetic_espn_pbp,
+    synthetic_espn_scoreboard,
+    synthetic_nba_pbp,
+    synthetic_nba_scoreboard,
+)
+from src.adapters.playbyplay_adapter import normalize_espn_pbp, normalize_nba_pbp
+from src.adapters.scoreboard_adapter import normalize_espn_scoreboard, normalize_nba_scoreboard
+from src.data import json_decode
+from src.data.recorder import read_recording, record_body
+from src.state.regime import classify_regime
+from src.ui.panels.game_eval import render_eval
+from src.ui.panels.live_scoreboard import render_scoreboard
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "bench_path.json")
+SEASON_GAMES = 1230
+TIME_TOLERANCE = 0.30  # p50 may grow 30% before the check fails
+ALLOC_TOLERANCE = 0.10
+ALLOC_SAMPLES = 10
+
+
+@dataclass
+class Case:
+    """One benchmarked call: ``fn(input)`` over a stream of inputs.
+
+    ``items`` counts the units one input carries (games, events) for the
+    throughput column.
+    """
+
+    name: str
+    fn: Callable[[Any], Any]
+    inputs: Callable[[int], Iterator[Any]]
+    samples: int
+    unit: str = "calls"
+    items: Callable[[Any], int] = lambda _: 1
+
+
+@dataclass
+class Result:
+    name: str
+    samples: int
+    unit: str
+    throughput: float  # units per second
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    peak_kib: float  # median peak traced allocation per call
+
+
+# --- Inputs ---
+
+
+def _encode(data: dict) -> bytes:
+    return json.dumps(data).encode()
+
+
+def _cycle(make: Callable[[int], Any], distinct: int) -> Callable[[int], Iterator[Any]]:
+    """``n`` inputs cycling over ``distinct`` prebuilt variants (built lazily)."""
+    def inputs(n: int) -> Iterator[Any]:
+        pool = [make(seed) for seed in range(min(n, distinct))]
+        return itertools.islice(itertools.cycle(pool), n)
+    return inputs
+
+
+def synthetic_inputs() -> dict[str, Callable[[int], Iterator[Any]]]:
+    """Input streams per payload kind: 15-game slates and 600-action PBP."""
+    return {
+        "espn_scoreboard": _cycle(lambda s: synthetic_espn_scoreboard(15, seed=s), 20),
+        "nba_scoreboard": _cycle(lambda s: synthetic_nba_scoreboard(15, seed=s), 20),
+        "espn_pbp": _cycle(lambda s: synthetic_espn_pbp(f"4015847{s:02d}", 600, seed=s), 5),
+        "nba_pbp": _cycle(lambda s: synthetic_nba_pbp(f"00224{s:05d}", 600, seed=s), 5),
+        "season": lambda n: (_encode(synthetic_nba_pbp(f"00224{g:05d}", 600, seed=g)) for g in range(n)),
+    }
+
+
+def _kind(url: str) -> str | None:
+    is_espn = "espn" in url
+    if "scoreboard" in url.lower():
+        return "espn_scoreboard" if is_espn else "nba_scoreboard"
+    if "summary" in url or "playbyplay" in url:
+        return "espn_pbp" if is_espn else "nba_pbp"
+    return None
+
+
+def recorded_inputs(path: str) -> dict[str, Callable[[int], Iterator[Any]]]:
+    """Input streams from a recording: every 200 payload, by kind.
+
+    Kinds the recording lacks fall back to synthetic inputs. The season
+    batch replays the recorded NBA PBP payloads.
+    """
+    found: dict[str, list[Any]] = {}
+    for record in read_recording(path):
+        kind = _kind(record.get("url", ""))
+        if kind is None or record.get("status") != 200:
+            continue
+        found.setdefault(kind, []).append(json.loads(record_body(record)))
+    out = synthetic_inputs()
+    for kind, payloads in found.items():
+        out[kind] = lambda n, p=payloads: itertools.islice(itertools.cycle(p), n)
+    if "nba_pbp" in found:
+        out["season"] = lambda n, p=found["nba_pbp"]: (
+            _encode(d) for d in itertools.islice(itertools.cycle(p), n))
+    return out
+
+
+def _season_game(content: bytes):
+    return normalize_nba_pbp(json_decode.decode("nba", content))
+
+
+def cases(inputs: dict, samples: int = 200, season_games: int = SEASON_GAMES) -> list[Case]:
+    """The full path, one case per stage."""
+    pbp_samples = max(1, samples // 4)
+
+    def slates(kind: str) -> Callable[[int], Iterator[list]]:
+        normalize = normalize_espn_scoreboard if kind.startswith("espn") else normalize_nba_scoreboard
+        return lambda n: (normalize(raw) for raw in inputs[kind](n))
+
+    def encoded(kind: str) -> Callable[[int], Iterator[bytes]]:
+        return lambda n: (_encode(raw) for raw in inputs[kind](n))
+
+    games = len
+    return [
+        Case("decode espn scoreboard", lambda b: json_decode.decode("espn", b),
+             encoded("espn_scoreboard"), samples),
+        Case("decode nba pbp", lambda b: json_decode.decode("nba", b), encoded("nba_pbp"), pbp_samples),
+        Case("normalize_espn_scoreboard", normalize_espn_scoreboard, inputs["espn_scoreboard"],
+             samples, "games", lambda raw: len(raw.get("events", []))),
+        Case("normalize_nba_scoreboard", normalize_nba_scoreboard, inputs["nba_scoreboard"],
+             samples, "games", lambda raw: len(raw.get("scoreboard", {}).get("games", []))),
+        Case("normalize_espn_pbp", normalize_espn_pbp, inputs["espn_pbp"], pbp_samples, "events",
+             lambda raw: len(raw.get("plays", []))),
+        Case("normalize_nba_pbp", normalize_nba_pbp, inputs["nba_pbp"], pbp_samples, "events",
+             lambda raw: len(raw.get("game", {}).get("actions", []))),
+        Case("classify_regime (slate)", lambda states: [classify_regime(s) for s in states],
+             slates("nba_scoreboard"), samples, "games", games),
+        Case("render_scoreboard", render_scoreboard, slates("espn_scoreboard"), samples, "games", games),
+        Case("render_eval", render_eval, slates("nba_scoreboard"), samples, "games", games),
+        Case("season decode+normalize_nba_pbp", _season_game, inputs["season"], season_games, "games"),
+    ]
+
+
+# --- Measuring ---
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _peak_kib(fn: Callable[[Any], Any], inputs: Iterable[Any]) -> float:
+    peaks = []
+    tracemalloc.start()
+    try:
+        for inp in inputs:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = fn(inp)
+            peaks.append((tracemalloc.get_traced_memory()[1] - base) / 1024)
+            del result
+    finally:
+        tracemalloc.stop()
+    peaks.sort()
+    return percentile(peaks, 50)
+
+
+def measure(case: Case, warmup: int = 3) -> Result:
+    """Time ``case`` over its inputs, then trace allocations on a few."""
+    for inp in case.inputs(min(warmup, case.samples)):
+        case.fn(inp)
+    latencies: list[float] = []
+    units = 0
+    gc.collect()
+    for inp in case.inputs(case.samples):
+        units += case.items(inp)
+        start = time.perf_counter()
+        case.fn(inp)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    total = sum(latencies)
+    us = lambda q: percentile(latencies, q) * 1e6  # noqa: E731
+    return Result(
+        name=case.name, samples=len(latencies), unit=case.unit,
+        throughput=units / total if total else 0.0,
+        p50_us=us(50), p95_us=us(95), p99_us=us(99),
+        peak_kib=_peak_kib(case.fn, case.inputs(min(ALLOC_SAMPLES, case.samples))),
+    )
+
+
+def run(inputs: dict | None = None, samples: int = 200, season_games: int = SEASON_GAMES) -> list[Result]:
+    return [measure(c) for c in cases(inputs or synthetic_inputs(), samples, season_games)]
+
+
+# --- Baselines ---
+
+
+def machine() -> dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform()}
+
+
+def save_baseline(results: list[Result], path: str = BASELINE_PATH, inputs: str = "synthetic") -> None:
+    """Write ``results`` as the baseline; ``inputs`` is "synthetic" or "recording"."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = {
+        "machine": machine(),
+        "inputs": inputs,
+        "cases": {r.name: asdict(r) for r in results},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_baseline(path: str = BASELINE_PATH) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(
+    results: list[Result],
+    baseline: dict,
+    time_tolerance: float = TIME_TOLERANCE,
+    alloc_tolerance: float = ALLOC_TOLERANCE,
+    inputs: str = "synthetic",
+    check_time: bool = True,
+) -> list[str]:
+    """Regressions against ``baseline``, one message each (empty = pass).
+
+    A case fails when its p50 exceeds the baseline by more than
+    ``time_tolerance`` (only with ``check_time``) or its peak allocation by
+    more than ``alloc_tolerance``. Cases missing from the baseline are
+    skipped.
+
+    Raises:
+        ValueError: The baseline was measured on other inputs.
+    """
+    base_inputs = baseline.get("inputs", "synthetic")
+    if base_inputs != inputs:
+        raise ValueError(f"baseline was measured on {base_inputs} inputs, this run on {inputs}; "
+                         "use --baseline with a matching file or --save a new one")
+    failures = []
+    for r in results:
+        base = baseline.get("cases", {}).get(r.name)
+        if base is None:
+            continue
+        if check_time and r.p50_us > base["p50_us"] * (1 + time_tolerance):
+            failures.append(f"{r.name}: p50 {r.p50_us:,.1f}us vs baseline {base['p50_us']:,.1f}us")
+        if r.peak_kib > base["peak_kib"] * (1 + alloc_tolerance) + 1:  # +1 KiB for tracer noise
+            failures.append(f"{r.name}: peak {r.peak_kib:,.1f}KiB vs baseline {base['peak_kib']:,.1f}KiB")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recording", help="recording written with --record")
+    parser.add_argument("--samples", type=int, default=200, help="calls per slate case (PBP: a quarter)")
+    parser.add_argument("--season-games", type=int, default=SEASON_GAMES)
+    parser.add_argument("--save", action="store_true", help="write the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 on regression vs the baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE, help="allowed p50 growth")
+    args = parser.parse_args(argv)
+
+    kind = "recording" if args.recording else "synthetic"
+    inputs = recorded_inputs(args.recording) if args.recording else synthetic_inputs()
+    results = run(inputs, args.samples, args.season_games)
+    print(f"{'Case':<32} {'Throughput':>18} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10} {'Peak KiB':>9}")
+    print("-" * 94)
+    for r in results:
+        rate = f"{r.throughput:,.0f} {r.unit}/s"
+        print(f"{r.name:<32} {rate:>18} {r.p50_us:>10,.1f} {r.p95_us:>10,.1f} "
+              f"{r.p99_us:>10,.1f} {r.peak_kib:>9,.1f}")
+
+    if args.save:
+        save_baseline(results, args.baseline, kind)
+        print(f"\nBaseline saved to {args.baseline}")
+    if args.check:
+        baseline = load_baseline(args.baseline)
+        same_machine = baseline.get("machine") == machine()
+        if not same_machine:
+            print(f"\nBaseline is from another machine ({baseline.get('machine')}): "
+                  "checking allocations only. Re-save with --save on this machine.")
+        try:
+            failures = compare(results, baseline, args.tolerance, inputs=kind, check_time=same_machine)
+        except ValueError as e:
+            sys.exit(f"\n{e}")
+        if failures:
+            print("\nREGRESSIONS:")
+            for line in failures:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions vs baseline.")
+
+
+if __name__ == "__main__":
+    main()
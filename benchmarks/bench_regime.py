@@ -0,0 +1,74 @@
+"""Regime classification benchmark: scalar classify_regime vs classify_regimes.
+
+Classifies N random snapshots both ways, checks the results agree and
+reports snapshots/second for the scalar loop, the batch build, and the
+vectorized pass alone.
+
+Usage:
+    python -m benchmarks.bench_regime
+    python -m benchmarks.bench_regime --snapshots 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.state.game_state import GameState
+from src.state.regime import classify_regime
+from src.state.regime_batch import SnapshotBatch, classify_regimes, regime_names
+
+
+def synthetic_snapshots(n: int, seed: int = 0) -> list[GameState]:
+    rng = random.Random(seed)
+    statuses = ["in"] * 8 + ["pre", "post"]
+    return [
+        GameState(
+            game_id=f"00224{i % 1230:05d}", source="nba", status=rng.choice(statuses),
+            period=rng.randint(1, 5), clock=f"{rng.randint(0, 11)}:{rng.randint(0, 59):02d}",
+            home_score=rng.randint(60, 130), away_score=rng.randint(60, 130),
+        )
+        for i in range(n)
+    ]
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def run(n: int = 200_000) -> list[tuple[str, float]]:
+    states = synthetic_snapshots(n)
+    t_scalar, scalar = _timed(lambda: [classify_regime(s) for s in states])
+    t_build, batch = _timed(lambda: SnapshotBatch.from_states(states))
+    t_vec, codes = _timed(lambda: classify_regimes(batch))
+    if regime_names(codes) != scalar:
+        raise AssertionError("batch and scalar regimes disagree")
+    return [
+        ("scalar classify_regime", t_scalar),
+        ("SnapshotBatch.from_states", t_build),
+        ("classify_regimes", t_vec),
+        ("batch total", t_build + t_vec),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snapshots", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rows = run(args.snapshots)
+    print(f"{'Path':<28} {'Seconds':>9} {'Snapshots/s':>14}")
+    print("-" * 53)
+    for label, seconds in rows:
+        print(f"{label:<28} {seconds:>9.3f} {args.snapshots / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
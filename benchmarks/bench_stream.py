@@ -0,0 +1,82 @@
+"""Streaming vs full-document PBP parsing: time and peak memory.
+
+Parses synthetic ESPN summary and NBA PBP payloads either with
+``json.loads`` + ``normalize_*_pbp`` or with ``iter_array`` +
+``iter_*_pbp`` over 64 KiB chunks, and reports wall time and tracemalloc
+peak for each.
+
+Usage:
+    python -m benchmarks.bench_stream
+    python -m benchmarks.bench_stream --plays 1200 --padding 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.fixtures import synthetic_espn_pbp, synthetic_nba_pbp
+from src.adapters.playbyplay_adapter import (
+    iter_espn_pbp,
+    iter_nba_pbp,
+    normalize_espn_pbp,
+    normalize_nba_pbp,
+)
+from src.data.json_stream import DEFAULT_CHUNK_SIZE, iter_array
+
+
+def _chunks(body: bytes):
+    for i in range(0, len(body), DEFAULT_CHUNK_SIZE):
+        yield body[i:i + DEFAULT_CHUNK_SIZE]
+
+
+def _measure(fn) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = 0
+    for _ in fn():
+        count += 1  # consume without keeping events alive
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(plays: int = 800, padding: int = 1000) -> list[tuple[str, int, float, int]]:
+    espn = synthetic_espn_pbp(game_id="401", n_plays=plays)
+    # Stand-in for the boxscore / news / odds bulk of a real summary.
+    espn["padding"] = [{"athlete": f"Player {i}", "stats": list(range(20))} for i in range(padding)]
+    nba = synthetic_nba_pbp(game_id="0022400001", n_actions=plays)
+    cases = [
+        ("espn", json.dumps(espn).encode(), normalize_espn_pbp, iter_espn_pbp, ("plays",)),
+        ("nba", json.dumps(nba).encode(), normalize_nba_pbp, iter_nba_pbp, ("game", "actions")),
+    ]
+    rows = []
+    for source, body, normalize, iter_events, path in cases:
+        full = _measure(lambda: normalize(json.loads(body)))
+        stream = _measure(lambda: iter_events(iter_array(_chunks(body), path)))
+        rows.append((f"{source} json.loads", len(body), *full))
+        rows.append((f"{source} streaming", len(body), *stream))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--plays", type=int, default=800)
+    parser.add_argument("--padding", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'Path':<20} {'Payload KiB':>12} {'ms':>8} {'Peak KiB':>10}")
+    print("-" * 53)
+    for label, size, seconds, peak in run(args.plays, args.padding):
+        print(f"{label:<20} {size / 1024:>12.0f} {seconds * 1000:>8.1f} {peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Synthetic raw feed payloads at realistic sizes for benchmarks.
+
+Shapes mirror the NBA CDN and ESPN responses the adapters consume.
+Deterministic: the same arguments always produce the same payload.
+"""
+
+from __future__ import annotations
+
+import random
+
+TEAMS = [
+    ("BOS", "Celtics"), ("LAL", "Lakers"), ("NYK", "Knicks"), ("MIA", "Heat"),
+    ("GSW", "Warriors"), ("DEN", "Nuggets"), ("MIL", "Bucks"), ("PHX", "Suns"),
+    ("DAL", "Mavericks"), ("PHI", "76ers"), ("CLE", "Cavaliers"), ("OKC", "Thunder"),
+    ("MIN", "Timberwolves"), ("SAC", "Kings"), ("NOP", "Pelicans"), ("ATL", "Hawks"),
+    ("CHI", "Bulls"), ("TOR", "Raptors"), ("BKN", "Nets"), ("ORL", "Magic"),
+    ("IND", "Pacers"), ("HOU", "Rockets"), ("MEM", "Grizzlies"), ("LAC", "Clippers"),
+    ("UTA", "Jazz"), ("POR", "Trail Blazers"), ("SAS", "Spurs"), ("WAS", "Wizards"),
+    ("CHA", "Hornets"), ("DET", "Pistons"),
+]
+
+_ACTIONS = [
+    ("2pt", "Jump Shot"), ("3pt", "Jump Shot"), ("rebound", "defensive"),
+    ("rebound", "offensive"), ("foul", "personal"), ("foul", "shooting"),
+    ("freethrow", "1 of 2"), ("turnover", "bad pass"), ("substitution", "out"),
+    ("timeout", "full"), ("foul", "offensive"), ("steal", ""), ("block", ""),
+]
+
+_TEAM_INDEX = {abbr: i for i, (abbr, _) in enumerate(TEAMS)}
+
+
+def _players(abbr: str) -> list[str]:
+    return [f"{chr(65 + i)}. {abbr.title()}{i}" for i in range(10)]
+
+
+def synthetic_nba_pbp(game_id: str = "0022400100", n_actions: int = 600, seed: int = 0,
+                      home: str = "NYK", away: str = "MIA") -> dict:
+    """NBA CDN playbyplay_{game_id}.json shaped payload."""
+    rng = random.Random(seed)
+    players = {home: _players(home), away: _players(away)}
+    actions = []
+    score = {home: 0, away: 0}
+    periods = 4
+    per_period = max(1, n_actions // periods)
+    for n in range(1, n_actions + 1):
+        period = min(periods, (n - 1) // per_period + 1)
+        remaining = 720 - int(720 * (((n - 1) % per_period) / per_period))
+        team = home if rng.random() < 0.5 else away
+        action_type, sub_type = rng.choice(_ACTIONS)
+        if action_type in ("2pt", "3pt") and rng.random() < 0.5:
+            score[team] += 2 if action_type == "2pt" else 3
+        player = rng.choice(players[team])
+        actions.append({
+            "actionNumber": n,
+            "orderNumber": n * 10000,
+            "clock": f"PT{remaining // 60:02d}M{remaining % 60:02d}.00S",
+            "period": period,
+            "periodType": "REGULAR",
+            "teamId": 1610612700 + _TEAM_INDEX[team],
+            "teamTricode": team,
+            "actionType": action_type,
+            "subType": sub_type,
+            "descriptor": "",
+            "qualifiers": [],
+            "personId": 200000 + n % 500,
+            "x": rng.uniform(0, 100),
+            "y": rng.uniform(0, 100),
+            "possession": 1610612700,
+            "scoreHome": str(score[home]),
+            "scoreAway": str(score[away]),
+            "edited": f"2026-02-28T01:{n % 60:02d}:00Z",
+            "isFieldGoal": int(action_type in ("2pt", "3pt")),
+            "description": f"{player} {sub_type} {action_type}".strip(),
+            "playerName": player.split(". ")[1],
+            "playerNameI": player,
+        })
+    return {
+        "meta": {"version": 1, "code": 200, "request": "", "time": "2026-02-28 01:00:00.000"},
+        "game": {"gameId": game_id, "actions": actions},
+    }
+
+
+def synthetic_espn_pbp(game_id: str = "401584793", n_plays: int = 600, seed: int = 0) -> dict:
+    """ESPN summary payload with plays plus the unused subtrees it carries."""
+    rng = random.Random(seed)
+    plays = []
+    home = away = 0
+    for n in range(1, n_plays + 1):
+        period = min(4, (n - 1) // max(1, n_plays // 4) + 1)
+        remaining = 720 - (n * 7) % 720
+        text_type = rng.choice(["Jump Shot", "Layup Shot", "Defensive Rebound",
+                                "Personal Foul", "Shooting Foul", "Lost Ball Turnover",
+                                "Free Throw - 1 of 2", "Full Timeout", "Offensive Charge"])
+        if "Shot" in text_type and rng.random() < 0.5:
+            if rng.random() < 0.5:
+                home += 2
+            else:
+                away += 2
+        plays.append({
+            "id": f"{game_id}{n:04d}",
+            "sequenceNumber": str(n),
+            "type": {"id": str(n % 200), "text": text_type},
+            "text": f"Player {n % 13} {text_type.lower()}",
+            "awayScore": away,
+            "homeScore": home,
+            "period": {"number": period, "displayValue": f"{period}st Quarter"},
+            "clock": {"displayValue": f"{remaining // 60}:{remaining % 60:02d}"},
+            "scoringPlay": False,
+            "team": {"id": str(13 if n % 2 else 2)},
+            "participants": [{"athlete": {"id": str(3000 + n % 26)}}],
+            "wallclock": "2026-02-28T01:00:00Z",
+            "shootingPlay": "Shot" in text_type,
+        })
+    return {
+        "boxscore": {"players": [{"statistics": [{"athletes": [{"stats": ["10"] * 14}] * 13}]}] * 2},
+        "gameInfo": {"venue": {"fullName": "Crypto.com Arena"}, "attendance": 18997},
+        "plays": plays,
+        "news": {"articles": [{"headline": "x" * 120, "description": "y" * 400}] * 10},
+        "pickcenter": [{"provider": {"name": "Book"}, "spread": -3.5, "overUnder": 228.5}] * 3,
+        "header": {"id": game_id},
+    }
+
+
+def synthetic_nba_scoreboard(n_games: int = 15, seed: int = 0) -> dict:
+    """NBA CDN todaysScoreboard_00.json shaped payload."""
+    rng = random.Random(seed)
+    games = []
+    for i in range(n_games):
+        (h, hn), (a, an) = TEAMS[(2 * i) % 30], TEAMS[(2 * i + 1) % 30]
+        status = rng.choice([1, 2, 2, 2, 3])
+        period = 0 if status == 1 else rng.randint(1, 5)
+        games.append({
+            "gameId": f"00224{i:05d}",
+            "gameStatus": status,
+            "period": period,
+            "gameClock": f"PT{rng.randint(0, 11):02d}M{rng.randint(0, 59):02d}.00S" if status == 2 else "",
+            "gameTimeUTC": f"2026-03-01T{i % 5:02d}:30:00Z",
+            "arenaName": f"Arena {i}",
+            "homeTeam": {"teamName": hn, "teamTricode": h, "score": rng.randint(60, 130)},
+            "awayTeam": {"teamName": an, "teamTricode": a, "score": rng.randint(60, 130)},
+        })
+    return {"scoreboard": {"gameDate": "2026-02-28", "games": games}}
+
+
+def synthetic_espn_scoreboard(n_games: int = 15, seed: int = 0) -> dict:
+    """ESPN scoreboard shaped payload."""
+    rng = random.Random(seed)
+    events = []
+    for i in range(n_games):
+        (h, hn), (a, an) = TEAMS[(2 * i) % 30], TEAMS[(2 * i + 1) % 30]
+        state = rng.choice(["pre", "in", "in", "in", "post"])
+        period = 0 if state == "pre" else rng.randint(1, 5)
+        events.append({
+            "id": f"4015847{i:02d}",
+            "date": f"2026-03-01T{i % 5:02d}:30Z",
+            "competitions": [{
+                "competitors": [
+                    {"id": str(i * 2 + 1), "homeAway": "home", "score": str(rng.randint(60, 130)),
+                     "team": {"displayName": hn, "abbreviation": h}},
+                    {"id": str(i * 2 + 2), "homeAway": "away", "score": str(rng.randint(60, 130)),
+                     "team": {"displayName": an, "abbreviation": a}},
+                ],
+                "venue": {"fullName": f"Arena {i}"},
+            }],
+            "status": {"period": period, "displayClock": f"{rng.randint(0, 11)}:{rng.randint(0, 59):02d}",
+                       "type": {"state": state}},
+        })
+    return {"events": events}
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Backfill Experiment Runner.
+
+Pulls ESPN scoreboards for a date range plus the play-by-play of every
+final game into the columnar PBP archive, printing games/sec as it goes.
+Interrupt it at any point; rerunning the same command resumes from the
+checkpoint in the archive directory.
+
+Usage:
+    python experiments/backfill/run.py 20251021 20260412 --out archive/
+    python experiments/backfill/run.py 20260228 20260228 --out archive/ --cache .cache/http
+    python experiments/backfill/run.py 20251021 20260412 --out archive/ --io-workers 8 --processes 2
+"""
+
+import argparse
+import contextlib
+import sys
+import os
+
+# Ensure repo root is on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.runtime.backfill import DEFAULT_IO_WORKERS, Backfill
+from src.data.disk_cache import caching
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("start", help="First date, YYYYMMDD")
+    parser.add_argument("end", help="Last date, YYYYMMDD (inclusive)")
+    parser.add_argument("--out", metavar="DIR", required=True, help="PBP archive directory")
+    parser.add_argument("--cache", metavar="DIR", help="Serve and store responses in a disk cache")
+    parser.add_argument("--io-workers", type=int, default=DEFAULT_IO_WORKERS, help="Concurrent fetches")
+    parser.add_argument(
+        "--processes", type=int, default=None,
+        help="Normalization processes (default: one per CPU; 0 = in-thread)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with contextlib.ExitStack() as stack:
+        if args.cache:
+            stack.enter_context(caching(args.cache))
+        run(args.start, args.end, args.out, args.io_workers, args.processes)
+
+
+def _progress(stats):
+    print(
+        f"\r  games {stats.games:>5}  events {stats.events:>8}  "
+        f"{stats.games_per_sec:6.1f} games/s  failed {len(stats.failed)}",
+        end="", flush=True,
+    )
+
+
+def run(start, end, out, io_workers=DEFAULT_IO_WORKERS, processes=None):
+    """Backfill start..end into ``out`` and print a summary."""
+    print("=" * 60)
+    print("BACKFILL EXPERIMENT")
+    print(f"Dates: {start}..{end} -> {out}")
+    print("=" * 60)
+
+    job = Backfill(out, io_workers=io_workers, processes=processes, on_progress=_progress)
+    already = len(job.checkpoint.games)
+    if already:
+        print(f"Resuming: {already} games already archived")
+    try:
+        stats = job.run(start, end)
+    except KeyboardInterrupt:
+        print("\n[INTERRUPTED] checkpoint saved; rerun to resume")
+        sys.exit(130)
+    print()
+
+    for key, error in sorted(stats.failed.items()):
+        print(f"[WARN] {key}: {error}")
+    print()
+    print(
+        f"Dates: {stats.dates} | Games: {stats.games} | Skipped: {stats.skipped} | "
+        f"Events: {stats.events} | {stats.elapsed:.1f}s | "
+        f"{stats.games_per_sec:.1f} games/s, {stats.events_per_sec:,.0f} events/s"
+    )
+    if stats.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,23 +7,95 @@ prints a small table: game_id, away@home, scores, quarter, clock.
 Usage:
     python experiments/espn_feed/run.py
     python experiments/espn_feed/run.py 20260228   # specific date
+    python experiments/espn_feed/run.py 20260228 --record night.jsonl.gz
+    python experiments/espn_feed/run.py 20260228 --replay night.jsonl.gz
+    python experiments/espn_feed/run.py 20260228 --cache .cache/http   # re-runs served from disk
+    python experiments/espn_feed/run.py 20260228 --replay night.jsonl.gz --profile 200   # hot spots -> espn_feed.folded
+
+With --replay and no date, the date is taken from the recorded scoreboard
+request (the recording only answers for the dates it captured).
 """
 
+import argparse
+import contextlib
 import sys
 import os
 
 # Ensure repo root is on path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
-from src.data.espn_scoreboard import fetch_scoreboard
+from src.data.espn_scoreboard import ESPN_SCOREBOARD_URL, fetch_scoreboard
 from src.adapters.scoreboard_adapter import normalize_espn_scoreboard
-from src.ui.panels.live_scoreboard import print_scoreboard
-from src.ui.panels.game_eval import print_eval
-
-
-def main():
-    date = sys.argv[1] if len(sys.argv) > 1 else None
-
+from src.ui.panels.live_scoreboard import print_scoreboard, render_scoreboard
+from src.ui.panels.game_eval import print_eval, render_eval
+from src.data.disk_cache import caching
+from src.data.recorder import read_recording, recording, replaying
+from src.runtime.profiler import profile_calls
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "date", nargs="?", default=None, help="Date in YYYYMMDD format (default: today)",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Append raw responses to a recording")
+    parser.add_argument("--replay", metavar="PATH", help="Serve responses from a recording")
+    parser.add_argument("--cache", metavar="DIR", help="Serve and store responses in a disk cache")
+    parser.add_argument(
+        "--speed", type=float, default=0,
+        help="Replay speed multiplier (default 0 = max speed)",
+    )
+    parser.add_argument(
+        "--profile", type=int, metavar="N",
+        help="Run N quiet poll iterations under the sampling profiler instead of printing",
+    )
+    parser.add_argument(
+        "--profile-out", metavar="PATH", default="espn_feed.folded",
+        help="Folded stacks for flamegraph.pl / speedscope (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=1.0, metavar="MS",
+        help="Milliseconds between samples (default 1)",
+    )
+    args = parser.parse_args(argv)
+    if args.replay and args.date is None:
+        dates = recorded_dates(args.replay)
+        if len(dates) != 1:
+            found = ", ".join(dates) if dates else "none"
+            parser.error(
+                f"--replay needs a date: pass one of the recorded dates (found: {found})"
+            )
+        args.date = dates[0]
+    return args
+
+
+def recorded_dates(path):
+    """Sorted ``dates`` params of the scoreboard requests in a recording."""
+    return sorted({
+        record["params"]["dates"]
+        for record in read_recording(path)
+        if record["url"] == ESPN_SCOREBOARD_URL and "dates" in record.get("params", {})
+    })
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    date = args.date
+    with contextlib.ExitStack() as stack:
+        if args.replay:
+            stack.enter_context(replaying(args.replay, speed=args.speed))
+        if args.cache:
+            stack.enter_context(caching(args.cache))
+        if args.record:
+            stack.enter_context(recording(args.record))
+        if args.profile:
+            profile(date, args.profile, args.profile_out, args.profile_interval)
+        else:
+            run(date)
+
+
+def run(date):
+    """Fetch, normalize and print one scoreboard."""
     print("=" * 60)
     print("ESPN FEED EXPERIMENT")
     print(f"Date: {date or 'today'}")
@@ -51,5 +123,32 @@ def main():
     print(f"Source: espn | Games: {len(states)}")
 
 
+def poll_once(date):
+    """One quiet poll: fetch, normalize and render both panels (no printing)."""
+    states = normalize_espn_scoreboard(fetch_scoreboard(date))
+    render_scoreboard(states)
+    render_eval(states)
+    return states
+
+
+def profile(date, iterations, out, interval_ms=1.0):
+    """Profile ``iterations`` polls; write folded stacks and print hot spots."""
+    print("=" * 60)
+    print("ESPN FEED PROFILE")
+    print(f"Date: {date or 'today'} | Iterations: {iterations}")
+    print("=" * 60)
+
+    try:
+        prof = profile_calls(lambda: poll_once(date), iterations, interval_ms / 1000)
+    except Exception as e:
+        print(f"[ERROR] Poll failed while profiling: {e}")
+        sys.exit(1)
+
+    prof.write_collapsed(out)
+    print(prof.report())
+    print()
+    print(f"Folded stacks: {out} (flamegraph.pl {out} > flame.svg, or open in speedscope)")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Merged Feed Experiment Runner.
+
+Fetches the ESPN and NBA scoreboards concurrently, merges them into one
+GameState per game (freshest source wins, score disagreements flagged)
+and prints a small table: game_id, away@home, scores, quarter, clock.
+
+Usage:
+    python experiments/merged_feed/run.py
+    python experiments/merged_feed/run.py 20260228   # specific date (NBA via nba_api)
+    python experiments/merged_feed/run.py --prefer espn
+    python experiments/merged_feed/run.py --record night.jsonl.gz
+    python experiments/merged_feed/run.py --replay night.jsonl.gz
+    python experiments/merged_feed/run.py --cache .cache/http
+    python experiments/merged_feed/run.py --metrics     # per-stage timings, bytes, errors
+"""
+
+import argparse
+import contextlib
+import sys
+import os
+
+# Ensure repo root is on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.runtime.merged_scoreboard import fetch_merged_scoreboard
+from src.ui.panels.live_scoreboard import print_scoreboard
+from src.ui.panels.game_eval import print_eval
+from src import metrics
+from src.data import nba_history
+from src.data.disk_cache import caching
+from src.data.recorder import recording, replaying
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "date", nargs="?", default=None, help="Date in YYYYMMDD format (default: today)",
+    )
+    parser.add_argument(
+        "--prefer", choices=("nba", "espn"), default="nba",
+        help="Source that wins when both feeds are equally fresh",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Append raw responses to a recording")
+    parser.add_argument("--replay", metavar="PATH", help="Serve responses from a recording")
+    parser.add_argument("--cache", metavar="DIR", help="Serve and store responses in a disk cache")
+    parser.add_argument("--metrics", action="store_true", help="Print per-stage timings at the end")
+    parser.add_argument(
+        "--speed", type=float, default=0,
+        help="Replay speed multiplier (default 0 = max speed)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.metrics:
+        metrics.enable()
+    with contextlib.ExitStack() as stack:
+        if args.replay:
+            stack.enter_context(replaying(args.replay, speed=args.speed))
+        if args.cache:
+            stack.enter_context(caching(args.cache))
+            nba_history.set_cache_dir(os.path.join(args.cache, "nba_history"))
+        if args.record:
+            stack.enter_context(recording(args.record))
+        run(args.date, args.prefer)
+    if args.metrics:
+        print()
+        print("--- METRICS ---")
+        print(metrics.report())
+
+
+def run(date, prefer="nba"):
+    """Fetch both scoreboards, merge and print."""
+    print("=" * 60)
+    print("MERGED FEED EXPERIMENT")
+    print(f"Date: {date or 'today'}")
+    print("=" * 60)
+
+    result = fetch_merged_scoreboard(date, prefer=prefer)
+    for source, error in result.errors.items():
+        print(f"[WARN] {source} scoreboard failed: {error}")
+    if not result.states and result.errors:
+        print("[ERROR] No source available")
+        sys.exit(1)
+
+    states = result.states
+
+    print(f"\nGames found: {len(states)}")
+    print()
+
+    print("--- SCOREBOARD ---")
+    print_scoreboard(states)
+
+    print()
+    print("--- GAME EVAL ---")
+    print_eval(states)
+
+    disagreements = [s for s in states if "score_disagreement" in s.extra]
+    if disagreements:
+        print()
+        print("--- SCORE DISAGREEMENTS ---")
+        for s in disagreements:
+            d = s.extra["score_disagreement"]
+            print(f"{s.game_id:<14} espn {d['espn'][1]}-{d['espn'][0]}  nba {d['nba'][1]}-{d['nba'][0]}")
+
+    print()
+    chosen = {src: sum(1 for s in states if s.source == src) for src in ("espn", "nba")}
+    timings = " ".join(f"{src}={sec * 1000:.0f}ms" for src, sec in result.elapsed.items())
+    print(f"Sources: espn={chosen['espn']} nba={chosen['nba']} | Games: {len(states)} | Fetch: {timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,8 +6,15 @@ prints a small table: game_id, away@home, scores, quarter, clock.
 
 Usage:
     python experiments/nba_feed/run.py
+    python experiments/nba_feed/run.py 2026-02-28   # historical, via nba_api
+    python experiments/nba_feed/run.py --record night.jsonl.gz
+    python experiments/nba_feed/run.py --replay night.jsonl.gz
+    python experiments/nba_feed/run.py --cache .cache/http
+    python experiments/nba_feed/run.py --replay night.jsonl.gz --profile 200   # hot spots -> nba_feed.folded
 """
 
+import argparse
+import contextlib
 import sys
 import os
 
@@ -16,13 +23,61 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from src.data.nba_scoreboard import fetch_scoreboard
 from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
-from src.ui.panels.live_scoreboard import print_scoreboard
-from src.ui.panels.game_eval import print_eval
-
-
-def main():
-    date = sys.argv[1] if len(sys.argv) > 1 else None
-
+from src.ui.panels.live_scoreboard import print_scoreboard, render_scoreboard
+from src.ui.panels.game_eval import print_eval, render_eval
+from src.data import nba_history
+from src.data.disk_cache import caching
+from src.data.recorder import recording, replaying
+from src.runtime.profiler import profile_calls
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "date", nargs="?", default=None,
+        help="Date in YYYY-MM-DD format (default: today via CDN; past dates via nba_api)",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Append raw responses to a recording")
+    parser.add_argument("--replay", metavar="PATH", help="Serve responses from a recording")
+    parser.add_argument("--cache", metavar="DIR", help="Serve and store responses in a disk cache")
+    parser.add_argument(
+        "--speed", type=float, default=0,
+        help="Replay speed multiplier (default 0 = max speed)",
+    )
+    parser.add_argument(
+        "--profile", type=int, metavar="N",
+        help="Run N quiet poll iterations under the sampling profiler instead of printing",
+    )
+    parser.add_argument(
+        "--profile-out", metavar="PATH", default="nba_feed.folded",
+        help="Folded stacks for flamegraph.pl / speedscope (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--profile-interval", type=float, default=1.0, metavar="MS",
+        help="Milliseconds between samples (default 1)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    date = args.date
+    with contextlib.ExitStack() as stack:
+        if args.replay:
+            stack.enter_context(replaying(args.replay, speed=args.speed))
+        if args.cache:
+            stack.enter_context(caching(args.cache))
+            nba_history.set_cache_dir(os.path.join(args.cache, "nba_history"))
+        if args.record:
+            stack.enter_context(recording(args.record))
+        if args.profile:
+            profile(date, args.profile, args.profile_out, args.profile_interval)
+        else:
+            run(date)
+
+
+def run(date):
+    """Fetch, normalize and print one scoreboard."""
     print("=" * 60)
     print("NBA OFFICIAL FEED EXPERIMENT")
     print(f"Date: {date or 'today (CDN)'}")
@@ -50,5 +105,32 @@ def main():
     print(f"Source: nba | Games: {len(states)}")
 
 
+def poll_once(date):
+    """One quiet poll: fetch, normalize and render both panels (no printing)."""
+    states = normalize_nba_scoreboard(fetch_scoreboard(date))
+    render_scoreboard(states)
+    render_eval(states)
+    return states
+
+
+def profile(date, iterations, out, interval_ms=1.0):
+    """Profile ``iterations`` polls; write folded stacks and print hot spots."""
+    print("=" * 60)
+    print("NBA FEED PROFILE")
+    print(f"Date: {date or 'today'} | Iterations: {iterations}")
+    print("=" * 60)
+
+    try:
+        prof = profile_calls(lambda: poll_once(date), iterations, interval_ms / 1000)
+    except Exception as e:
+        print(f"[ERROR] Poll failed while profiling: {e}")
+        sys.exit(1)
+
+    prof.write_collapsed(out)
+    print(prof.report())
+    print()
+    print(f"Folded stacks: {out} (flamegraph.pl {out} > flame.svg, or open in speedscope)")
+
+
 if __name__ == "__main__":
     main()
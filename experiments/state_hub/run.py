@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""State Hub Experiment Runner.
+
+Runs the local pub/sub service: polls the merged scoreboard and live PBP
+once, and streams GameState / PBPEvent diffs to any number of consumers
+over Server-Sent Events. Upstream load stays the same however many
+clients connect.
+
+Usage:
+    python experiments/state_hub/run.py                       # http://127.0.0.1:8765/events
+    python experiments/state_hub/run.py --port 9000 --no-pbp
+    python experiments/state_hub/run.py --replay night.jsonl.gz --speed 10
+
+    curl -N http://127.0.0.1:8765/events                      # snapshot, then diffs
+    curl -N "http://127.0.0.1:8765/events?games=0022500801"
+    curl http://127.0.0.1:8765/snapshot
+    curl http://127.0.0.1:8765/metrics                        # with --metrics: per-stage timings
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import sys
+import os
+
+# Ensure repo root is on path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.runtime.hub import HubServer, StateHub
+from src.runtime.hub_poller import DEFAULT_SCOREBOARD_INTERVAL, HubPoller
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src import metrics
+from src.data.disk_cache import caching
+from src.data.recorder import recording, replaying
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_SCOREBOARD_INTERVAL,
+        help="Seconds between scoreboard polls",
+    )
+    parser.add_argument("--no-pbp", action="store_true", help="Scoreboards only, no play-by-play")
+    parser.add_argument(
+        "--metrics", action="store_true",
+        help="Time fetch/decode/normalize stages; serve them at /metrics and log the slowest",
+    )
+    parser.add_argument(
+        "--prefer", choices=("nba", "espn"), default="nba",
+        help="Source that wins when both feeds are equally fresh",
+    )
+    parser.add_argument("--record", metavar="PATH", help="Append raw responses to a recording")
+    parser.add_argument("--replay", metavar="PATH", help="Serve responses from a recording")
+    parser.add_argument("--cache", metavar="DIR", help="Serve and store responses in a disk cache")
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="Replay speed multiplier (default 1 = real time)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if args.metrics:
+        metrics.enable()
+    with contextlib.ExitStack() as stack:
+        if args.replay:
+            stack.enter_context(replaying(args.replay, speed=args.speed))
+        if args.cache:
+            stack.enter_context(caching(args.cache))
+        if args.record:
+            stack.enter_context(recording(args.record))
+        try:
+            asyncio.run(run(args.host, args.port, args.interval, not args.no_pbp, args.prefer))
+        except KeyboardInterrupt:
+            pass
+
+
+async def run(host, port, interval=DEFAULT_SCOREBOARD_INTERVAL, pbp=True, prefer="nba"):
+    """Serve the hub until interrupted."""
+    hub = StateHub()
+    server = HubServer(hub, host, port)
+    await server.start()
+    poller = HubPoller(hub, scoreboard=MergedScoreboard(prefer=prefer),
+                       scoreboard_interval=interval, pbp=pbp)
+
+    print("=" * 60)
+    print("STATE HUB")
+    print(f"SSE: http://{host}:{server.port}/events | snapshot: /snapshot | health: /health")
+    print("=" * 60)
+
+    async def report():
+        while True:
+            await asyncio.sleep(30)
+            logging.info("seq=%d subscribers=%d upstream_requests=%d",
+                         hub.seq, hub.subscribers, poller.upstream_requests)
+            stages = metrics.snapshot()["stages"]
+            if stages:
+                top = stages[0]
+                logging.info("slowest stage: %s %s %.0f%% of time, mean %.1fms, max %.1fms",
+                             top["stage"], top["labels"], top["share"] * 100, top["mean_ms"], top["max_ms"])
+
+    try:
+        await asyncio.gather(poller.run(), report())
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    main()
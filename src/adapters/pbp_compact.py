@@ -0,0 +1,303 @@
+"""Compact in-memory forms of PBPEvent for bulk / season-scale use.
+
+``CompactPBPEvent`` is a ``__slots__`` drop-in for PBPEvent (same attribute
+API) with interned low-cardinality strings and an ``extra`` dict that is
+only allocated on first access (until then extras are shared, interned
+item tuples, held in a bounded LRU table so a long-running poller doesn't
+grow it forever). ``PBPEventBatch`` stores many events as columns (typed
+arrays + dictionary-encoded strings) and materializes PBPEvents on demand.
+Layer: src/adapters
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Iterator
+
+from src.adapters.playbyplay_adapter import PBPEvent
+from src.state.clock import elapsed_seconds as _elapsed_seconds, parse_clock_tenths
+
+
+PBP_FIELDS = (
+    "event_id",
+    "source",
+    "game_id",
+    "period",
+    "clock",
+    "event_type",
+    "description",
+    "team_abbr",
+    "player_name",
+    "home_score",
+    "away_score",
+    "clock_tenths",
+    "elapsed_seconds",
+)
+
+_intern = sys.intern
+# Shared extra tuples, least recently used first. Evicting one only stops
+# sharing it: events already holding the tuple keep their reference.
+FROZEN_EXTRAS_MAX = 4096
+_frozen_extras: OrderedDict[tuple, tuple] = OrderedDict()
+_frozen_lock = threading.Lock()
+# Clock ints repeat across games (at most ~7200 distinct values each);
+# share one int object per value like interned strings.
+_shared_ints: dict[int, int] = {}
+
+
+def _share_int(value: int | None) -> int | None:
+    return value if value is None else _shared_ints.setdefault(value, value)
+
+
+def _freeze_extra(extra: dict | None) -> tuple | None:
+    """Interned, hashable copy of an extra dict (None if empty)."""
+    if not extra:
+        return None
+    try:
+        key = tuple(sorted(extra.items()))
+        hash(key)
+    except TypeError:  # unhashable / unorderable values: keep a private copy
+        return None
+    with _frozen_lock:
+        shared = _frozen_extras.get(key)
+        if shared is not None:
+            _frozen_extras.move_to_end(key)
+            return shared
+        _frozen_extras[key] = key
+        if len(_frozen_extras) > FROZEN_EXTRAS_MAX:
+            _frozen_extras.popitem(last=False)
+    return key
+
+
+class CompactPBPEvent:
+    """Slotted PBPEvent with interned categorical strings and lazy ``extra``.
+
+    Interned: source, game_id, event_type, team_abbr, player_name, clock —
+    values repeated across thousands of events share one string object.
+    """
+
+    __slots__ = PBP_FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        event_id: str = "",
+        source: str = "",
+        game_id: str = "",
+        period: int = 0,
+        clock: str = "",
+        event_type: str = "",
+        description: str = "",
+        team_abbr: str = "",
+        player_name: str = "",
+        home_score: int = 0,
+        away_score: int = 0,
+        extra: dict | None = None,
+        clock_tenths: int | None = None,
+        elapsed_seconds: int | None = None,
+    ):
+        self.event_id = event_id
+        self.source = _intern(source)
+        self.game_id = _intern(game_id)
+        self.period = period
+        self.clock = _intern(clock)
+        self.event_type = _intern(event_type)
+        self.description = description
+        self.team_abbr = _intern(team_abbr)
+        self.player_name = _intern(player_name)
+        self.home_score = home_score
+        self.away_score = away_score
+        if clock_tenths is None:
+            clock_tenths = parse_clock_tenths(clock)
+        if elapsed_seconds is None:
+            elapsed_seconds = _elapsed_seconds(period, clock_tenths)
+        self.clock_tenths = _share_int(clock_tenths)
+        self.elapsed_seconds = _share_int(elapsed_seconds)
+        frozen = _freeze_extra(extra)
+        self._extra = frozen if frozen is not None or not extra else dict(extra)
+
+    @property
+    def extra(self) -> dict:
+        # Materialize a private dict on first access (copy-on-access).
+        if not isinstance(self._extra, dict):
+            self._extra = dict(self._extra or ())
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: dict) -> None:
+        self._extra = value or None
+
+    @classmethod
+    def from_event(cls, ev: PBPEvent) -> CompactPBPEvent:
+        return cls(**{f: getattr(ev, f) for f in PBP_FIELDS}, extra=ev.extra)
+
+    def to_event(self) -> PBPEvent:
+        return PBPEvent(**{f: getattr(self, f) for f in PBP_FIELDS}, extra=dict(self._extra or ()))
+
+    def _key(self) -> tuple:
+        return tuple(getattr(self, f) for f in PBP_FIELDS) + (dict(self._extra or ()),)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactPBPEvent):
+            return self._key() == other._key()
+        if isinstance(other, PBPEvent):
+            return self._key() == CompactPBPEvent.from_event(other)._key()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in PBP_FIELDS)
+        return f"CompactPBPEvent({fields})"
+
+
+def to_compact(events: Iterable[PBPEvent]) -> list[CompactPBPEvent]:
+    """Convert normalized events to their slotted form."""
+    return [CompactPBPEvent.from_event(ev) for ev in events]
+
+
+class _Dictionary:
+    """String dictionary encoding: value <-> small integer code."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(_intern(value))
+        return code
+
+
+# Columns stored as dictionary codes vs. plain per-row strings vs. ints.
+_DICT_COLUMNS = ("source", "game_id", "clock", "event_type", "team_abbr", "player_name")
+_STR_COLUMNS = ("description",)
+_INT_COLUMNS = ("period", "home_score", "away_score")
+# Nullable ints; None is stored as _NULL_INT.
+_OPT_INT_COLUMNS = ("clock_tenths", "elapsed_seconds")
+_NULL_INT = -(2**31)
+
+
+class _IdColumn:
+    """event_id column: int64 array while ids are plain decimals, else strings."""
+
+    __slots__ = ("ints", "strs")
+
+    def __init__(self):
+        self.ints: array | None = array("q")
+        self.strs: list[str] | None = None
+
+    def append(self, event_id: str) -> None:
+        if self.ints is not None:
+            if event_id.isdigit() and str(int(event_id)) == event_id and len(event_id) < 19:
+                self.ints.append(int(event_id))
+                return
+            self.strs = [str(i) for i in self.ints]
+            self.ints = None
+        self.strs.append(event_id)
+
+    def __getitem__(self, i: int) -> str:
+        if self.ints is not None:
+            return str(self.ints[i])
+        return self.strs[i]
+
+    def values(self) -> list[str]:
+        if self.ints is not None:
+            return [str(i) for i in self.ints]
+        return list(self.strs)
+
+
+class PBPEventBatch:
+    """Columnar container for many PBPEvents.
+
+    Integers live in ``array`` columns, categorical strings as ``array``
+    codes into a per-column dictionary, numeric event ids as int64, and
+    ``extra`` dicts dictionary-encoded as item tuples (code 0 = empty).
+    Indexing or iterating materializes PBPEvent objects, so existing
+    consumers keep working.
+    """
+
+    def __init__(self, events: Iterable[PBPEvent] = ()):
+        self._dicts = {name: _Dictionary() for name in _DICT_COLUMNS}
+        self._codes = {name: array("I") for name in _DICT_COLUMNS}
+        self._strs: dict[str, list[str]] = {name: [] for name in _STR_COLUMNS}
+        self._ints = {name: array("i") for name in _INT_COLUMNS + _OPT_INT_COLUMNS}
+        self._ids = _IdColumn()
+        self._extras: list[tuple] = [()]
+        self._extra_codes: dict[tuple, int] = {(): 0}
+        self._extra = array("I")
+        self.extend(events)
+
+    @classmethod
+    def from_events(cls, events: Iterable[PBPEvent]) -> PBPEventBatch:
+        return cls(events)
+
+    def __len__(self) -> int:
+        return len(self._ints["period"])
+
+    def append(self, ev: PBPEvent) -> None:
+        for name in _DICT_COLUMNS:
+            self._codes[name].append(self._dicts[name].encode(getattr(ev, name)))
+        for name in _STR_COLUMNS:
+            self._strs[name].append(getattr(ev, name))
+        for name in _INT_COLUMNS:
+            self._ints[name].append(getattr(ev, name))
+        for name in _OPT_INT_COLUMNS:
+            value = getattr(ev, name)
+            self._ints[name].append(_NULL_INT if value is None else value)
+        self._ids.append(ev.event_id)
+        extra = ev._extra if isinstance(ev, CompactPBPEvent) else ev.extra
+        key = tuple(sorted(dict(extra).items())) if extra else ()
+        code = self._extra_codes.get(key)
+        if code is None:
+            code = self._extra_codes[key] = len(self._extras)
+            self._extras.append(key)
+        self._extra.append(code)
+
+    def extend(self, events: Iterable[PBPEvent]) -> None:
+        for ev in events:
+            self.append(ev)
+
+    def column(self, name: str) -> list:
+        """Decoded values of one column, in row order."""
+        if name in self._dicts:
+            values = self._dicts[name].values
+            return [values[c] for c in self._codes[name]]
+        if name == "event_id":
+            return self._ids.values()
+        if name in self._strs:
+            return list(self._strs[name])
+        if name in _OPT_INT_COLUMNS:
+            return [None if v == _NULL_INT else v for v in self._ints[name]]
+        if name in self._ints:
+            return self._ints[name].tolist()
+        raise KeyError(name)
+
+    def dictionary(self, name: str) -> list[str]:
+        """Distinct values of a dictionary-encoded column (code order)."""
+        return list(self._dicts[name].values)
+
+    def __getitem__(self, i: int) -> PBPEvent:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        kwargs = {name: self._dicts[name].values[self._codes[name][i]] for name in _DICT_COLUMNS}
+        kwargs.update({name: self._strs[name][i] for name in _STR_COLUMNS})
+        kwargs.update({name: self._ints[name][i] for name in _INT_COLUMNS})
+        for name in _OPT_INT_COLUMNS:
+            value = self._ints[name][i]
+            kwargs[name] = None if value == _NULL_INT else value
+        return PBPEvent(event_id=self._ids[i], **kwargs, extra=dict(self._extras[self._extra[i]]))
+
+    def __iter__(self) -> Iterator[PBPEvent]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_events(self) -> list[PBPEvent]:
+        return list(self)
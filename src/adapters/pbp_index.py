@@ -0,0 +1,261 @@
+"""Indexed play-by-play: lookups by period, team, player and event type.
+
+``PBPIndex`` keeps one game's PBPEvents in feed order (a position per
+event) plus a posting list of positions per period, ``team_abbr``,
+``player_name`` and ``event_type`` value, and the game time of every
+position. Appending an event is O(1): positions only grow, so each
+posting list stays sorted by appending to it. Edits and removals (PBPCursor
+deltas) patch the affected posting lists in place.
+
+``query()`` starts from the shortest matching posting list, narrows it to
+the game-time window by bisection (events arrive in game-time order), and
+checks the remaining filters on just those events. For example, all BOS
+fouls in Q4 after the 2:00 mark is
+``query(team="BOS", event_type="foul", period=4, clock_max="2:00")``. Cost is
+O(log n + k) for k candidates, not a scan of the game. If the feed ever
+delivers events out of game-time order, time windows fall back to a
+filter over the candidates and results stay exact.
+Layer: src/adapters
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator, Sequence
+
+from src.adapters.playbyplay_adapter import PBPDelta, PBPEvent
+from src.state.clock import elapsed_tenths, parse_clock_tenths, period_length_tenths
+
+
+# Indexed attributes; query() takes them as period / team / player / event_type.
+INDEXED_FIELDS = ("period", "team_abbr", "player_name", "event_type")
+_QUERY_FIELDS = {"period": "period", "team": "team_abbr", "player": "player_name", "event_type": "event_type"}
+
+
+def _game_time(event: PBPEvent) -> int | None:
+    return elapsed_tenths(event.period, event.clock_tenths)
+
+
+class PBPIndex:
+    """One game's PBPEvents with incremental lookup indexes.
+
+    Args:
+        events: Initial events, in feed order.
+    """
+
+    def __init__(self, events: Iterable[PBPEvent] = ()):
+        self._events: list[PBPEvent | None] = []  # by position; None = removed
+        self._times: list[int | None] = []  # game time (tenths played) by position
+        self._positions: dict[str, int] = {}  # event_id -> position
+        self._postings: dict[str, dict[object, list[int]]] = {f: {} for f in INDEXED_FIELDS}
+        self._ordered = True  # _times is non-decreasing (no unknown clocks)
+        self.extend(events)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._positions
+
+    def __iter__(self) -> Iterator[PBPEvent]:
+        """Current events in feed order."""
+        return (e for e in self._events if e is not None)
+
+    def get(self, event_id: str) -> PBPEvent | None:
+        pos = self._positions.get(event_id)
+        return None if pos is None else self._events[pos]
+
+    def values(self, field: str) -> list:
+        """Distinct values of an indexed field that have events, e.g. every team_abbr."""
+        return [v for v, posting in self._postings[field].items() if posting]
+
+    # --- Updates ---
+
+    def add(self, event: PBPEvent) -> None:
+        """Append one event (O(1)); an already-indexed event_id is replaced."""
+        if event.event_id in self._positions:
+            self.replace(event)
+            return
+        pos = len(self._events)
+        time = _game_time(event)
+        if time is None or (self._times and self._times[-1] is not None and time < self._times[-1]):
+            self._ordered = False
+        self._events.append(event)
+        self._times.append(time)
+        self._positions[event.event_id] = pos
+        for field in INDEXED_FIELDS:
+            posting = self._postings[field].get(getattr(event, field))
+            if posting is None:
+                self._postings[field][getattr(event, field)] = [pos]
+            else:
+                posting.append(pos)
+
+    def extend(self, events: Iterable[PBPEvent]) -> None:
+        for event in events:
+            self.add(event)
+
+    def replace(self, event: PBPEvent) -> None:
+        """Swap in an edited event, keeping its feed position."""
+        pos = self._positions.get(event.event_id)
+        if pos is None:
+            self.add(event)
+            return
+        old = self._events[pos]
+        for field in INDEXED_FIELDS:
+            before, after = getattr(old, field), getattr(event, field)
+            if before != after:
+                self._unpost(field, before, pos)
+                insort(self._postings[field].setdefault(after, []), pos)
+        time = _game_time(event)
+        self._events[pos] = event
+        self._times[pos] = time
+        if self._ordered and not self._fits(pos, time):
+            self._ordered = False
+
+    def remove(self, event_id: str) -> None:
+        """Drop an event (its position stays reserved so others don't move)."""
+        pos = self._positions.pop(event_id, None)
+        if pos is None:
+            return
+        old = self._events[pos]
+        for field in INDEXED_FIELDS:
+            self._unpost(field, getattr(old, field), pos)
+        self._events[pos] = None  # its time stays: _times remains sorted for bisection
+
+    def apply(self, delta: PBPDelta) -> None:
+        """Apply a PBPCursor delta (added, edited and removed events)."""
+        for event_id in delta.removed:
+            self.remove(event_id)
+        for event in delta.updated:
+            self.replace(event)
+        for event in delta.added:
+            self.add(event)
+
+    def _unpost(self, field: str, value, pos: int) -> None:
+        posting = self._postings[field][value]
+        del posting[bisect_left(posting, pos)]
+        if not posting:
+            del self._postings[field][value]
+
+    def _fits(self, pos: int, time: int | None) -> bool:
+        """Whether ``time`` at ``pos`` keeps _times non-decreasing."""
+        if time is None:
+            return False
+        prev = self._times[pos - 1] if pos > 0 else None
+        nxt = self._times[pos + 1] if pos + 1 < len(self._times) else None
+        return (prev is None or prev <= time) and (nxt is None or time <= nxt)
+
+    # --- Queries ---
+
+    def query(
+        self,
+        *,
+        period: int | Iterable[int] | None = None,
+        team: str | Iterable[str] | None = None,
+        player: str | Iterable[str] | None = None,
+        event_type: str | Iterable[str] | None = None,
+        clock_max: str | None = None,
+        clock_min: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+    ) -> list[PBPEvent]:
+        """Events matching every given filter, in feed order.
+
+        Args:
+            period, team, player, event_type: A value or several values
+                (any of them matches) of the indexed fields.
+            clock_max: Only events at or below this clock, e.g. "2:00" for
+                "after the 2:00 mark". Needs a single ``period``.
+            clock_min: Only events at or above this clock; with ``clock_max``
+                "6:00" and ``clock_min`` "2:00" the window runs from 6:00
+                down to 2:00. Needs a single ``period``.
+            start, end: Game-time window in tenths of a second played
+                (``clock.elapsed_tenths``), both inclusive.
+
+        Raises:
+            ValueError: ``clock_max`` / ``clock_min`` without a single period,
+                or an unparseable clock.
+        """
+        if clock_max is not None or clock_min is not None:
+            if not isinstance(period, int):
+                raise ValueError("clock_max / clock_min need a single period")
+            start = _max(start, _clock_bound(period, clock_max))
+            end = _min(end, _clock_bound(period, clock_min))
+
+        if isinstance(period, int) and self._ordered:
+            # A period is a game-time span: bisect to it rather than walk its events.
+            start = _max(start, elapsed_tenths(period, period_length_tenths(period)))
+            end = _min(end, elapsed_tenths(period, 0))
+
+        filters = []
+        for name, wanted in (("period", period), ("team", team), ("player", player), ("event_type", event_type)):
+            if wanted is None:
+                continue
+            field = _QUERY_FIELDS[name]
+            values = [wanted] if isinstance(wanted, (str, int)) else list(wanted)
+            lists = [self._window(self._postings[field].get(v, []), start, end) for v in values]
+            size = sum(len(p) for p in lists)
+            if not size:
+                return []
+            filters.append((size, field, set(values), lists))
+
+        if filters:
+            filters.sort(key=lambda f: f[0])
+            lists = filters[0][3]
+            candidates = lists[0] if len(lists) == 1 else list(heapq.merge(*lists))
+            checks = [(field, values) for _, field, values, _ in filters[1:]]
+        else:
+            candidates, checks = self._window(range(len(self._events)), start, end), []
+
+        timed = not self._ordered and (start is not None or end is not None)
+        out = []
+        events, times = self._events, self._times
+        for pos in candidates:
+            event = events[pos]
+            if event is None:
+                continue
+            if timed:
+                time = times[pos]
+                if time is None or (start is not None and time < start) or (end is not None and time > end):
+                    continue
+            for field, values in checks:
+                if getattr(event, field) not in values:
+                    break
+            else:
+                out.append(event)
+        return out
+
+    def count(self, **filters) -> int:
+        """Number of events ``query(**filters)`` would return."""
+        return len(self.query(**filters))
+
+    def _window(self, positions: Sequence[int], start: int | None, end: int | None) -> Sequence[int]:
+        """Sorted positions narrowed to a game-time window by bisection.
+
+        Out-of-order indexes return ``positions`` unchanged; query() then
+        checks each event's time instead.
+        """
+        if (start is None and end is None) or not self._ordered:
+            return positions
+        key = self._times.__getitem__
+        lo = 0 if start is None else bisect_left(positions, start, key=key)
+        hi = len(positions) if end is None else bisect_right(positions, end, key=key)
+        return positions[lo:hi]
+
+
+def _clock_bound(period: int, clock: str | None) -> int | None:
+    if clock is None:
+        return None
+    tenths = parse_clock_tenths(clock)
+    if tenths is None:
+        raise ValueError(f"unparseable clock {clock!r}")
+    return elapsed_tenths(period, tenths)
+
+
+def _max(a: int | None, b: int | None) -> int | None:
+    return b if a is None else a if b is None else max(a, b)
+
+
+def _min(a: int | None, b: int | None) -> int | None:
+    return b if a is None else a if b is None else min(a, b)
@@ -6,6 +6,11 @@ Layer: src/adapters
 
 from __future__ import annotations
 from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+from src import metrics
+from src.data.conditional import is_not_modified
+from src.state.clock import elapsed_seconds, parse_clock_tenths
 
 
 @dataclass
@@ -24,8 +29,18 @@ class PBPEvent:
     home_score: int = 0
     away_score: int = 0
     extra: dict = field(default_factory=dict)
+    # Pre-parsed ``clock``, derived on construction when not given.
+    clock_tenths: Optional[int] = None  # tenths of a second left in period
+    elapsed_seconds: Optional[int] = None  # game time played at this event
+
+    def __post_init__(self):
+        if self.clock_tenths is None:
+            self.clock_tenths = parse_clock_tenths(self.clock)
+        if self.elapsed_seconds is None:
+            self.elapsed_seconds = elapsed_seconds(self.period, self.clock_tenths)
 
 
+@metrics.timed("normalize", counter="events_normalized", source="espn")
 def normalize_espn_pbp(raw: dict, game_id: str = "") -> list[PBPEvent]:
     """Convert raw ESPN PBP/summary JSON to list of canonical PBPEvent.
 
@@ -36,30 +51,10 @@ def normalize_espn_pbp(raw: dict, game_id: str = "") -> list[PBPEvent]:
     Returns:
         List of PBPEvent objects.
     """
-    events = []
-    plays = raw.get("plays", [])
-
-    for play in plays:
-        ev = PBPEvent(
-            event_id=str(play.get("id", "")),
-            source="espn",
-            game_id=game_id,
-            period=play.get("period", {}).get("number", 0),
-            clock=play.get("clock", {}).get("displayValue", ""),
-            event_type=play.get("type", {}).get("text", ""),
-            description=play.get("text", ""),
-            home_score=play.get("homeScore", 0),
-            away_score=play.get("awayScore", 0),
-        )
-        # Try to extract team
-        if "team" in play:
-            ev.team_abbr = play["team"].get("abbreviation", "")
-
-        events.append(ev)
-
-    return events
+    return [_espn_play_to_event(play, game_id) for play in raw.get("plays", [])]
 
 
+@metrics.timed("normalize", counter="events_normalized", source="nba")
 def normalize_nba_pbp(raw: dict, game_id: str = "") -> list[PBPEvent]:
     """Convert raw NBA official PBP JSON to list of canonical PBPEvent.
 
@@ -70,24 +65,275 @@ def normalize_nba_pbp(raw: dict, game_id: str = "") -> list[PBPEvent]:
     Returns:
         List of PBPEvent objects.
     """
-    events = []
     game_data = raw.get("game", {})
-    actions = game_data.get("actions", [])
+    game_id = game_id or str(game_data.get("gameId", ""))
+    return [_nba_action_to_event(action, game_id) for action in game_data.get("actions", [])]
+
+
+def iter_espn_pbp(plays: Iterable[dict], game_id: str = "") -> Iterator[PBPEvent]:
+    """Yield PBPEvents one at a time from raw ESPN plays.
+
+    Args:
+        plays: Raw play dicts, e.g. an ``espn_playbyplay.stream_playbyplay()``
+            stream or ``raw["plays"]``.
+        game_id: Game ID to tag events with.
+    """
+    for play in plays:
+        yield _espn_play_to_event(play, game_id)
 
+
+def iter_nba_pbp(actions: Iterable[dict], game_id: str = "") -> Iterator[PBPEvent]:
+    """Yield PBPEvents one at a time from raw NBA actions.
+
+    Args:
+        actions: Raw action dicts, e.g. an ``nba_playbyplay.stream_playbyplay()``
+            stream or ``raw["game"]["actions"]``.
+        game_id: Game ID to tag events with; defaults to the stream's
+            ``game.gameId``.
+    """
+    meta = getattr(actions, "meta", {})
     for action in actions:
-        ev = PBPEvent(
-            event_id=str(action.get("actionNumber", "")),
-            source="nba",
-            game_id=game_id or str(game_data.get("gameId", "")),
-            period=action.get("period", 0),
-            clock=action.get("clock", ""),
-            event_type=action.get("actionType", ""),
-            description=action.get("description", ""),
-            team_abbr=action.get("teamTricode", ""),
-            player_name=action.get("playerNameI", ""),
-            home_score=action.get("scoreHome", 0),
-            away_score=action.get("scoreAway", 0),
-        )
-        events.append(ev)
-
-    return events
+        yield _nba_action_to_event(action, game_id or str(meta.get("game.gameId", "")))
+
+
+def _espn_play_to_event(play: dict, game_id: str) -> PBPEvent:
+    """Normalize one ESPN play."""
+    ev = PBPEvent(
+        event_id=str(play.get("id", "")),
+        source="espn",
+        game_id=game_id,
+        period=play.get("period", {}).get("number", 0),
+        clock=play.get("clock", {}).get("displayValue", ""),
+        event_type=play.get("type", {}).get("text", ""),
+        description=play.get("text", ""),
+        home_score=play.get("homeScore", 0),
+        away_score=play.get("awayScore", 0),
+    )
+    # Try to extract team
+    if "team" in play:
+        ev.team_abbr = play["team"].get("abbreviation", "")
+        if not ev.team_abbr and "id" in play["team"]:
+            ev.extra["team_id"] = str(play["team"]["id"])
+    return ev
+
+
+def _nba_action_to_event(action: dict, game_id: str) -> PBPEvent:
+    """Normalize one NBA official action."""
+    ev = PBPEvent(
+        event_id=str(action.get("actionNumber", "")),
+        source="nba",
+        game_id=game_id,
+        period=action.get("period", 0),
+        clock=action.get("clock", ""),
+        event_type=action.get("actionType", ""),
+        description=action.get("description", ""),
+        team_abbr=action.get("teamTricode", ""),
+        player_name=action.get("playerNameI", ""),
+        # The live feed sends running scores as strings ("scoreHome": "12").
+        home_score=int(action.get("scoreHome") or 0),
+        away_score=int(action.get("scoreAway") or 0),
+    )
+    # subType distinguishes e.g. personal vs offensive fouls, period start/end
+    if action.get("subType"):
+        ev.extra["sub_type"] = action["subType"]
+    return ev
+
+
+def _espn_fingerprint(play: dict) -> tuple:
+    """Content fields whose change means an ESPN play was edited."""
+    return (
+        play.get("text"),
+        play.get("homeScore"),
+        play.get("awayScore"),
+        play.get("clock", {}).get("displayValue"),
+        play.get("period", {}).get("number"),
+        play.get("type", {}).get("text"),
+    )
+
+
+def _nba_fingerprint(action: dict) -> tuple:
+    """Content fields whose change means an NBA action was edited.
+
+    The live feed stamps ``edited`` on every action and bumps it on each
+    correction, so that single field is enough when present.
+    """
+    edited = action.get("edited")
+    if edited:
+        return (edited,)
+    return (
+        action.get("description"),
+        action.get("scoreHome"),
+        action.get("scoreAway"),
+        action.get("clock"),
+        action.get("period"),
+        action.get("actionType"),
+        action.get("teamTricode"),
+        action.get("playerNameI"),
+    )
+
+
+@dataclass
+class PBPDelta:
+    """Changes between two polls of one game's play-by-play."""
+
+    added: list[PBPEvent] = field(default_factory=list)
+    updated: list[PBPEvent] = field(default_factory=list)  # new versions of edited events
+    removed: list[str] = field(default_factory=list)  # event_ids dropped by the feed
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+# Recent actions a cursor id-checks and fingerprints per poll (a few
+# minutes of play): feed corrections land there.
+DEFAULT_EDIT_TAIL = 100
+
+
+class PBPCursor:
+    """Stateful per-game PBP normalizer that only processes new actions.
+
+    Feed each poll's raw payload to ``update()``; it returns a PBPDelta and
+    keeps the full normalized list in ``events``. In the common case (feed
+    grew at the tail, earlier actions untouched) only the new actions are
+    normalized, and the per-poll overhead is bounded by ``edit_tail``, not
+    by the game's length: the feed is taken to still start with the known
+    actions when it is at least as long, its first id matches, and the ids
+    of the last ``edit_tail`` seen actions match. When that check fails
+    (ids removed, inserted or reordered in the checked window) the cursor
+    falls back to a full reconcile, still re-normalizing only the actions
+    that changed. An older delete shifts every later id, so the tail check
+    catches it too; only a delete paired with an insert entirely before the
+    window goes unnoticed.
+
+    Edited actions are found by comparing a small per-action fingerprint
+    over the same tail window, where the feed's corrections land.
+
+    Args:
+        source: "nba" or "espn".
+        game_id: Game ID to tag events with (NBA falls back to raw gameId).
+        check_edits: Compare fingerprints of already-seen actions each poll.
+            Turn off when edits don't matter.
+        edit_tail: How many of the most recent seen actions to id-check and
+            fingerprint each poll (None = all of them, O(n) per poll).
+    """
+
+    def __init__(self, source: str, game_id: str = "", check_edits: bool = True,
+                 edit_tail: int | None = DEFAULT_EDIT_TAIL):
+        if source == "nba":
+            self._to_event = _nba_action_to_event
+            self._fingerprint = _nba_fingerprint
+            self._id_key = "actionNumber"
+        elif source == "espn":
+            self._to_event = _espn_play_to_event
+            self._fingerprint = _espn_fingerprint
+            self._id_key = "id"
+        else:
+            raise ValueError(f"Unknown PBP source: {source!r}")
+        self.source = source
+        self.game_id = game_id
+        self.check_edits = check_edits
+        self.edit_tail = edit_tail
+        self._order: list[str] = []  # event_ids in feed order
+        self._events: dict[str, PBPEvent] = {}
+        self._prints: dict[str, tuple] = {}
+
+    @property
+    def events(self) -> list[PBPEvent]:
+        """All current events in feed order."""
+        return [self._events[eid] for eid in self._order]
+
+    @property
+    def last_event_id(self) -> str:
+        return self._order[-1] if self._order else ""
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def update(self, raw) -> PBPDelta:
+        """Apply one poll's raw payload (or NOT_MODIFIED) and return the delta."""
+        if raw is None or is_not_modified(raw):
+            return PBPDelta()
+        if not metrics.enabled():
+            return self._update(raw)
+        with metrics.timer("normalize", source=self.source):
+            delta = self._update(raw)
+        metrics.count("events_normalized", len(delta.added) + len(delta.updated), source=self.source)
+        return delta
+
+    def _update(self, raw: dict) -> PBPDelta:
+        items = self._items(raw)
+        seen = len(self._order)
+        start = 0 if self.edit_tail is None else max(0, seen - self.edit_tail)
+        if len(items) < seen or not self._same_ids(items, start):
+            return self._reconcile(items)
+
+        delta = PBPDelta()
+        if self.check_edits:
+            self._collect_edits(items, start, delta)
+        for item in items[seen:]:
+            self._add(item, delta)
+        return delta
+
+    def _same_ids(self, items: list[dict], start: int) -> bool:
+        """Whether the feed's first id and its ids from ``start`` on match."""
+        order = self._order
+        if not order:
+            return True
+        key = self._id_key
+        if str(items[0].get(key, "")) != order[0]:
+            return False
+        for eid, item in zip(order[start:], items[start:len(order)]):
+            if str(item.get(key, "")) != eid:
+                return False
+        return True
+
+    def _items(self, raw: dict) -> list[dict]:
+        if self.source == "nba":
+            game_data = raw.get("game", {})
+            if not self.game_id:
+                self.game_id = str(game_data.get("gameId", ""))
+            return game_data.get("actions", [])
+        return raw.get("plays", [])
+
+    def _add(self, item: dict, delta: PBPDelta) -> None:
+        ev = self._to_event(item, self.game_id)
+        self._order.append(ev.event_id)
+        self._events[ev.event_id] = ev
+        self._prints[ev.event_id] = self._fingerprint(item)
+        delta.added.append(ev)
+
+    def _collect_edits(self, items: list[dict], start: int, delta: PBPDelta) -> None:
+        prints = self._prints
+        fingerprint = self._fingerprint
+        for eid, item in zip(self._order[start:], items[start:len(self._order)]):
+            fp = fingerprint(item)
+            if fp != prints[eid]:
+                ev = self._to_event(item, self.game_id)
+                self._events[eid] = ev
+                prints[eid] = fp
+                delta.updated.append(ev)
+
+    def _reconcile(self, items: list[dict]) -> PBPDelta:
+        """Slow path: ids were deleted or reordered upstream."""
+        delta = PBPDelta()
+        old_events, old_prints = self._events, self._prints
+        self._order, self._events, self._prints = [], {}, {}
+
+        for item in items:
+            eid = str(item.get(self._id_key, ""))
+            fp = self._fingerprint(item)
+            old = old_events.get(eid)
+            if old is None:
+                self._add(item, delta)
+                continue
+            if fp == old_prints[eid]:
+                ev = old
+            else:
+                ev = self._to_event(item, self.game_id)
+                delta.updated.append(ev)
+            self._order.append(eid)
+            self._events[eid] = ev
+            self._prints[eid] = fp
+
+        delta.removed = [eid for eid in old_events if eid not in self._events]
+        return delta
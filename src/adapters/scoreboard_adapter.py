@@ -5,9 +5,12 @@ Layer: src/adapters
 """
 
 from __future__ import annotations
+from src import metrics
+from src.state.clock import parse_clock_tenths
 from src.state.game_state import GameState
 
 
+@metrics.timed("normalize", counter="games_normalized", source="espn")
 def normalize_espn_scoreboard(raw: dict) -> list[GameState]:
     """Convert raw ESPN scoreboard JSON to list of GameState.
 
@@ -58,11 +61,16 @@ def normalize_espn_scoreboard(raw: dict) -> list[GameState]:
             start_time_utc=event.get("date", ""),
             venue=competition.get("venue", {}).get("fullName", ""),
         )
+        # ESPN PBP plays carry only the team id; keep it for PBP attribution.
+        if home.get("id") or away.get("id"):
+            gs.extra["home_team_id"] = str(home.get("id", ""))
+            gs.extra["away_team_id"] = str(away.get("id", ""))
         states.append(gs)
 
     return states
 
 
+@metrics.timed("normalize", counter="games_normalized", source="nba")
 def normalize_nba_scoreboard(raw: dict) -> list[GameState]:
     """Convert raw NBA official scoreboard JSON to list of GameState.
 
@@ -83,9 +91,11 @@ def normalize_nba_scoreboard(raw: dict) -> list[GameState]:
         status = status_map.get(status_code, "pre")
 
         period = game.get("period", 0)
-        clock = game.get("gameClock", "")
-        # NBA gameClock comes as "PT05M32.00S" ISO duration — parse it
-        clock = _parse_nba_clock(clock)
+        raw_clock = game.get("gameClock", "")
+        # NBA gameClock comes as "PT05M32.00S" ISO duration — parse it.
+        # The display string drops tenths; clock_tenths keeps them.
+        clock = _parse_nba_clock(raw_clock)
+        clock_tenths = parse_clock_tenths(raw_clock) if raw_clock else None
 
         if period <= 4:
             period_label = f"Q{period}" if period > 0 else ""
@@ -108,6 +118,7 @@ def normalize_nba_scoreboard(raw: dict) -> list[GameState]:
             period=period,
             period_label=period_label,
             clock=clock,
+            clock_tenths=clock_tenths,
             start_time_utc=game.get("gameTimeUTC", ""),
             venue=game.get("arenaName", ""),
         )
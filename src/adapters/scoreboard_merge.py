@@ -0,0 +1,168 @@
+"""Cross-feed scoreboard merge — one GameState per game from ESPN + NBA.
+
+ESPN event ids and NBA game ids live in different id spaces, so games are
+matched on (home team, away team) after mapping ESPN abbreviations to NBA
+tricodes, with the nearest start_time_utc breaking ties. For each matched
+pair the source further into the game wins (status, then elapsed game
+time, then points scored); scores that can't both be right are flagged.
+Layer: src/adapters
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timedelta
+
+from src.state.clock import elapsed_seconds
+from src.state.game_state import GameState
+
+
+# ESPN abbreviations that differ from NBA tricodes.
+ESPN_TO_NBA_ABBR = {
+    "GS": "GSW",
+    "NY": "NYK",
+    "NO": "NOP",
+    "SA": "SAS",
+    "UTAH": "UTA",
+    "WSH": "WAS",
+}
+
+# Same matchup further apart than this is a different game.
+MAX_START_SKEW = timedelta(hours=12)
+
+_STATUS_RANK = {"pre": 0, "in": 1, "post": 2}
+
+
+def canonical_abbr(abbr: str) -> str:
+    """NBA tricode for an ESPN or NBA team abbreviation."""
+    return ESPN_TO_NBA_ABBR.get(abbr, abbr)
+
+
+def _start(state: GameState) -> datetime | None:
+    value = state.start_time_utc
+    if not value:
+        return None
+    try:
+        # ESPN: "2026-03-01T00:30Z"; NBA: "2026-03-01T00:30:00Z"
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def progress(state: GameState) -> tuple:
+    """Sortable "how far into the game" key: status, elapsed time, points.
+
+    Elapsed time is compared in whole seconds of clock: NBA clocks carry
+    tenths and ESPN's don't (ESPN "5:32" is NBA "5:32.4"), so the tenths are
+    dropped before converting, and the same instant ties across feeds.
+    """
+    status = 2 if state.is_final else _STATUS_RANK.get(state.status, 0)
+    tenths = state.clock_tenths
+    elapsed = -1 if tenths is None else elapsed_seconds(state.period, tenths - tenths % 10)
+    return (status, state.period, elapsed, state.home_score + state.away_score)
+
+
+def match_games(
+    espn_states: list[GameState],
+    nba_states: list[GameState],
+) -> list[tuple[GameState | None, GameState | None]]:
+    """Pair ESPN and NBA states for the same game.
+
+    Returns:
+        (espn, nba) pairs; unmatched games appear with None on the other side.
+        Order: NBA order, then unmatched ESPN games.
+    """
+    by_teams: dict[tuple[str, str], list[GameState]] = {}
+    for es in espn_states:
+        key = (canonical_abbr(es.home_abbr), canonical_abbr(es.away_abbr))
+        by_teams.setdefault(key, []).append(es)
+
+    pairs: list[tuple[GameState | None, GameState | None]] = []
+    matched: set[int] = set()
+    for ns in nba_states:
+        candidates = [
+            es for es in by_teams.get((canonical_abbr(ns.home_abbr), canonical_abbr(ns.away_abbr)), [])
+            if id(es) not in matched
+        ]
+        best = _nearest_start(ns, candidates)
+        if best is not None:
+            matched.add(id(best))
+        pairs.append((best, ns))
+    pairs.extend((es, None) for es in espn_states if id(es) not in matched)
+    return pairs
+
+
+def _nearest_start(ns: GameState, candidates: list[GameState]) -> GameState | None:
+    ns_start = _start(ns)
+    best, best_skew = None, None
+    for es in candidates:
+        es_start = _start(es)
+        if ns_start is None or es_start is None:
+            skew = MAX_START_SKEW  # unknown start: accept, but prefer a timed match
+        else:
+            skew = abs(es_start - ns_start)
+            if skew > MAX_START_SKEW:
+                continue
+        if best_skew is None or skew < best_skew:
+            best, best_skew = es, skew
+    return best
+
+
+def merge_game(
+    espn: GameState | None,
+    nba: GameState | None,
+    prefer: str = "nba",
+) -> GameState:
+    """One GameState for a matched pair, taken from the fresher source.
+
+    The merged state keeps the NBA game_id when there is one (stable no
+    matter which source wins a given poll); ``extra`` records
+    ``sources``, ``espn_game_id`` / ``nba_game_id``, and
+    ``score_disagreement`` ({"espn": [home, away], "nba": [...]}) when the
+    two feeds' scores can't both be right.
+
+    Args:
+        prefer: Source that wins when both are equally far along.
+    """
+    if espn is None or nba is None:
+        only = espn or nba
+        merged = dataclasses.replace(only, extra=dict(only.extra))
+        merged.extra["sources"] = [only.source]
+        merged.extra[f"{only.source}_game_id"] = only.game_id
+        return merged
+
+    p_espn, p_nba = progress(espn), progress(nba)
+    if p_espn != p_nba:
+        chosen = espn if p_espn > p_nba else nba
+    else:
+        chosen = nba if prefer == "nba" else espn
+    other = espn if chosen is nba else nba
+
+    merged = dataclasses.replace(chosen, game_id=nba.game_id, extra={**other.extra, **chosen.extra})
+    merged.extra["sources"] = ["espn", "nba"]
+    merged.extra["espn_game_id"] = espn.game_id
+    merged.extra["nba_game_id"] = nba.game_id
+    merged.extra.pop("score_disagreement", None)
+    if _scores_disagree(chosen, other):
+        merged.extra["score_disagreement"] = {
+            "espn": [espn.home_score, espn.away_score],
+            "nba": [nba.home_score, nba.away_score],
+        }
+    return merged
+
+
+def _scores_disagree(ahead: GameState, behind: GameState) -> bool:
+    """Scores only go up: same point in the game with different scores, or
+    the source further along showing fewer points for a team."""
+    if progress(ahead)[:3] == progress(behind)[:3]:
+        return (ahead.home_score, ahead.away_score) != (behind.home_score, behind.away_score)
+    return ahead.home_score < behind.home_score or ahead.away_score < behind.away_score
+
+
+def merge_scoreboards(
+    espn_states: list[GameState],
+    nba_states: list[GameState],
+    prefer: str = "nba",
+) -> list[GameState]:
+    """Merge normalized ESPN and NBA scoreboards into one state per game."""
+    return [merge_game(es, ns, prefer) for es, ns in match_games(espn_states, nba_states)]
@@ -0,0 +1,141 @@
+"""Conditional GET support (ETag / If-Modified-Since) for the fetchers.
+
+A caller that keeps the last payload it normalized passes a
+``ValidatorStore`` to a fetcher. The fetcher then sends the stored
+validators and returns ``NOT_MODIFIED`` on HTTP 304, so the caller can skip
+decoding and re-normalization and keep its previous result.
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+from src import metrics
+from src.data import http_client
+
+if TYPE_CHECKING:
+    import requests
+
+
+class NotModified:
+    """Type of ``NOT_MODIFIED``, the sentinel fetchers return on HTTP 304.
+
+    Fetcher return annotations use it: ``-> dict | NotModified``.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __repr__(self) -> str:
+        return "NOT_MODIFIED"
+
+    def __reduce__(self):
+        return (NotModified, ())
+
+
+NOT_MODIFIED = NotModified()
+
+
+def is_not_modified(raw) -> bool:
+    """True if a fetcher result means "unchanged since your last payload"."""
+    return raw is NOT_MODIFIED
+
+
+class ValidatorStore:
+    """Thread-safe map of request key -> (ETag, Last-Modified).
+
+    Owned by whoever holds the previously fetched payload; sharing one store
+    between callers that keep separate payloads would hand a 304 to a caller
+    that has nothing cached.
+    """
+
+    def __init__(self):
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+    def headers_for(self, key: str) -> dict:
+        etag, last_modified = self._validators.get(key, (None, None))
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def update(self, key: str, resp: requests.Response) -> None:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with self._lock:
+            if etag or last_modified:
+                self._validators[key] = (etag, last_modified)
+            else:
+                self._validators.pop(key, None)
+
+    def forget(self, key: str | None = None) -> None:
+        """Drop validators for one key (or all), forcing a full re-fetch."""
+        with self._lock:
+            if key is None:
+                self._validators.clear()
+            else:
+                self._validators.pop(key, None)
+
+
+def request_key(url: str, params: dict | None = None) -> str:
+    """Stable key for a URL + query params."""
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def get(
+    source: str,
+    url: str,
+    params: dict | None = None,
+    validators: ValidatorStore | None = None,
+    stream: bool = False,
+) -> requests.Response | NotModified:
+    """GET through ``http_client``, conditionally if ``validators`` is given.
+
+    ``stream`` is passed through to ``http_client.get``.
+
+    Returns:
+        ``NOT_MODIFIED`` on HTTP 304, else the response (validators are
+        refreshed from it when it is 2xx).
+
+    Raises:
+        requests.HTTPError: On non-2xx, non-304 response.
+    """
+    if validators is None:
+        resp = http_client.get(source, url, params=params, stream=stream)
+        _raise_for_status(resp)
+        return resp
+
+    key = request_key(url, params)
+    resp = http_client.get(
+        source, url, params=params, headers=validators.headers_for(key), stream=stream
+    )
+    if resp.status_code == 304:
+        resp.close()
+        metrics.count("cache_requests", cache="conditional", result="not_modified")
+        return NOT_MODIFIED
+    _raise_for_status(resp)
+    metrics.count("cache_requests", cache="conditional", result="modified")
+    validators.update(key, resp)
+    return resp
+
+
+def _raise_for_status(resp: requests.Response) -> None:
+    """``raise_for_status()`` that also releases a streamed response."""
+    if not resp.ok:
+        resp.close()
+        resp.raise_for_status()
@@ -0,0 +1,339 @@
+"""Persistent on-disk response cache for the fetchers.
+
+``DiskCache`` is a transport (see ``http_client.set_transport``) that keeps
+each 200 response on disk, keyed by URL + params, gzip-compressed. How long
+an entry stays fresh depends on the state of the games in it: payloads
+where every game is final never expire, live games expire in seconds,
+pregame boards in a minute. "Final forever" only holds when the request
+pins a date or game (a ``dates`` / ``event`` param, a game id in the
+path): a "today" URL such as ``todaysScoreboard_00.json`` serves a new
+slate tomorrow, so its all-final payloads expire after a few minutes. Expired entries are revalidated with their
+ETag, so an unchanged payload costs a 304 instead of a full download.
+
+Entries are written to a temp file and renamed into place, so concurrent
+processes never see a partial entry; eviction (least recently used first,
+down to ``max_bytes``) takes an exclusive lock file where ``fcntl`` exists.
+
+Usage:
+    with caching(".cache/http"):
+        fetch_scoreboard("20260228")   # served from disk on the next run
+
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Callable
+
+from src import metrics
+from src.data import http_client
+from src.data.conditional import request_key
+from src.data.recorder import _response
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+
+# Seconds an entry stays fresh, by the state of the games it covers.
+# None = never expires. "today" is for all-final payloads of a URL that
+# pins no date (its content rolls over to the next slate).
+DEFAULT_TTLS: dict[str | None, float | None] = {
+    "post": None,
+    "today": 300.0,
+    "in": 5.0,
+    "pre": 60.0,
+    None: 30.0,  # payload shape not recognized
+}
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Content-Type")
+_SUFFIX = ".json.gz"
+_LOCK_NAME = ".evict.lock"
+
+# Params / path shapes that fix a request to one date or game.
+_PINNING_PARAMS = ("dates", "date", "gameDate", "event", "gameId", "GameID")
+_GAME_ID_PATH = re.compile(r"[_/]\d{10}(?:\.json)?$")
+
+
+def _combine(states: list[str]) -> str | None:
+    if not states:
+        return None
+    if "in" in states:
+        return "in"
+    if "pre" in states:
+        return "pre"
+    return "post"
+
+
+def payload_status(data) -> str | None:
+    """Overall game status of a raw payload: "in", "pre", "post" or None.
+
+    Any live game makes the payload "in"; it is "post" only when every game
+    in it is final. Recognizes ESPN / NBA scoreboards and PBP payloads.
+    """
+    if not isinstance(data, dict):
+        return None
+    if "events" in data:  # ESPN scoreboard
+        return _combine([
+            e.get("status", {}).get("type", {}).get("state", "pre") for e in data["events"]
+        ])
+    if "scoreboard" in data:  # NBA scoreboard
+        codes = {1: "pre", 2: "in", 3: "post"}
+        return _combine([
+            codes.get(g.get("gameStatus"), "pre") for g in data["scoreboard"].get("games", [])
+        ])
+    if "game" in data and isinstance(data["game"], dict):  # NBA PBP
+        actions = data["game"].get("actions", [])
+        if not actions:
+            return "pre"
+        last = actions[-1]
+        if last.get("actionType") == "game" and last.get("subType") == "end":
+            return "post"
+        return "in"
+    header = data.get("header")
+    if isinstance(header, dict):  # ESPN summary
+        competitions = header.get("competitions") or [{}]
+        return competitions[0].get("status", {}).get("type", {}).get("state")
+    return None
+
+
+def pins_date(url: str, params: dict | None) -> bool:
+    """Whether a request always returns the same date's / game's data."""
+    if params and any(k in params for k in _PINNING_PARAMS):
+        return True
+    return bool(_GAME_ID_PATH.search(url.split("?", 1)[0]))
+
+
+class DiskCache:
+    """Transport that serves fresh responses from disk and stores new ones.
+
+    Args:
+        root: Cache directory (created if missing).
+        max_bytes: Total size the cache is trimmed to (compressed bytes).
+        ttls: Freshness per payload status, overriding ``DEFAULT_TTLS``.
+        inner: Transport to fetch misses through (default: the network).
+        clock: Wall-clock time source (entries are shared across processes).
+    """
+
+    def __init__(
+        self,
+        root: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: dict[str | None, float | None] | None = None,
+        inner=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.inner = inner
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = self._scan_size()
+
+    # --- Transport API ---
+
+    def get(self, source, url, params=None, headers=None, timeout=None) -> requests.Response:
+        path = self._path(request_key(url, params))
+        entry = self._read(path)
+        client_etag = (headers or {}).get("If-None-Match")
+
+        if entry is not None and self._fresh(entry):
+            with self._lock:
+                self.hits += 1
+            metrics.count("cache_requests", cache="disk", result="hit")
+            self._touch(path)
+            return self._serve(url, entry, client_etag)
+
+        send = dict(headers or {})
+        etag = entry["headers"].get("ETag") if entry is not None else None
+        if etag and "If-None-Match" not in send:
+            send["If-None-Match"] = etag
+        resp = self._fetch(source, url, params, send, timeout)
+
+        if resp.status_code == 304 and entry is not None and send.get("If-None-Match") == etag:
+            with self._lock:
+                self.revalidated += 1
+            metrics.count("cache_requests", cache="disk", result="revalidated")
+            entry["stored_at"] = self.clock()
+            self._write(path, entry)
+            return self._serve(url, entry, client_etag)
+        with self._lock:
+            self.misses += 1
+        metrics.count("cache_requests", cache="disk", result="miss")
+        if resp.status_code == 200:
+            self.store(url, params, resp)
+        return resp
+
+    def _fetch(self, source, url, params, headers, timeout) -> requests.Response:
+        if self.inner is not None:
+            return self.inner.get(source, url, params, headers, timeout)
+        return http_client.network_get(source, url, params, headers, timeout)
+
+    def _serve(self, url: str, entry: dict, client_etag: str | None) -> requests.Response:
+        etag = entry["headers"].get("ETag")
+        if etag and client_etag == etag:
+            return _response(url, 304, entry["headers"], b"")
+        return _response(url, 200, entry["headers"], entry["body"])
+
+    # --- Entries ---
+
+    def store(self, url: str, params: dict | None, resp: requests.Response) -> None:
+        """Write a 200 response to the cache."""
+        content = resp.content
+        try:
+            # stdlib json: classifying is not a "decode" stage of any source
+            status = payload_status(json.loads(content))
+        except ValueError:
+            return  # not JSON: don't cache
+        entry = {
+            "url": url,
+            "params": params or {},
+            "stored_at": self.clock(),
+            "status": status,
+            "pinned": pins_date(url, params),
+            "headers": {k: resp.headers[k] for k in _KEPT_HEADERS if k in resp.headers},
+            "body": content,
+        }
+        self._write(self._path(request_key(url, params)), entry)
+
+    def _fresh(self, entry: dict) -> bool:
+        status = entry.get("status")
+        if status == "post" and not entry.get("pinned"):
+            status = "today"
+        ttl = self.ttls.get(status, self.ttls[None])
+        return ttl is None or self.clock() - entry["stored_at"] < ttl
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest + _SUFFIX)
+
+    def _read(self, path: str) -> dict | None:
+        try:
+            with gzip.open(path, "rb") as fh:
+                meta_line = fh.readline()
+                body = fh.read()
+            entry = json.loads(meta_line)
+        except (OSError, EOFError, ValueError):  # missing, evicted or corrupt
+            return None
+        entry["body"] = body
+        return entry
+
+    def _write(self, path: str, entry: dict) -> None:
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+        with gzip.open(tmp, "wb", compresslevel=6) as fh:
+            fh.write(json.dumps(meta, separators=(",", ":")).encode("utf-8") + b"\n")
+            fh.write(entry["body"])
+        try:
+            old = os.path.getsize(path)
+        except OSError:
+            old = 0
+        os.replace(tmp, path)  # atomic: readers see the old or the new entry
+        with self._lock:
+            self._size += os.path.getsize(path) - old
+            over = self._size > self.max_bytes
+        if over:
+            self.evict()
+
+    def _touch(self, path: str) -> None:
+        """Mark an entry recently used (mtime is the LRU clock)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    # --- Size management ---
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        out = []
+        for dirpath, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith(_SUFFIX):
+                    continue
+                full = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                out.append((st.st_mtime, st.st_size, full))
+        return out
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    @property
+    def size(self) -> int:
+        """Compressed bytes on disk, as last counted by this process."""
+        return self._size
+
+    def evict(self, target: int | None = None) -> int:
+        """Delete least recently used entries until the cache fits.
+
+        Rescans the directory (other processes may have written to it) and
+        trims to ``target`` bytes (default 90% of ``max_bytes``).
+
+        Returns:
+            Number of entries removed.
+        """
+        target = int(self.max_bytes * 0.9) if target is None else target
+        with self._evict_lock():
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+        with self._lock:
+            self._size = total
+        return removed
+
+    def clear(self) -> None:
+        self.evict(target=0)
+
+    @contextlib.contextmanager
+    def _evict_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.root, _LOCK_NAME), "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def caching(root: str, **kwargs):
+    """Serve and store every fetch made inside the block through a DiskCache."""
+    cache = DiskCache(root, inner=http_client._transport, **kwargs)
+    previous = http_client.set_transport(cache)
+    try:
+        yield cache
+    finally:
+        http_client.set_transport(previous)
@@ -4,28 +4,72 @@ Fetches play-by-play data for a specific game from ESPN's public API.
 Layer: src/data (raw fetch only, no normalization).
 """
 
-import requests
+from src.data import conditional, json_decode
+from src.data.conditional import NotModified, ValidatorStore
+from src.data.json_stream import ItemStream
 
 
 ESPN_PBP_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
 
 
-def fetch_playbyplay(game_id: str) -> dict:
+def fetch_playbyplay(
+    game_id: str, validators: ValidatorStore | None = None
+) -> dict | NotModified:
     """Fetch ESPN play-by-play data for a specific game.
 
     Args:
         game_id: ESPN game ID string.
+        validators: Optional ValidatorStore owned by the caller. When given,
+            the request is conditional and ``NOT_MODIFIED`` is returned on 304.
 
     Returns:
-        Raw ESPN game summary/PBP JSON as dict.
+        Raw ESPN game summary/PBP JSON as dict, or NOT_MODIFIED (see validators).
 
     Raises:
         requests.HTTPError: On non-2xx response.
     """
     params = {"event": game_id}
-    resp = requests.get(ESPN_PBP_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    resp = conditional.get("espn", ESPN_PBP_URL, params=params, validators=validators)
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return json_decode.decode("espn", resp.content)
+
+
+def fetch_playbyplay_bytes(game_id: str) -> bytes:
+    """Fetch ESPN play-by-play as the undecoded response body.
+
+    For callers that hand the payload on (to a file, another process) and
+    would otherwise decode and re-encode it.
+
+    Raises:
+        requests.HTTPError: On non-2xx response.
+    """
+    return conditional.get("espn", ESPN_PBP_URL, params={"event": game_id}).content
+
+
+def stream_playbyplay(
+    game_id: str, validators: ValidatorStore | None = None
+) -> ItemStream | NotModified:
+    """Fetch ESPN play-by-play as a stream of plays, parsed while it downloads.
+
+    Args:
+        game_id: ESPN game ID string.
+        validators: As for ``fetch_playbyplay``.
+
+    Returns:
+        An ``ItemStream`` of raw play dicts from ``plays`` (boxscore, news,
+        odds and the other summary sections are skipped unparsed), or
+        NOT_MODIFIED. Iterate it to the end or ``close()`` it.
+
+    Raises:
+        requests.HTTPError: On non-2xx response.
+    """
+    resp = conditional.get(
+        "espn", ESPN_PBP_URL, params={"event": game_id}, validators=validators, stream=True
+    )
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return ItemStream(resp, ("plays",))
 
 
 if __name__ == "__main__":
@@ -4,21 +4,27 @@ Fetches NBA scoreboard data from ESPN's public API.
 Layer: src/data (raw fetch only, no normalization).
 """
 
-import requests
 from datetime import datetime
 
+from src.data import conditional, json_decode
+from src.data.conditional import NotModified, ValidatorStore
+
 
 ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
 
 
-def fetch_scoreboard(date: str | None = None) -> dict:
+def fetch_scoreboard(
+    date: str | None = None, validators: ValidatorStore | None = None
+) -> dict | NotModified:
     """Fetch ESPN NBA scoreboard for a given date.
 
     Args:
         date: Date string in YYYYMMDD format. Defaults to today.
+        validators: Optional ValidatorStore owned by the caller. When given,
+            the request is conditional and ``NOT_MODIFIED`` is returned on 304.
 
     Returns:
-        Raw ESPN scoreboard JSON as dict.
+        Raw ESPN scoreboard JSON as dict, or NOT_MODIFIED (see validators).
 
     Raises:
         requests.HTTPError: On non-2xx response.
@@ -29,9 +35,10 @@ def fetch_scoreboard(date: str | None = None) -> dict:
     else:
         params["dates"] = datetime.now().strftime("%Y%m%d")
 
-    resp = requests.get(ESPN_SCOREBOARD_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    resp = conditional.get("espn", ESPN_SCOREBOARD_URL, params=params, validators=validators)
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return json_decode.decode("espn", resp.content)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,230 @@
+"""Shared pooled HTTP client for the src/data fetchers.
+
+One ``requests.Session`` per source ("espn", "nba"), each with its own
+keep-alive connection pool, retry policy, timeouts and default headers.
+Fetchers call ``get(source, url, ...)`` instead of bare ``requests.get`` so
+repeated polls reuse warm TCP/TLS connections. ``requests`` / ``urllib3``
+are imported when the first session is built, not at module import. With ``src.metrics``
+enabled, each ``get()`` is timed as the ``fetch`` stage and counts its
+status, bytes received and network errors per source.
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
+
+from src import metrics
+
+if TYPE_CHECKING:
+    import requests
+
+
+NBA_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json",
+    "Referer": "https://www.nba.com/",
+}
+
+
+@dataclass
+class SourceConfig:
+    """Connection pool / retry / timeout settings for one source."""
+
+    pool_connections: int = 2  # distinct hosts kept in the pool
+    pool_maxsize: int = 16  # concurrent keep-alive connections per host
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    retries: int = 2
+    backoff_factor: float = 0.3
+    status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504)
+    headers: dict = field(default_factory=dict)
+    # Redirect every request for this source to another scheme://host[:port],
+    # e.g. "http://127.0.0.1:8000" for a local stand-in server in tests.
+    base_url: str | None = None
+
+
+DEFAULT_CONFIGS: dict[str, SourceConfig] = {
+    "espn": SourceConfig(),
+    "nba": SourceConfig(headers=dict(NBA_HEADERS)),
+}
+
+_configs: dict[str, SourceConfig] = {k: replace(v) for k, v in DEFAULT_CONFIGS.items()}
+_sessions: dict[str, requests.Session] = {}
+_lock = threading.Lock()
+# Optional replacement for the network (record/replay); see set_transport().
+_transport = None
+
+
+def get_config(source: str) -> SourceConfig:
+    """Return the active config for a source (unknown sources get defaults)."""
+    return _configs.get(source) or SourceConfig()
+
+
+def configure(source: str, **overrides) -> SourceConfig:
+    """Override settings for a source.
+
+    The source's existing session is closed so the next request builds a
+    fresh pool with the new settings.
+
+    Example:
+        configure("nba", base_url="http://127.0.0.1:8000", retries=0)
+    """
+    with _lock:
+        cfg = replace(get_config(source), **overrides)
+        _configs[source] = cfg
+        session = _sessions.pop(source, None)
+    if session is not None:
+        session.close()
+    return cfg
+
+
+def set_transport(transport):
+    """Route every ``get()`` through ``transport`` instead of the network.
+
+    ``transport.get(source, url, params, headers, timeout)`` must return a
+    ``requests.Response``; it receives the original (un-rebased) URL and
+    may call ``network_get`` to reach the real source. Pass None to restore
+    direct network access.
+
+    Returns:
+        The previously installed transport (or None).
+    """
+    global _transport
+    previous, _transport = _transport, transport
+    return previous
+
+
+def reset() -> None:
+    """Close all sessions, restore the default configs and drop any transport."""
+    global _transport
+    _transport = None
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+        _configs.clear()
+        _configs.update({k: replace(v) for k, v in DEFAULT_CONFIGS.items()})
+    for session in sessions:
+        session.close()
+
+
+def get_session(source: str) -> requests.Session:
+    """Return the pooled session for a source, creating it on first use."""
+    session = _sessions.get(source)
+    if session is not None:
+        return session
+    with _lock:
+        session = _sessions.get(source)
+        if session is None:
+            session = _build_session(get_config(source))
+            _sessions[source] = session
+    return session
+
+
+def get(
+    source: str,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float | tuple[float, float] | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """GET ``url`` through the pooled session for ``source``.
+
+    Args:
+        source: Source key ("espn" | "nba"); selects pool, retries, headers.
+        url: Absolute URL. Host is rewritten if the source has a base_url.
+        params: Query parameters.
+        headers: Extra headers merged over the source defaults.
+        timeout: Overrides the source's (connect, read) timeout.
+        stream: Don't read the body up front; consume it with
+            ``iter_content()`` and ``close()`` the response when done.
+            Installed transports always return a fully read response.
+
+    Returns:
+        The final ``requests.Response`` after retries. Callers are
+        responsible for ``raise_for_status()``.
+    """
+    if not metrics.enabled():
+        if _transport is not None:
+            return _transport.get(source, url, params, headers, timeout)
+        return network_get(source, url, params, headers, timeout, stream)
+
+    start = time.perf_counter()
+    try:
+        if _transport is not None:
+            resp = _transport.get(source, url, params, headers, timeout)
+        else:
+            resp = network_get(source, url, params, headers, timeout, stream)
+    except Exception:  # connection / timeout errors (HTTP errors come back as responses)
+        metrics.count("errors", source=source, kind="network")
+        raise
+    finally:
+        metrics.observe("fetch", time.perf_counter() - start, source=source)
+    _count_response(source, resp, stream)
+    return resp
+
+
+def _count_response(source: str, resp: requests.Response, stream: bool) -> None:
+    metrics.count("http_responses", source=source, status=resp.status_code)
+    if resp.status_code >= 400:
+        metrics.count("errors", source=source, kind="http")
+    # A streamed body isn't read yet: fall back to the declared length.
+    size = int(resp.headers.get("Content-Length") or 0) if stream else len(resp.content)
+    metrics.count("http_bytes", size, source=source)
+
+
+def network_get(
+    source: str,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float | tuple[float, float] | None = None,
+    stream: bool = False,
+) -> requests.Response:
+    """``get()`` straight to the network, bypassing any installed transport."""
+    cfg = get_config(source)
+    if cfg.base_url:
+        url = _rebase(url, cfg.base_url)
+    if timeout is None:
+        timeout = (cfg.connect_timeout, cfg.read_timeout)
+    return get_session(source).get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+
+
+def _build_session(cfg: SourceConfig) -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+
+    retry = Retry(
+        total=cfg.retries,
+        backoff_factor=cfg.backoff_factor,
+        status_forcelist=cfg.status_forcelist,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=cfg.pool_connections,
+        pool_maxsize=cfg.pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Advertise every encoding urllib3 can decode here (gzip/deflate, plus
+    # br / zstd when brotli / zstandard are installed).
+    session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    session.headers["Connection"] = "keep-alive"
+    session.headers.update(cfg.headers)
+    return session
+
+
+def _rebase(url: str, base_url: str) -> str:
+    """Swap scheme and host of ``url`` for those of ``base_url``."""
+    parts = urlsplit(url)
+    base = urlsplit(base_url)
+    return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, parts.fragment))
@@ -0,0 +1,139 @@
+"""Pluggable JSON decoder for the fetchers, with per-source timing.
+
+Fetchers call ``decode(source, resp.content)`` instead of ``resp.json()``.
+The payload is decoded straight from the response bytes with the fastest
+installed backend (orjson, then ujson, then the stdlib ``json``), skipping
+``requests``' charset detection and bytes -> str copy. Every call is timed
+per source; ``stats()`` reports count, bytes and seconds spent decoding.
+The same timings feed the ``decode`` stage of ``src.metrics``.
+
+Usage:
+    set_backend("json")     # force the stdlib decoder
+    stats()["nba"].mean_ms  # average decode time for NBA payloads
+
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from src import metrics
+
+# Preference order; the first importable backend is the default.
+BACKENDS = ("orjson", "ujson", "json")
+
+
+def _load_backend(name: str) -> Callable[[bytes], Any]:
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads
+    if name == "ujson":
+        import ujson
+
+        return ujson.loads
+    if name == "json":
+        return json.loads
+    raise ValueError(f"unknown JSON backend {name!r} (choose from {', '.join(BACKENDS)})")
+
+
+def available_backends() -> list[str]:
+    """Backends importable in this environment, in preference order."""
+    names = []
+    for name in BACKENDS:
+        try:
+            _load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@dataclass
+class DecodeStats:
+    """Decode totals for one source."""
+
+    calls: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.seconds * 1000 / self.calls if self.calls else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / self.seconds / 1e6 if self.seconds else 0.0
+
+
+_lock = threading.Lock()
+_stats: dict[str, DecodeStats] = {}
+_backend: str | None = None
+_loads: Callable[[bytes], Any] | None = None
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select the decoder backend (None = best installed).
+
+    Returns:
+        The backend now in use.
+
+    Raises:
+        ImportError: The named backend isn't installed.
+        ValueError: Unknown backend name.
+    """
+    global _backend, _loads
+    if name is None:
+        name = available_backends()[0]
+    loads = _load_backend(name)
+    _backend, _loads = name, loads
+    return name
+
+
+def backend() -> str:
+    """Name of the backend in use."""
+    if _backend is None:
+        set_backend()
+    return _backend
+
+
+def decode(source: str, content: bytes) -> Any:
+    """Decode a JSON payload from raw bytes, timing it under ``source``.
+
+    Raises:
+        ValueError: Invalid JSON (every backend's decode error subclasses it).
+    """
+    if _loads is None:
+        set_backend()
+    start = time.perf_counter()
+    try:
+        return _loads(content)
+    except ValueError:
+        metrics.count("errors", source=source, kind="decode")
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe("decode", elapsed, source=source)
+        with _lock:
+            st = _stats.get(source)
+            if st is None:
+                st = _stats[source] = DecodeStats()
+            st.calls += 1
+            st.bytes += len(content)
+            st.seconds += elapsed
+
+
+def stats() -> dict[str, DecodeStats]:
+    """Copy of the per-source decode totals."""
+    with _lock:
+        return {k: DecodeStats(v.calls, v.bytes, v.seconds) for k, v in _stats.items()}
+
+
+def reset_stats() -> None:
+    with _lock:
+        _stats.clear()
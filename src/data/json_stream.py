@@ -0,0 +1,230 @@
+"""Incremental extraction of one JSON array from a streamed document.
+
+``iter_array(chunks, ("game", "actions"))`` reads a JSON document chunk by
+chunk and yields the items of the array at that key path one at a time.
+Sibling subtrees on the way (ESPN's boxscore, news, odds, ...) are skipped
+by a bracket/string scanner without building Python objects; each wanted
+item is decoded with the C ``json`` decoder. Memory stays proportional to
+one chunk plus one item instead of the whole payload.
+
+Scalars met along the path (e.g. ``game.gameId``) are collected in
+``meta`` as they are passed.
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import requests
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+_COMPACT_AT = DEFAULT_CHUNK_SIZE  # drop consumed text from the buffer past this offset
+
+# A complete string, or a bracket, or a lone quote (string not complete yet).
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}"]', re.DOTALL)
+_WS = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,]}:")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Text buffer over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def more(self) -> bool:
+        """Append the next chunk; False once the input is exhausted."""
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_AT:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._utf8.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character (not consumed)."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                raise ValueError("unexpected end of JSON input")
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number may continue in the next chunk ("2" of "2.5"):
+                # only trust it once a delimiter (or EOF) follows it.
+                if self.eof or (
+                    end < len(self.buf)
+                    and (self.buf[self.pos] in '{["' or self.buf[end] in _DELIMITERS)
+                ):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.more()
+
+    def skip(self) -> Any:
+        """Skip one value; scalars are decoded and returned, containers give None."""
+        if self.peek() not in "[{":
+            return self.value()
+        depth = 0
+        while True:
+            for m in _TOKEN.finditer(self.buf, self.pos):
+                token = m.group()
+                if token == '"':  # string continues in the next chunk
+                    self.pos = m.start()
+                    break
+                if token in "[{":
+                    depth += 1
+                elif token in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        self.pos = m.end()
+                        return None
+            else:
+                self.pos = len(self.buf)
+            if not self.more():
+                raise ValueError("unexpected end of JSON input")
+
+
+def _seek(reader: _Reader, path: tuple[str, ...], meta: dict, prefix: str) -> bool:
+    """Advance to the '[' of the array at ``path``; False if it isn't there."""
+    if reader.peek() != "{":
+        return False
+    reader.pos += 1
+    if reader.peek() == "}":
+        reader.pos += 1
+        return False
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        dotted = prefix + key
+        if key == path[0]:
+            if len(path) > 1:
+                return _seek(reader, path[1:], meta, dotted + ".")
+            return reader.peek() == "["
+        scalar = reader.skip()
+        if scalar is not None:
+            meta[dotted] = scalar
+        sep = reader.peek()
+        reader.pos += 1
+        if sep == "}":
+            return False
+        if sep != ",":
+            raise ValueError(f"expected ',' or '}}' at offset {reader.pos - 1}")
+
+
+def iter_array(
+    chunks: Iterable[bytes],
+    path: tuple[str, ...],
+    meta: dict | None = None,
+) -> Iterator[Any]:
+    """Yield the items of the array at ``path`` in a streamed JSON document.
+
+    Args:
+        chunks: UTF-8 bytes in order (e.g. ``resp.iter_content(...)``).
+        path: Object keys leading to the array, e.g. ``("plays",)``.
+        meta: Optional dict that receives scalars seen before the array,
+            keyed by dotted path (``"game.gameId"``).
+
+    Yields nothing if the path is absent or not an array. Reading stops at
+    the end of the array; the rest of the document is not parsed.
+
+    Raises:
+        ValueError: Malformed or truncated JSON.
+    """
+    reader = _Reader(chunks)
+    if not _seek(reader, path, {} if meta is None else meta, ""):
+        return
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        sep = reader.peek()
+        reader.pos += 1
+        if sep == "]":
+            return
+        if sep != ",":
+            raise ValueError(f"expected ',' or ']' at offset {reader.pos - 1}")
+
+
+class ItemStream:
+    """Iterator over one array of a streamed HTTP response.
+
+    ``meta`` fills in as iteration passes the scalars before the array.
+    The response is drained and released when the array is exhausted (so
+    its keep-alive connection returns to the pool) or on ``close()``.
+    """
+
+    def __init__(
+        self,
+        resp: requests.Response,
+        path: tuple[str, ...],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.resp = resp
+        self.path = path
+        self.meta: dict = {}
+        self._chunks = resp.iter_content(chunk_size)
+        self._items = iter_array(self._chunks, path, self.meta)
+        self._closed = False
+
+    def __iter__(self) -> ItemStream:
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return next(self._items)
+        except StopIteration:
+            if not self._closed:
+                for _ in self._chunks:  # drain the tail so the connection is reusable
+                    pass
+                self.close()
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._items.close()
+            self.resp.close()
+
+    def __enter__(self) -> ItemStream:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,221 @@
+"""Historical NBA scoreboards via nba_api.
+
+The CDN scoreboard only covers today. For other dates, one
+``LeagueGameFinder`` call covers a whole date range (one row per team per
+game); rows are paired into games and translated into the
+``todaysScoreboard_00.json`` shape, so ``normalize_nba_scoreboard`` works
+unchanged. A miss on a single date fetches a window of ``WINDOW_DAYS``
+from that date on, so walking a season day by day costs one call per
+window rather than one per date or per game.
+
+Past dates whose games are all final never change: they are kept in memory
+and, after ``set_cache_dir()``, as gzip JSON files on disk (written to a
+temp file and renamed into place).
+
+Requires ``nba_api`` (in requirements.txt); imported on first use.
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from datetime import date as _date
+from datetime import datetime, timedelta
+
+
+WINDOW_DAYS = 30
+DEFAULT_TIMEOUT = 30.0
+REGULATION_TEAM_MINUTES = 240  # 5 players x 48 minutes
+OVERTIME_TEAM_MINUTES = 25
+
+_memory: dict[str, dict] = {}  # YYYY-MM-DD -> scoreboard payload
+_cache_dir: str | None = None
+_lock = threading.Lock()
+
+
+def set_cache_dir(path: str | None) -> str | None:
+    """Persist finished dates under ``path`` (None = memory only).
+
+    Returns:
+        The previous cache directory.
+    """
+    global _cache_dir
+    previous, _cache_dir = _cache_dir, path
+    if path:
+        os.makedirs(path, exist_ok=True)
+    return previous
+
+
+def clear_memory() -> None:
+    """Drop the in-process cache (disk entries are kept)."""
+    with _lock:
+        _memory.clear()
+
+
+def parse_date(value: str) -> _date:
+    """YYYYMMDD or YYYY-MM-DD."""
+    fmt = "%Y-%m-%d" if "-" in value else "%Y%m%d"
+    return datetime.strptime(value, fmt).date()
+
+
+def _find_rows(start: _date, end: _date, timeout: float = DEFAULT_TIMEOUT) -> list[dict]:
+    """LeagueGameFinder team rows for games played from start to end."""
+    try:
+        from nba_api.stats.endpoints import leaguegamefinder
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError("historical NBA scoreboards require nba_api (pip install nba_api)") from e
+    finder = leaguegamefinder.LeagueGameFinder(
+        player_or_team_abbreviation="T",
+        league_id_nullable="00",
+        date_from_nullable=start.strftime("%m/%d/%Y"),
+        date_to_nullable=end.strftime("%m/%d/%Y"),
+        timeout=timeout,
+    )
+    return finder.get_normalized_dict()["LeagueGameFinderResults"]
+
+
+def _nickname(abbr: str, full_name: str) -> str:
+    """CDN-style team name ("Celtics") for a tricode."""
+    try:
+        from nba_api.stats.static import teams
+    except ImportError:  # pragma: no cover - depends on environment
+        teams = None
+    team = teams.find_team_by_abbreviation(abbr) if teams else None
+    return team["nickname"] if team else full_name
+
+
+def _team(row: dict) -> dict:
+    return {
+        "teamName": _nickname(row["TEAM_ABBREVIATION"], row.get("TEAM_NAME", "")),
+        "teamTricode": row["TEAM_ABBREVIATION"],
+        "score": int(row.get("PTS") or 0),
+    }
+
+
+def _period(row: dict) -> int:
+    """Periods played, from team minutes (240 = regulation, +25 per OT)."""
+    extra = (row.get("MIN") or REGULATION_TEAM_MINUTES) - REGULATION_TEAM_MINUTES
+    return 4 + max(0, round(extra / OVERTIME_TEAM_MINUTES))
+
+
+def games_from_rows(rows: list[dict]) -> dict[str, list[dict]]:
+    """Pair LeagueGameFinder team rows into CDN-shaped games, by date.
+
+    The home row's MATCHUP reads "BOS vs. NYK", the away row's "NYK @ BOS".
+    Games with a result (WL) are final (gameStatus 3); others are reported
+    as in progress.
+
+    Returns:
+        YYYY-MM-DD -> list of ``scoreboard.games`` entries.
+    """
+    by_game: dict[str, dict[str, dict]] = {}
+    for row in rows:
+        side = "awayTeam" if "@" in row.get("MATCHUP", "") else "homeTeam"
+        by_game.setdefault(row["GAME_ID"], {})[side] = row
+
+    out: dict[str, list[dict]] = {}
+    for game_id, sides in sorted(by_game.items()):
+        if len(sides) != 2:
+            continue  # the other team's row is missing: can't place the game
+        home, away = sides["homeTeam"], sides["awayTeam"]
+        final = bool(home.get("WL")) and bool(away.get("WL"))
+        out.setdefault(home["GAME_DATE"][:10], []).append({
+            "gameId": game_id,
+            "gameStatus": 3 if final else 2,
+            "period": _period(home),
+            "gameClock": "",
+            "gameTimeUTC": "",  # LeagueGameFinder has the date only
+            "homeTeam": _team(home),
+            "awayTeam": _team(away),
+        })
+    return out
+
+
+def _scoreboard(day: str, games: list[dict]) -> dict:
+    return {"scoreboard": {"gameDate": day, "games": games}}
+
+
+def _final(payload: dict, day: _date) -> bool:
+    """Safe to cache forever: a past date with every game final."""
+    return day < _date.today() and all(g["gameStatus"] == 3 for g in payload["scoreboard"]["games"])
+
+
+def _path(day: str) -> str | None:
+    return os.path.join(_cache_dir, f"{day}.json.gz") if _cache_dir else None
+
+
+def _load(day: str) -> dict | None:
+    with _lock:
+        if day in _memory:
+            return _memory[day]
+    path = _path(day)
+    if path is None:
+        return None
+    try:
+        with gzip.open(path, "rb") as fh:
+            payload = json.loads(fh.read())
+    except (OSError, EOFError, ValueError):
+        return None
+    with _lock:
+        _memory[day] = payload
+    return payload
+
+
+def _save(day: str, payload: dict) -> None:
+    with _lock:
+        _memory[day] = payload
+    path = _path(day)
+    if path is None:
+        return
+    tmp = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+    with gzip.open(tmp, "wb") as fh:
+        fh.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp, path)
+
+
+def fetch_range(start: str, end: str, timeout: float = DEFAULT_TIMEOUT) -> dict[str, dict]:
+    """Scoreboards for every date from start to end, inclusive.
+
+    Cached dates are served locally; the rest come from one nba_api call
+    spanning the first to the last missing date.
+
+    Args:
+        start, end: YYYYMMDD or YYYY-MM-DD.
+
+    Returns:
+        YYYY-MM-DD -> raw scoreboard dict (``{"scoreboard": {...}}``), one
+        per date, empty ``games`` on days without games.
+    """
+    first, last = parse_date(start), parse_date(end)
+    days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+    out: dict[str, dict] = {}
+    missing: list[_date] = []
+    for day in days:
+        payload = _load(day.isoformat())
+        if payload is None:
+            missing.append(day)
+        else:
+            out[day.isoformat()] = payload
+    if missing:
+        games = games_from_rows(_find_rows(missing[0], missing[-1], timeout))
+        for day in missing:
+            key = day.isoformat()
+            payload = _scoreboard(key, games.get(key, []))
+            if _final(payload, day):
+                _save(key, payload)
+            out[key] = payload
+    return dict(sorted(out.items()))
+
+
+def fetch_date(date: str, timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """Scoreboard for one date; a miss prefetches up to WINDOW_DAYS ahead."""
+    day = parse_date(date)
+    payload = _load(day.isoformat())
+    if payload is not None:
+        return payload
+    yesterday = _date.today() - timedelta(days=1)
+    end = max(day, min(day + timedelta(days=WINDOW_DAYS - 1), yesterday))
+    return fetch_range(day.isoformat(), end.isoformat(), timeout)[day.isoformat()]
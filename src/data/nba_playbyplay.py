@@ -4,33 +4,60 @@ Fetches play-by-play from NBA CDN live data endpoint.
 Layer: src/data (raw fetch only, no normalization).
 """
 
-import requests
+from src.data import conditional, json_decode
+from src.data.conditional import NotModified, ValidatorStore
+from src.data.json_stream import ItemStream
 
 
 NBA_PBP_URL_TEMPLATE = "https://cdn.nba.com/static/json/liveData/playbyplay/playbyplay_{game_id}.json"
 
 
-def fetch_playbyplay(game_id: str) -> dict:
+def fetch_playbyplay(
+    game_id: str, validators: ValidatorStore | None = None
+) -> dict | NotModified:
     """Fetch NBA official play-by-play for a specific game.
 
     Args:
         game_id: NBA game ID string (e.g., '0022400001').
+        validators: Optional ValidatorStore owned by the caller. When given,
+            the request is conditional and ``NOT_MODIFIED`` is returned on 304.
 
     Returns:
-        Raw NBA PBP JSON as dict.
+        Raw NBA PBP JSON as dict, or NOT_MODIFIED (see validators).
 
     Raises:
         requests.HTTPError: On non-2xx response.
     """
     url = NBA_PBP_URL_TEMPLATE.format(game_id=game_id)
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-        "Referer": "https://www.nba.com/",
-    }
-    resp = requests.get(url, headers=headers, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    # NBA CDN headers (UA/Referer) are the "nba" source defaults in http_client.
+    resp = conditional.get("nba", url, validators=validators)
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return json_decode.decode("nba", resp.content)
+
+
+def stream_playbyplay(
+    game_id: str, validators: ValidatorStore | None = None
+) -> ItemStream | NotModified:
+    """Fetch NBA play-by-play as a stream of actions, parsed while it downloads.
+
+    Args:
+        game_id: NBA game ID string.
+        validators: As for ``fetch_playbyplay``.
+
+    Returns:
+        An ``ItemStream`` of raw action dicts from ``game.actions``
+        (``stream.meta["game.gameId"]`` is set once the first action is
+        read), or NOT_MODIFIED. Iterate it to the end or ``close()`` it.
+
+    Raises:
+        requests.HTTPError: On non-2xx response.
+    """
+    url = NBA_PBP_URL_TEMPLATE.format(game_id=game_id)
+    resp = conditional.get("nba", url, validators=validators, stream=True)
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return ItemStream(resp, ("game", "actions"))
 
 
 if __name__ == "__main__":
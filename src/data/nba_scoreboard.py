@@ -1,40 +1,44 @@
 """NBA Official Scoreboard data fetcher.
 
-Fetches NBA scoreboard from the official NBA CDN / nba_api.
+Fetches NBA scoreboard from the official NBA CDN (today) or, for any other
+date, from nba_api via ``nba_history`` (same raw shape).
 Layer: src/data (raw fetch only, no normalization).
 """
 
-import requests
-from datetime import datetime
+from datetime import date as _date
+
+from src.data import conditional, json_decode, nba_history
+from src.data.conditional import NotModified, ValidatorStore
 
 
 NBA_SCOREBOARD_URL = "https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json"
 
 
-def fetch_scoreboard(date: str | None = None) -> dict:
+def fetch_scoreboard(
+    date: str | None = None, validators: ValidatorStore | None = None
+) -> dict | NotModified:
     """Fetch NBA official scoreboard.
 
     Args:
-        date: Date string in YYYY-MM-DD format. Currently fetches today's
-              scoreboard from CDN (date param reserved for future nba_api use).
+        date: Date string in YYYY-MM-DD or YYYYMMDD format. None or today
+            reads the live CDN file; other dates come from nba_api
+            (final scores only, cached; see ``nba_history``).
+        validators: Optional ValidatorStore owned by the caller. When given,
+            the CDN request is conditional and ``NOT_MODIFIED`` is returned
+            on 304. Historical dates ignore it.
 
     Returns:
-        Raw NBA scoreboard JSON as dict.
+        Raw NBA scoreboard JSON as dict, or NOT_MODIFIED (see validators).
 
     Raises:
         requests.HTTPError: On non-2xx response.
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-        "Referer": "https://www.nba.com/",
-    }
-
-    # CDN endpoint always returns today's games.
-    # For historical dates, swap to nba_api when ready.
-    resp = requests.get(NBA_SCOREBOARD_URL, headers=headers, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    if date and nba_history.parse_date(date) != _date.today():
+        return nba_history.fetch_date(date)
+    resp = conditional.get("nba", NBA_SCOREBOARD_URL, validators=validators)
+    if resp is conditional.NOT_MODIFIED:
+        return resp
+    return json_decode.decode("nba", resp.content)
 
 
 if __name__ == "__main__":
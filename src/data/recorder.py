@@ -0,0 +1,230 @@
+"""Record-and-replay of raw feed responses.
+
+``Recorder`` sits in front of the network (via ``http_client.set_transport``)
+and appends every response the fetchers receive, with its wall-clock
+timestamp, to a gzip-compressed JSON-lines file. ``ReplaySource`` serves a
+recording back through the same fetch API at 1x, Nx or max speed, honoring
+conditional requests, so adapters, state and UI can be exercised and
+benchmarked offline against a real game night.
+
+Usage:
+    with recording("nights/2026-02-28.jsonl.gz"):
+        fetch_scoreboard()            # hits the network, gets recorded
+
+    with replaying("nights/2026-02-28.jsonl.gz", speed=10):
+        fetch_scoreboard()            # served from the recording
+
+Layer: src/data (raw fetch only, no normalization).
+"""
+
+from __future__ import annotations
+
+import base64
+import bisect
+import contextlib
+import gzip
+import json
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from src.data import http_client
+from src.data.conditional import request_key
+
+if TYPE_CHECKING:
+    import requests
+
+
+# Response headers worth keeping (validators + decoding hints).
+_KEPT_HEADERS = ("ETag", "Last-Modified", "Content-Type", "Cache-Control")
+
+
+class Recorder:
+    """Transport that records every network response to ``path`` (append-only)."""
+
+    def __init__(self, path: str, inner=None):
+        self.path = path
+        self.inner = inner
+        self.count = 0
+        self._lock = threading.Lock()
+        self._fh = gzip.open(path, "at", encoding="utf-8")
+
+    def get(self, source, url, params=None, headers=None, timeout=None) -> requests.Response:
+        if self.inner is not None:
+            resp = self.inner.get(source, url, params, headers, timeout)
+        else:
+            resp = http_client.network_get(source, url, params, headers, timeout)
+        if resp.status_code != 304:  # a 304 carries no payload worth replaying
+            self.write(source, url, params, resp)
+        return resp
+
+    def write(self, source: str, url: str, params: dict | None, resp: requests.Response) -> None:
+        record = {
+            "t": time.time(),
+            "source": source,
+            "url": url,
+            "params": params or {},
+            "status": resp.status_code,
+            "headers": {k: resp.headers[k] for k in _KEPT_HEADERS if k in resp.headers},
+        }
+        content = resp.content
+        try:
+            record["body"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_b64"] = base64.b64encode(content).decode("ascii")
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._fh.write(line)
+            self._fh.flush()  # sync-flush: a crash loses at most the last record
+            self.count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
+
+
+def read_recording(path: str) -> Iterator[dict]:
+    """Yield records from a recording file (in write order).
+
+    A recording cut off by a crash (no gzip trailer) is read up to its last
+    complete record.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        try:
+            for line in fh:
+                line = line.strip()
+                if line:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:  # torn final line
+                        return
+        except EOFError:
+            return
+
+
+def record_body(record: dict) -> bytes:
+    """Response body of one ``read_recording`` record, as received."""
+    if "body" in record:
+        return record["body"].encode("utf-8")
+    return base64.b64decode(record.get("body_b64", ""))
+
+
+def _response(url: str, status: int, headers: dict, content: bytes) -> requests.Response:
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers)
+    resp._content = content
+    resp._content_consumed = True  # iter_content() serves _content
+    resp.url = url
+    resp.encoding = "utf-8"
+    resp.reason = "Not Modified" if status == 304 else ("OK" if status < 400 else "Replay")
+    return resp
+
+
+class ReplaySource:
+    """Transport that serves a recording instead of the network.
+
+    Args:
+        path: Recording written by ``Recorder``.
+        speed: Playback rate relative to the recorded night. ``1`` is real
+            time, ``10`` ten times faster. ``None`` (max speed) ignores time
+            and serves each URL's next recorded response on every request.
+        clock: Monotonic time source (injectable for tests).
+
+    Timed playback serves, for each URL, the latest response recorded at or
+    before the current replay time (the first one if the URL wasn't polled
+    yet). Requests for URLs never recorded get a 404.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        speed: float | None = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.speed = speed or None  # 0 means "max speed" too
+        self.clock = clock
+        self._by_key: dict[str, list[dict]] = {}
+        for record in read_recording(path):
+            key = request_key(record["url"], record["params"])
+            self._by_key.setdefault(key, []).append(record)
+        for records in self._by_key.values():
+            records.sort(key=lambda r: r["t"])
+        self._times = {k: [r["t"] for r in v] for k, v in self._by_key.items()}
+        self.start_t = min((v[0] for v in self._times.values()), default=0.0)
+        self.end_t = max((v[-1] for v in self._times.values()), default=0.0)
+        self._cursor: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._started: float | None = None
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._by_key)
+
+    def start(self) -> None:
+        """Start the replay clock (also happens on the first request)."""
+        self._started = self.clock()
+
+    def replay_time(self) -> float:
+        """Recorded wall-clock time the replay has reached."""
+        if self._started is None:
+            self.start()
+        return self.start_t + (self.clock() - self._started) * self.speed
+
+    @property
+    def finished(self) -> bool:
+        """True once every recorded response has been (or would be) served."""
+        if self.speed is None:
+            return all(
+                self._cursor.get(k, 0) >= len(v) for k, v in self._by_key.items()
+            )
+        return self.replay_time() >= self.end_t
+
+    def _pick(self, key: str) -> dict | None:
+        records = self._by_key.get(key)
+        if not records:
+            return None
+        with self._lock:
+            if self.speed is None:
+                i = self._cursor.get(key, 0)
+                self._cursor[key] = i + 1
+                return records[min(i, len(records) - 1)]
+            i = bisect.bisect_right(self._times[key], self.replay_time()) - 1
+            return records[max(i, 0)]
+
+    def get(self, source, url, params=None, headers=None, timeout=None) -> requests.Response:
+        key = request_key(url, params)
+        record = self._pick(key)
+        if record is None:
+            return _response(url, 404, {}, b'{"error": "not in recording"}')
+        rec_headers = record.get("headers", {})
+        etag = rec_headers.get("ETag")
+        if etag and headers and headers.get("If-None-Match") == etag:
+            return _response(url, 304, rec_headers, b"")
+        return _response(url, record["status"], rec_headers, record_body(record))
+
+
+@contextlib.contextmanager
+def recording(path: str):
+    """Record every fetch made inside the block to ``path``."""
+    recorder = Recorder(path, inner=http_client._transport)
+    previous = http_client.set_transport(recorder)
+    try:
+        yield recorder
+    finally:
+        http_client.set_transport(previous)
+        recorder.close()
+
+
+@contextlib.contextmanager
+def replaying(path: str, speed: float | None = 1.0):
+    """Serve every fetch made inside the block from the recording at ``path``."""
+    source = ReplaySource(path, speed=speed)
+    previous = http_client.set_transport(source)
+    try:
+        yield source
+    finally:
+        http_client.set_transport(previous)
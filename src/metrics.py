@@ -0,0 +1,256 @@
+"""Process-wide hot-path metrics: stage timers and counters.
+
+The fetchers, adapters and panels report into one registry: time per
+stage (``fetch``, ``decode``, ``normalize``, ``render``, labelled by
+source / panel), bytes received, games and events normalized, cache
+results and errors by source. ``snapshot()`` returns JSON-ready totals with
+each stage's share of the time spent, ``prometheus()`` the text exposition
+format, and ``report()`` a table with the slowest stage first.
+
+Off by default: when disabled every hook is one flag check, so
+instrumented code runs at full speed. Turn it on with ``enable()`` or
+``NBA_LAB_METRICS=1``.
+
+Usage:
+    metrics.enable()
+    ... poll, normalize, render ...
+    print(metrics.report())
+
+Layer: shared leaf (stdlib only, imports nothing from src); any layer may use it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+PREFIX = "nbalab_"
+
+# (stage or counter name, sorted label pairs)
+_Key = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class StageStats:
+    """Time totals for one (stage, labels)."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.seconds * 1000 / self.calls if self.calls else 0.0
+
+
+_enabled = os.environ.get("NBA_LAB_METRICS", "") not in ("", "0")
+_lock = threading.Lock()
+_stages: dict[_Key, StageStats] = {}
+_counters: dict[_Key, float] = {}
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def disable() -> None:
+    enable(False)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Drop every recorded value (the enabled flag is kept)."""
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+
+
+def _key(name: str, labels: dict) -> _Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# --- Recording ---
+
+
+def observe(stage: str, seconds: float, **labels) -> None:
+    """Record one timed run of ``stage``."""
+    if not _enabled:
+        return
+    key = _key(stage, labels)
+    with _lock:
+        st = _stages.get(key)
+        if st is None:
+            st = _stages[key] = StageStats()
+        st.calls += 1
+        st.seconds += seconds
+        if seconds > st.max_seconds:
+            st.max_seconds = seconds
+
+
+def count(name: str, value: float = 1, **labels) -> None:
+    """Add ``value`` to counter ``name``."""
+    if not _enabled:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+@contextlib.contextmanager
+def _timing(stage: str, labels: dict) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start, **labels)
+
+
+def timer(stage: str, **labels) -> contextlib.AbstractContextManager:
+    """Context manager timing its block under ``stage`` (no-op when disabled)."""
+    if not _enabled:
+        return contextlib.nullcontext()
+    return _timing(stage, labels)
+
+
+def timed(stage: str, counter: str | None = None, **labels) -> Callable:
+    """Decorator: time each call under ``stage``.
+
+    Args:
+        stage: Stage name, e.g. "normalize".
+        counter: Also add ``len(result)`` to this counter, e.g.
+            "events_normalized".
+        **labels: Fixed labels, e.g. ``source="nba"``.
+    """
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            observe(stage, time.perf_counter() - start, **labels)
+            if counter is not None:
+                count(counter, len(result), **labels)
+            return result
+        return wrapper
+    return decorate
+
+
+# --- Export ---
+
+
+def cache_hit_ratios() -> dict[str, float]:
+    """Hit ratio per cache, from ``cache_requests`` counters.
+
+    ``hit`` and ``not_modified`` results count as hits.
+    """
+    totals: dict[str, list[float]] = {}
+    with _lock:
+        items = [(dict(labels), v) for (name, labels), v in _counters.items() if name == "cache_requests"]
+    for labels, value in items:
+        hits_total = totals.setdefault(labels.get("cache", ""), [0.0, 0.0])
+        hits_total[1] += value
+        if labels.get("result") in ("hit", "not_modified"):
+            hits_total[0] += value
+    return {cache: hits / total for cache, (hits, total) in totals.items() if total}
+
+
+def snapshot() -> dict:
+    """All metrics as plain data; stages sorted by total time, slowest first."""
+    with _lock:
+        stages = [(name, labels, StageStats(s.calls, s.seconds, s.max_seconds))
+                  for (name, labels), s in _stages.items()]
+        counters = [(name, labels, v) for (name, labels), v in _counters.items()]
+    total = sum(s.seconds for _, _, s in stages)
+    stages.sort(key=lambda row: row[2].seconds, reverse=True)
+    return {
+        "enabled": _enabled,
+        "stages": [
+            {
+                "stage": name, "labels": dict(labels), "calls": s.calls,
+                "seconds": s.seconds, "mean_ms": s.mean_ms, "max_ms": s.max_seconds * 1000,
+                "share": s.seconds / total if total else 0.0,
+            }
+            for name, labels, s in stages
+        ],
+        "counters": [
+            {"name": name, "labels": dict(labels), "value": v}
+            for name, labels, v in sorted(counters)
+        ],
+        "cache_hit_ratio": cache_hit_ratios(),
+    }
+
+
+def _prom_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in labels.values())
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+def _num(value: float) -> str:
+    return str(int(value)) if value == int(value) else repr(value)
+
+
+def _with_stage(row: dict) -> dict:
+    return {"stage": row["stage"], **row["labels"]}
+
+
+def prometheus() -> str:
+    """Prometheus text exposition of every metric."""
+    snap = snapshot()
+    lines = []
+    if snap["stages"]:
+        name = f"{PREFIX}stage_seconds"
+        lines.append(f"# HELP {name} Time spent per pipeline stage.")
+        lines.append(f"# TYPE {name} summary")
+        for row in snap["stages"]:
+            labels = _prom_labels(_with_stage(row))
+            lines.append(f"{name}_count{labels} {row['calls']}")
+            lines.append(f"{name}_sum{labels} {row['seconds']:.6f}")
+        lines.append(f"# TYPE {name}_max gauge")
+        for row in snap["stages"]:
+            lines.append(f"{name}_max{_prom_labels(_with_stage(row))} {row['max_ms'] / 1000:.6f}")
+    seen = set()
+    for row in snap["counters"]:
+        name = f"{PREFIX}{row['name']}_total"
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_prom_labels(row['labels'])} {_num(row['value'])}")
+    if snap["cache_hit_ratio"]:
+        name = f"{PREFIX}cache_hit_ratio"
+        lines.append(f"# TYPE {name} gauge")
+        for cache, ratio in sorted(snap["cache_hit_ratio"].items()):
+            lines.append(f"{name}{_prom_labels({'cache': cache})} {ratio:.4f}")
+    return "\n".join(lines) + "\n"
+
+
+def report() -> str:
+    """Text table of stages (slowest first), counters and cache hit ratios."""
+    snap = snapshot()
+    if not snap["stages"] and not snap["counters"]:
+        return "No metrics recorded" + ("." if snap["enabled"] else " (metrics disabled).")
+    header = f"{'Stage':<12} {'Labels':<26} {'Calls':>7} {'Total ms':>10} {'Mean ms':>9} {'Max ms':>9} {'Share':>6}"
+    lines = [header, "-" * len(header)]
+    for row in snap["stages"]:
+        labels = ",".join(f"{k}={v}" for k, v in row["labels"].items())
+        lines.append(
+            f"{row['stage']:<12} {labels:<26} {row['calls']:>7} {row['seconds'] * 1000:>10.1f} "
+            f"{row['mean_ms']:>9.2f} {row['max_ms']:>9.2f} {row['share']:>6.0%}"
+        )
+    for row in snap["counters"]:
+        labels = ",".join(f"{k}={v}" for k, v in row["labels"].items())
+        lines.append(f"{row['name']}{{{labels}}} = {row['value']:g}")
+    for cache, ratio in sorted(snap["cache_hit_ratio"].items()):
+        lines.append(f"cache hit ratio {cache}: {ratio:.0%}")
+    return "\n".join(lines)
@@ -0,0 +1,251 @@
+"""Historical backfill: ESPN scoreboards + play-by-play into the PBP archive.
+
+Walks a date range, fetches each date's scoreboard, fans out to the
+play-by-play of every final game, and writes each game's normalized events
+to ``src/storage/pbp_store``. Fetches run on a bounded thread pool (I/O)
+that saves each raw body under ``<root>/_incoming/``. Normalizing and
+writing run on a process pool (CPU) that is handed the file path, so no
+payload is pickled across processes and no I/O thread waits on the CPU
+pool. Memory stays flat however long the range.
+
+Progress is checkpointed to ``<root>/_backfill.json`` (finished dates and
+games, rewritten atomically); a rerun after a crash skips everything
+already archived. Wrap the run in ``disk_cache.caching`` to make repeated
+backfills read from disk.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable
+
+from src.adapters.playbyplay_adapter import normalize_espn_pbp
+from src.adapters.scoreboard_adapter import normalize_espn_scoreboard
+from src.data import espn_playbyplay, espn_scoreboard, json_decode
+from src.storage import pbp_store
+
+
+CHECKPOINT_NAME = "_backfill.json"
+INCOMING_DIR = "_incoming"  # downloaded summaries waiting for a CPU worker
+DEFAULT_IO_WORKERS = 16  # = http_client pool_maxsize: one keep-alive connection each
+CHECKPOINT_EVERY = 25  # games between checkpoint writes
+
+
+def date_range(start: str, end: str) -> list[str]:
+    """Inclusive list of YYYYMMDD dates from start to end."""
+    first = datetime.strptime(start, "%Y%m%d").date()
+    last = datetime.strptime(end, "%Y%m%d").date()
+    days = (last - first).days
+    return [(first + timedelta(days=i)).strftime("%Y%m%d") for i in range(days + 1)]
+
+
+def archive_game(root: str, game_id: str, raw: dict) -> int:
+    """Normalize one raw ESPN summary and write it to the archive.
+
+    Top-level so it can run in a worker process.
+
+    Returns:
+        Number of events written.
+    """
+    events = normalize_espn_pbp(raw, game_id)
+    pbp_store.write_game(root, game_id, events)
+    return len(events)
+
+
+def archive_file(root: str, game_id: str, path: str) -> int:
+    """``archive_game`` for a summary saved at ``path``; the file is removed.
+
+    Top-level so it can run in a worker process: only the path is pickled.
+    """
+    try:
+        with open(path, "rb") as fh:
+            raw = json_decode.decode("espn", fh.read())
+        return archive_game(root, game_id, raw)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+@dataclass
+class BackfillStats:
+    """Running totals for one backfill."""
+
+    dates: int = 0
+    games: int = 0
+    events: int = 0
+    skipped: int = 0  # already archived, or not final
+    failed: dict[str, str] = field(default_factory=dict)  # date or game_id -> error
+    elapsed: float = 0.0
+
+    @property
+    def games_per_sec(self) -> float:
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+class Checkpoint:
+    """Finished dates and games, persisted as JSON next to the archive."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dates: set[str] = set()
+        self.games: dict[str, int] = {}  # game_id -> events written
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+            self.dates = set(data.get("dates", []))
+            self.games = dict(data.get("games", {}))
+
+    def save(self) -> None:
+        tmp = f"{self.path}.tmp{os.getpid()}"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"dates": sorted(self.dates), "games": self.games}, fh)
+        os.replace(tmp, self.path)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs work in the calling thread (processes=0)."""
+
+    def submit(self, fn, *args) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class Backfill:
+    """One backfill run into an archive directory.
+
+    Args:
+        root: PBP archive directory (the checkpoint lives here too).
+        io_workers: Concurrent fetches.
+        processes: Normalization worker processes (0 = normalize in this
+            process; None = one per CPU).
+        on_progress: Called with the running BackfillStats after each game.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        io_workers: int = DEFAULT_IO_WORKERS,
+        processes: int | None = None,
+        on_progress: Callable[[BackfillStats], None] | None = None,
+    ):
+        self.root = root
+        self.io_workers = io_workers
+        self.processes = processes
+        self.on_progress = on_progress
+        os.makedirs(root, exist_ok=True)
+        self.checkpoint = Checkpoint(os.path.join(root, CHECKPOINT_NAME))
+        self.stats = BackfillStats()
+
+    def _scoreboard(self, date: str) -> tuple[list[str], int]:
+        """Final game ids on a date, and how many games aren't final yet."""
+        states = normalize_espn_scoreboard(espn_scoreboard.fetch_scoreboard(date))
+        finals = [s.game_id for s in states if s.is_final]
+        return finals, len(states) - len(finals)
+
+    def _download(self, game_id: str) -> str:
+        """Save one game's raw summary for a CPU worker; returns its path."""
+        body = espn_playbyplay.fetch_playbyplay_bytes(game_id)
+        path = os.path.join(self.root, INCOMING_DIR, f"{game_id}.json")
+        with open(path, "wb") as fh:
+            fh.write(body)
+        return path
+
+    def run(self, start: str, end: str) -> BackfillStats:
+        """Backfill every date from start to end (YYYYMMDD, inclusive)."""
+        dates = [d for d in date_range(start, end) if d not in self.checkpoint.dates]
+        archived = set(self.checkpoint.games)
+        began = time.perf_counter()
+        since_save = 0
+        os.makedirs(os.path.join(self.root, INCOMING_DIR), exist_ok=True)
+
+        cpu = ProcessPoolExecutor(self.processes) if self.processes != 0 else _InlineExecutor()
+        io = ThreadPoolExecutor(self.io_workers, thread_name_prefix="backfill-io")
+        # future -> ("date" | "game" (download) | "archive", date or game_id)
+        pending: dict[Future, tuple[str, str]] = {}
+        date_games: dict[str, set[str]] = {}  # date -> games still running
+        date_failed: set[str] = set()
+        try:
+            for d in dates:
+                pending[io.submit(self._scoreboard, d)] = ("date", d)
+            game_dates: dict[str, set[str]] = {}  # game_id -> dates listing it
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, key = pending.pop(future)
+                    error = future.exception()
+                    if kind == "date":
+                        if error is not None:
+                            self.stats.failed[key] = repr(error)
+                            continue
+                        self.stats.dates += 1
+                        finals, unfinished = future.result()
+                        self.stats.skipped += unfinished
+                        if unfinished:
+                            date_failed.add(key)  # revisit once those games end
+                        todo = set()
+                        for gid in finals:
+                            if gid in archived:
+                                self.stats.skipped += 1
+                                continue
+                            todo.add(gid)
+                            if gid in game_dates:  # already running (e.g. a postponed game on two dates)
+                                game_dates[gid].add(key)
+                                continue
+                            game_dates[gid] = {key}
+                            pending[io.submit(self._download, gid)] = ("game", gid)
+                        date_games[key] = todo
+                    elif kind == "game" and error is None:
+                        pending[cpu.submit(archive_file, self.root, key, future.result())] = ("archive", key)
+                        continue
+                    else:
+                        if error is not None:
+                            self.stats.failed[key] = repr(error)
+                        else:
+                            self.stats.games += 1
+                            self.stats.events += future.result()
+                            self.checkpoint.games[key] = future.result()
+                            archived.add(key)
+                            since_save += 1
+                        for d in game_dates.pop(key):
+                            if error is not None:
+                                date_failed.add(d)
+                            date_games[d].discard(key)
+                    for d in [d for d, games in date_games.items() if not games]:
+                        del date_games[d]
+                        if d not in date_failed:
+                            self.checkpoint.dates.add(d)
+                    self.stats.elapsed = time.perf_counter() - began
+                    if kind != "date" and self.on_progress is not None:
+                        self.on_progress(self.stats)
+                    if since_save >= CHECKPOINT_EVERY:
+                        self.checkpoint.save()
+                        since_save = 0
+        finally:
+            io.shutdown(wait=True, cancel_futures=True)
+            cpu.shutdown(wait=True)
+            self.checkpoint.save()
+            self.stats.elapsed = time.perf_counter() - began
+        return self.stats
+
+
+def backfill(root: str, start: str, end: str, **kwargs) -> BackfillStats:
+    """Run one backfill (see ``Backfill`` for options)."""
+    return Backfill(root, **kwargs).run(start, end)
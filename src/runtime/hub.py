@@ -0,0 +1,327 @@
+"""Local pub/sub hub: one copy of live state, pushed to many subscribers.
+
+``StateHub`` keeps the latest GameState per game and the recent PBPEvents,
+and turns every change into a numbered message: ``game`` (full state, first
+sighting), ``game_diff`` (changed fields only) or ``pbp`` (added / updated
+/ removed events). Each message is JSON-encoded once and the same bytes go
+to every subscriber, so fan-out cost doesn't grow with payload parsing.
+
+``HubServer`` serves it over Server-Sent Events on asyncio streams:
+``GET /events`` sends a ``snapshot`` (all games + recent events) and then
+the live messages; ``?games=id1,id2`` filters by game. ``GET /snapshot``
+and ``GET /health`` return JSON; ``GET /metrics`` serves ``src.metrics`` as
+Prometheus text (``?format=json`` for the snapshot). A subscriber that falls more than
+``max_queue`` messages behind is disconnected; reconnecting gets a fresh
+snapshot. Upstream polling lives in ``hub_poller``; nothing here fetches.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+from collections import deque
+from typing import TYPE_CHECKING, AsyncIterator, Iterable
+from urllib.parse import parse_qs, urlsplit
+
+from src import metrics
+from src.state.game_state import GameState
+
+if TYPE_CHECKING:
+    from src.adapters.playbyplay_adapter import PBPDelta
+
+
+DEFAULT_MAX_QUEUE = 1000  # messages buffered per subscriber before it's dropped
+DEFAULT_RECENT_EVENTS = 50  # PBP events per game kept for snapshots
+HEARTBEAT_SECONDS = 15.0
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def sse_frame(event: str, data: str, seq: int | None = None) -> bytes:
+    """One Server-Sent Events frame."""
+    head = f"id: {seq}\n" if seq is not None else ""
+    return f"{head}event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+@dataclasses.dataclass
+class Message:
+    """One published change, encoded once for every subscriber."""
+
+    seq: int
+    kind: str  # "game" | "game_diff" | "pbp"
+    game_id: str
+    frame: bytes
+
+
+class Subscriber:
+    """One connected consumer: a bounded queue of pending messages."""
+
+    def __init__(self, game_ids: set[str] | None, max_queue: int):
+        self.game_ids = game_ids
+        self.max_queue = max_queue
+        self.lagged = False
+        self.closed = False
+        self._pending: deque[Message] = deque()
+        self._wake = asyncio.Event()
+
+    def wants(self, message: Message) -> bool:
+        return self.game_ids is None or message.game_id in self.game_ids
+
+    def push(self, message: Message) -> None:
+        if self.lagged:
+            return
+        if len(self._pending) >= self.max_queue:
+            self.lagged = True  # too slow: drop it; it reconnects for a snapshot
+            self._pending.clear()
+        else:
+            self._pending.append(message)
+        self._wake.set()
+
+    def close(self) -> None:
+        """Stop waiting (the client went away)."""
+        self.closed = True
+        self._wake.set()
+
+    async def next_batch(self, timeout: float | None = None) -> list[Message]:
+        """Pending messages, waiting up to ``timeout`` for at least one."""
+        if not self._pending and not self.lagged and not self.closed:
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+
+class StateHub:
+    """Latest state per game plus a sequenced change stream.
+
+    Call ``publish_*`` from the event loop that subscribers run on.
+
+    Args:
+        max_queue: Messages buffered per subscriber before it is dropped.
+        recent_events: PBP events kept per game for the connect snapshot.
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE, recent_events: int = DEFAULT_RECENT_EVENTS):
+        self.max_queue = max_queue
+        self.recent_events = recent_events
+        self.seq = 0
+        self._states: dict[str, dict] = {}
+        self._events: dict[str, deque[dict]] = {}
+        self._subscribers: set[Subscriber] = set()
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def state(self, game_id: str) -> dict | None:
+        return self._states.get(game_id)
+
+    # --- Publishing ---
+
+    def publish_state(self, state: GameState) -> Message | None:
+        """Publish a GameState; returns None when nothing changed."""
+        new = dataclasses.asdict(state)
+        old = self._states.get(state.game_id)
+        self._states[state.game_id] = new
+        if old is None:
+            return self._broadcast("game", state.game_id, new)
+        changes = {k: v for k, v in new.items() if old.get(k) != v}
+        if not changes:
+            return None
+        return self._broadcast("game_diff", state.game_id, {"game_id": state.game_id, "changes": changes})
+
+    def publish_states(self, states: Iterable[GameState]) -> list[Message]:
+        return [m for m in (self.publish_state(s) for s in states) if m is not None]
+
+    def publish_pbp(self, game_id: str, delta: PBPDelta) -> Message | None:
+        """Publish one PBPCursor delta for a game (None if empty)."""
+        if not delta:
+            return None
+        added = [dataclasses.asdict(e) for e in delta.added]
+        updated = [dataclasses.asdict(e) for e in delta.updated]
+        recent = self._events.setdefault(game_id, deque(maxlen=self.recent_events))
+        if delta.removed or updated:
+            changed = {e["event_id"]: e for e in updated}
+            gone = set(delta.removed)
+            kept = [changed.get(e["event_id"], e) for e in recent if e["event_id"] not in gone]
+            recent.clear()
+            recent.extend(kept)
+        recent.extend(added)
+        return self._broadcast("pbp", game_id, {
+            "game_id": game_id, "added": added, "updated": updated, "removed": list(delta.removed),
+        })
+
+    def _broadcast(self, kind: str, game_id: str, payload: dict) -> Message:
+        self.seq += 1
+        message = Message(self.seq, kind, game_id, sse_frame(kind, _dumps(payload), self.seq))
+        for sub in self._subscribers:
+            if sub.wants(message):
+                sub.push(message)
+        return message
+
+    # --- Subscribing ---
+
+    def snapshot(self, game_ids: set[str] | None = None) -> dict:
+        """Current states and recent events, as of ``seq``."""
+        keep = (lambda gid: True) if game_ids is None else (lambda gid: gid in game_ids)
+        return {
+            "seq": self.seq,
+            "games": [s for gid, s in self._states.items() if keep(gid)],
+            "events": {gid: list(evs) for gid, evs in self._events.items() if keep(gid)},
+        }
+
+    def subscribe(self, game_ids: set[str] | None = None) -> tuple[Subscriber, bytes]:
+        """Register a subscriber; returns it with its snapshot frame.
+
+        No await between the snapshot and the registration, so the
+        subscriber sees every message after ``snapshot["seq"]``.
+        """
+        sub = Subscriber(game_ids, self.max_queue)
+        self._subscribers.add(sub)
+        return sub, sse_frame("snapshot", _dumps(self.snapshot(game_ids)), self.seq)
+
+    def unsubscribe(self, sub: Subscriber) -> None:
+        self._subscribers.discard(sub)
+
+
+class HubServer:
+    """SSE front end for a StateHub (asyncio streams, HTTP/1.1).
+
+    Args:
+        hub: The StateHub to serve.
+        host, port: Listen address (port 0 picks a free port).
+        heartbeat: Seconds of silence before a keep-alive comment is sent.
+    """
+
+    def __init__(self, hub: StateHub, host: str = "127.0.0.1", port: int = 8765,
+                 heartbeat: float = HEARTBEAT_SECONDS):
+        self.hub = hub
+        self.host = host
+        self.port = port
+        self.heartbeat = heartbeat
+        self._server: asyncio.AbstractServer | None = None
+        self._handlers: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._handlers):
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            request = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass  # headers: nothing we need
+            parts = request.decode("latin-1").split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._respond(writer, 405, {"error": "GET only"})
+                return
+            url = urlsplit(parts[1])
+            query = parse_qs(url.query)
+            games = set(",".join(query["games"]).split(",")) if "games" in query else None
+            if url.path == "/events":
+                await self._stream(reader, writer, games)
+            elif url.path == "/snapshot":
+                await self._respond(writer, 200, self.hub.snapshot(games))
+            elif url.path == "/metrics":
+                if query.get("format") == ["json"]:
+                    await self._respond(writer, 200, metrics.snapshot())
+                else:
+                    await self._respond(writer, 200, metrics.prometheus())
+            elif url.path == "/health":
+                await self._respond(writer, 200, {"seq": self.hub.seq, "subscribers": self.hub.subscribers})
+            else:
+                await self._respond(writer, 404, {"error": "not found"})
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: dict | str) -> None:
+        """Send ``body`` as JSON, or as plain text when it is a str."""
+        if isinstance(body, str):
+            data, content_type = body.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            data, content_type = _dumps(body).encode("utf-8"), "application/json"
+        reason = {200: "OK", 404: "Not Found", 405: "Method Not Allowed"}[status]
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode("latin-1") + data
+        )
+        await writer.drain()
+
+    async def _stream(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                      games: set[str] | None) -> None:
+        sub, snapshot = self.hub.subscribe(games)
+        # The client never sends after the request: EOF means it went away.
+        eof = asyncio.ensure_future(reader.read())
+        eof.add_done_callback(lambda _: sub.close())
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n" + snapshot
+            )
+            await writer.drain()
+            while not (sub.lagged or sub.closed):
+                batch = await sub.next_batch(self.heartbeat)
+                if sub.lagged or sub.closed:
+                    break
+                writer.write(b"".join(m.frame for m in batch) if batch else b": ping\n\n")
+                await writer.drain()
+        finally:
+            eof.cancel()
+            self.hub.unsubscribe(sub)
+
+
+async def read_events(
+    host: str, port: int, games: Iterable[str] | None = None,
+) -> AsyncIterator[tuple[str, dict]]:
+    """Minimal SSE client for a HubServer: yields (event, data) pairs.
+
+    The first pair is the ``snapshot``; the iterator ends when the server
+    closes the stream.
+    """
+    path = "/events" + (f"?games={','.join(games)}" if games else "")
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+        await writer.drain()
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        event, data = "message", []
+        async for raw in reader:
+            line = raw.decode("utf-8").rstrip("\n")
+            if not line:
+                if data:
+                    yield event, json.loads("\n".join(data))
+                event, data = "message", []
+            elif line.startswith("event: "):
+                event = line[7:]
+            elif line.startswith("data: "):
+                data.append(line[6:])
+    finally:
+        writer.close()
@@ -0,0 +1,181 @@
+"""Upstream polling for the state hub: fetch and reduce once, publish to all.
+
+``HubPoller`` owns the only upstream traffic: a merged scoreboard poll on a
+fixed interval, plus play-by-play for live games on the adaptive
+``PollScheduler`` cadence. Each PBP poll goes through a per-game
+``PBPCursor`` (only new actions are normalized) and ``PBPReducer``; the
+delta and the reduced GameState are published to the ``StateHub``. Request
+volume depends on the games being played, never on how many clients are
+subscribed.
+
+Blocking fetches run in worker threads (``asyncio.to_thread``); all hub
+publishing happens on the event loop.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+
+from src.adapters.playbyplay_adapter import PBPCursor
+from src.adapters.scoreboard_merge import progress
+from src.data import espn_playbyplay, nba_playbyplay
+from src.data.conditional import ValidatorStore
+from src.runtime.hub import StateHub
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src.runtime.scheduler import PollScheduler
+from src.state.game_state import GameState
+from src.state.pbp_reducer import PBPReducer
+
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SCOREBOARD_INTERVAL = 10.0
+MAX_PBP_SLEEP = 2.0
+
+
+@dataclasses.dataclass
+class _Tracked:
+    """PBP polling state for one live game."""
+
+    source: str  # PBP source: "nba" | "espn"
+    pbp_id: str  # game id in that source
+    cursor: PBPCursor
+    reducer: PBPReducer
+    validators: ValidatorStore = dataclasses.field(default_factory=ValidatorStore)
+
+
+def _pbp_target(state: GameState) -> tuple[str, str]:
+    """(source, id) to poll PBP from for a merged scoreboard state."""
+    if state.extra.get("nba_game_id"):
+        return "nba", state.extra["nba_game_id"]
+    if state.extra.get("espn_game_id"):
+        return "espn", state.extra["espn_game_id"]
+    return state.source, state.game_id
+
+
+class HubPoller:
+    """Feeds a StateHub from upstream.
+
+    Args:
+        hub: Where to publish.
+        scoreboard: Merged scoreboard poller (default: both sources).
+        scheduler: PBP poll scheduler (default budgets).
+        scoreboard_interval: Seconds between scoreboard polls.
+        pbp: Poll play-by-play for live games (False = scoreboards only).
+        date: Scoreboard date (None = today).
+    """
+
+    def __init__(
+        self,
+        hub: StateHub,
+        scoreboard: MergedScoreboard | None = None,
+        scheduler: PollScheduler | None = None,
+        scoreboard_interval: float = DEFAULT_SCOREBOARD_INTERVAL,
+        pbp: bool = True,
+        date: str | None = None,
+    ):
+        self.hub = hub
+        self.scoreboard = scoreboard or MergedScoreboard()
+        self.scheduler = scheduler or PollScheduler()
+        self.scoreboard_interval = scoreboard_interval
+        self.pbp = pbp
+        self.date = date
+        self.upstream_requests = 0
+        self._latest: dict[str, GameState] = {}
+        self._tracked: dict[str, _Tracked] = {}
+        self._wake = asyncio.Event()
+
+    def _publish(self, state: GameState, only_if_ahead: bool = False) -> None:
+        """Publish unless we already hold a state further into the game.
+
+        ``only_if_ahead``: publish only when strictly further along (the
+        scoreboard view of a game whose PBP we reduce ourselves).
+        """
+        current = self._latest.get(state.game_id)
+        if current is not None:
+            if progress(state) < progress(current):
+                return
+            if only_if_ahead and progress(state) == progress(current):
+                return
+        self._latest[state.game_id] = state
+        self.hub.publish_state(state)
+
+    # --- Scoreboard ---
+
+    async def poll_scoreboard(self) -> None:
+        result = await asyncio.to_thread(self.scoreboard.poll, self.date)
+        self.upstream_requests += len(self.scoreboard.sources)
+        for source, error in result.errors.items():
+            log.warning("%s scoreboard failed: %s", source, error)
+        for state in result.states:
+            self._publish(state, only_if_ahead=state.game_id in self._tracked)
+            if self.pbp and state.game_id not in self._tracked and state.status == "in":
+                self._track(state)
+
+    def _track(self, state: GameState) -> None:
+        source, pbp_id = _pbp_target(state)
+        base = dataclasses.replace(state, extra=dict(state.extra))
+        self._tracked[state.game_id] = _Tracked(
+            source=source,
+            pbp_id=pbp_id,
+            cursor=PBPCursor(source, state.game_id),
+            reducer=PBPReducer(base),
+        )
+        self.scheduler.track(state, source)
+        self._wake.set()
+
+    # --- Play-by-play ---
+
+    def _fetch_pbp(self, tracked: _Tracked):
+        module = nba_playbyplay if tracked.source == "nba" else espn_playbyplay
+        return module.fetch_playbyplay(tracked.pbp_id, validators=tracked.validators)
+
+    async def poll_pbp(self, game_id: str) -> None:
+        tracked = self._tracked[game_id]
+        try:
+            raw = await asyncio.to_thread(self._fetch_pbp, tracked)
+        except Exception as e:
+            log.warning("PBP %s failed: %s", game_id, e)
+            self.scheduler.mark_failed(game_id)
+            return
+        finally:
+            self.upstream_requests += 1
+        delta = tracked.cursor.update(raw)
+        state = tracked.reducer.apply_delta(delta) if delta else tracked.reducer.state
+        self.hub.publish_pbp(game_id, delta)
+        self._publish(dataclasses.replace(state, extra=dict(state.extra)))
+        self.scheduler.update(state)
+        if state.is_final:
+            self.scheduler.remove(game_id)
+
+    # --- Loops ---
+
+    async def _scoreboard_loop(self) -> None:
+        while True:
+            try:
+                await self.poll_scoreboard()
+            except Exception as e:  # keep serving the last state
+                log.warning("scoreboard poll failed: %s", e)
+            await asyncio.sleep(self.scoreboard_interval)
+
+    async def _pbp_loop(self) -> None:
+        while True:
+            due = self.scheduler.due()
+            if due:
+                await asyncio.gather(*(self.poll_pbp(gid) for gid in due))
+            self._wake.clear()
+            wait = min(self.scheduler.next_wakeup(), MAX_PBP_SLEEP)
+            try:
+                await asyncio.wait_for(self._wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self) -> None:
+        """Poll until cancelled."""
+        loops = [self._scoreboard_loop()]
+        if self.pbp:
+            loops.append(self._pbp_loop())
+        await asyncio.gather(*loops)
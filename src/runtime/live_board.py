@@ -0,0 +1,122 @@
+"""Shared, status-aware cached scoreboard for dashboards.
+
+One ``LiveBoard`` per date serves every dashboard session: ``get()``
+returns the last merged scoreboard and only polls upstream once it is
+stale, with staleness tied to game status (live games seconds, pregame a
+minute, all-final boards never). A "today" board (``date=None``) is the
+exception: the same request serves tomorrow's slate, so an all-final
+today board is re-checked every ``TODAY_FINAL_TTL``. Concurrent callers share one fetch.
+Each game carries a version that bumps only when its state changes, so
+renderers can redo just the games that moved.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src.state.game_state import GameState
+
+
+# Seconds a board stays fresh, by the least settled game on it. None = forever.
+STATUS_TTLS: dict[str, float | None] = {"in": 5.0, "pre": 60.0, "post": None}
+EMPTY_TTL = 60.0  # no games (yet)
+TODAY_FINAL_TTL = 300.0  # all-final board for date=None: the slate rolls over
+
+
+def board_ttl(states: list[GameState]) -> float | None:
+    """Freshness of a board: the shortest TTL of any game's status."""
+    if not states:
+        return EMPTY_TTL
+    ttls = [STATUS_TTLS.get("post" if s.is_final else s.status, EMPTY_TTL) for s in states]
+    finite = [t for t in ttls if t is not None]
+    return min(finite) if finite else None
+
+
+@dataclass
+class BoardSnapshot:
+    """One read of a LiveBoard."""
+
+    states: list[GameState] = field(default_factory=list)
+    versions: dict[str, int] = field(default_factory=dict)  # game_id -> bumps on change
+    fetched_at: float = 0.0
+    ttl: float | None = EMPTY_TTL
+    errors: dict[str, str] = field(default_factory=dict)  # source -> last poll error
+
+
+def _fingerprint(state: GameState) -> tuple:
+    return tuple(getattr(state, f.name) if f.name != "extra" else repr(sorted(state.extra.items()))
+                 for f in dataclasses.fields(state))
+
+
+class LiveBoard:
+    """Merged scoreboard for one date, refreshed only when stale.
+
+    Args:
+        date: YYYYMMDD, or None for today.
+        poller: MergedScoreboard to poll with (keeps conditional-request state).
+        clock: Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        date: str | None = None,
+        poller: MergedScoreboard | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.date = date
+        self.poller = poller or MergedScoreboard()
+        self.clock = clock
+        self.polls = 0
+        self._snapshot: BoardSnapshot | None = None
+        self._prints: dict[str, tuple] = {}
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def stale(self) -> bool:
+        snap = self._snapshot
+        if snap is None:
+            return True
+        return snap.ttl is not None and self.clock() - snap.fetched_at >= snap.ttl
+
+    def get(self) -> BoardSnapshot:
+        """The current board, polling upstream first if it is stale."""
+        if not self.stale():
+            return self._snapshot
+        with self._lock:
+            if self.stale():  # another session may have refreshed it meanwhile
+                self._refresh()
+            return self._snapshot
+
+    def _refresh(self) -> None:
+        result = self.poller.poll(self.date)
+        self.polls += 1
+        errors = {src: str(e) for src, e in result.errors.items()}
+        if not result.states and self._snapshot is not None and errors:
+            # Every source failed: keep serving the last board, retry after the short TTL.
+            self._snapshot = dataclasses.replace(
+                self._snapshot, fetched_at=self.clock(), ttl=STATUS_TTLS["in"], errors=errors)
+            return
+        for state in result.states:
+            fp = _fingerprint(state)
+            if self._prints.get(state.game_id) != fp:
+                self._prints[state.game_id] = fp
+                self._versions[state.game_id] = self._versions.get(state.game_id, 0) + 1
+        self._snapshot = BoardSnapshot(
+            states=result.states,
+            versions={s.game_id: self._versions[s.game_id] for s in result.states},
+            fetched_at=self.clock(),
+            ttl=self._ttl(result.states),
+            errors=errors,
+        )
+
+    def _ttl(self, states: list[GameState]) -> float | None:
+        ttl = board_ttl(states)
+        if ttl is None and self.date is None:
+            return TODAY_FINAL_TTL
+        return ttl
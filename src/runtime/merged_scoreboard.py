@@ -0,0 +1,112 @@
+"""Poll ESPN and NBA scoreboards concurrently and merge them per game.
+
+Both scoreboards are fetched in parallel with a shared timeout; each is
+normalized and the two are merged by ``merge_scoreboards``, so every game
+shows whichever feed is further along. If one source fails or times out
+the other is served alone (failover); conditional requests keep each
+source's last normalized board when it answers 304.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+
+from src.adapters.scoreboard_adapter import normalize_espn_scoreboard, normalize_nba_scoreboard
+from src.adapters.scoreboard_merge import merge_scoreboards
+from src.data import espn_scoreboard, nba_scoreboard
+from src.data.conditional import ValidatorStore, is_not_modified
+from src.state.game_state import GameState
+
+
+DEFAULT_TIMEOUT = 8.0
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="scoreboard-fetch")
+
+
+@dataclass
+class MergeResult:
+    """One merged poll. ``errors`` holds sources that failed this poll."""
+
+    states: list[GameState] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)  # source -> error
+    elapsed: dict[str, float] = field(default_factory=dict)  # source -> fetch seconds
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class MergedScoreboard:
+    """Stateful merged-scoreboard poller (one per polling loop).
+
+    Args:
+        prefer: Source that wins ties between equally fresh feeds.
+        timeout: Seconds to wait for both fetches.
+        sources: Sources to poll (default both).
+    """
+
+    def __init__(
+        self,
+        prefer: str = "nba",
+        timeout: float = DEFAULT_TIMEOUT,
+        sources: tuple[str, ...] = ("espn", "nba"),
+    ):
+        self.prefer = prefer
+        self.timeout = timeout
+        self.sources = sources
+        self._validators = {s: ValidatorStore() for s in sources}
+        self._last: dict[str, list[GameState]] = {s: [] for s in sources}
+        # Sources whose last poll failed: their validators may have been
+        # refreshed by a late response we never stored, so drop them first.
+        self._stale: set[str] = set()
+
+    def _fetch(self, source: str, date: str | None) -> tuple[list[GameState], float]:
+        start = time.perf_counter()
+        if source in self._stale:
+            self._stale.discard(source)
+            self._validators[source].forget()
+        if source == "espn":
+            raw = espn_scoreboard.fetch_scoreboard(date, validators=self._validators[source])
+            normalize = normalize_espn_scoreboard
+        else:
+            raw = nba_scoreboard.fetch_scoreboard(date, validators=self._validators[source])
+            normalize = normalize_nba_scoreboard
+        states = self._last[source] if is_not_modified(raw) else normalize(raw)
+        return states, time.perf_counter() - start
+
+    def poll(self, date: str | None = None) -> MergeResult:
+        """Fetch both sources concurrently and merge.
+
+        Args:
+            date: YYYYMMDD, or None for today. For past dates NBA comes from
+                nba_api (final scores, cached; see ``nba_history``).
+        """
+        futures = {s: _executor.submit(self._fetch, s, date) for s in self.sources}
+        deadline = time.monotonic() + self.timeout
+        result = MergeResult()
+        boards: dict[str, list[GameState]] = {}
+        for source, future in futures.items():
+            try:
+                states, elapsed = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeout:
+                future.cancel()
+                result.errors[source] = TimeoutError(f"{source} scoreboard timed out after {self.timeout}s")
+                self._stale.add(source)
+            except Exception as e:
+                result.errors[source] = e
+                self._stale.add(source)
+            else:
+                boards[source] = self._last[source] = states
+                result.elapsed[source] = elapsed
+        result.states = merge_scoreboards(boards.get("espn", []), boards.get("nba", []), self.prefer)
+        return result
+
+
+def fetch_merged_scoreboard(date: str | None = None, prefer: str = "nba",
+                            timeout: float = DEFAULT_TIMEOUT) -> MergeResult:
+    """One-shot merged scoreboard (no conditional-request state kept)."""
+    return MergedScoreboard(prefer=prefer, timeout=timeout).poll(date)
@@ -0,0 +1,166 @@
+"""Opt-in sampling profiler for the experiment runners.
+
+``SamplingProfiler`` runs a daemon thread that snapshots one target
+thread's Python stack every ``interval`` seconds (``sys._current_frames``),
+so the profiled code runs unmodified and the cost stays flat whatever
+the call rate. While sampling, the interpreter's GIL switch interval is
+lowered to the sampling interval so the sampler actually gets to run
+between bytecodes of a CPU-bound poll. Samples are counted per distinct stack and aggregate across
+every poll iteration run inside the block.
+
+Output:
+    ``collapsed()`` / ``write_collapsed()``: folded stacks, one
+    ``frame;frame;frame count`` line per stack (flamegraph.pl, inferno,
+    speedscope). ``functions()`` / ``report()``: per-function self and total
+    time, hottest first.
+
+Usage:
+    with SamplingProfiler() as prof:
+        for _ in range(50):
+            poll_once()
+    prof.write_collapsed("poll.folded")
+    print(prof.report())
+
+Layer: src/runtime (tooling for the runners; imports nothing from src)
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import FrameType
+from typing import Callable
+
+DEFAULT_INTERVAL = 0.001  # seconds between samples
+MAX_DEPTH = 128
+
+
+@dataclass
+class FunctionStats:
+    """Samples attributed to one function."""
+
+    name: str
+    self_samples: int = 0  # samples with this function on top of the stack
+    total_samples: int = 0  # samples with this function anywhere on the stack
+
+
+def frame_label(frame: FrameType) -> str:
+    """``module:qualname`` for a frame, safe for the folded format."""
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{module}:{name}".replace(";", ":").replace(" ", "_")
+
+
+class SamplingProfiler:
+    """Samples one thread's stack on a timer.
+
+    Args:
+        interval: Seconds between samples.
+        thread_id: Thread to sample (default: the thread calling ``start()``).
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.samples = 0
+        self.elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+        self._switch_interval: float | None = None
+
+    def start(self) -> None:
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._stop.clear()
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+        self.elapsed += time.perf_counter() - self._started
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None or self._stop.is_set():  # target is inside stop()
+                continue
+            stack = []
+            while frame is not None and len(stack) < MAX_DEPTH:
+                stack.append(frame_label(frame))
+                frame = frame.f_back
+            del frame
+            stack.reverse()  # root first
+            self.stacks[tuple(stack)] += 1
+            self.samples += 1
+
+    # --- Output ---
+
+    def collapsed(self) -> list[str]:
+        """Folded stacks, heaviest first: ``root;...;leaf count``."""
+        return [f"{';'.join(stack)} {n}" for stack, n in self.stacks.most_common()]
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+    def functions(self) -> list[FunctionStats]:
+        """Per-function self / total samples, by self samples descending."""
+        stats: dict[str, FunctionStats] = {}
+        for stack, n in self.stacks.items():
+            for name in set(stack):
+                st = stats.get(name)
+                if st is None:
+                    st = stats[name] = FunctionStats(name)
+                st.total_samples += n
+            stats[stack[-1]].self_samples += n
+        return sorted(stats.values(), key=lambda s: (s.self_samples, s.total_samples), reverse=True)
+
+    def report(self, top: int = 25) -> str:
+        """Text table of the ``top`` functions by self time."""
+        if not self.samples:
+            return "No samples collected."
+        ms_per_sample = self.elapsed * 1000 / self.samples
+        header = f"{'Self %':>7} {'Total %':>8} {'Self ms':>9}  Function"
+        lines = [
+            f"{self.samples} samples over {self.elapsed:.2f}s (~{ms_per_sample:.2f} ms each)",
+            header,
+            "-" * 72,
+        ]
+        for st in self.functions()[:top]:
+            lines.append(
+                f"{st.self_samples / self.samples:>7.1%} {st.total_samples / self.samples:>8.1%} "
+                f"{st.self_samples * ms_per_sample:>9.1f}  {st.name}"
+            )
+        return "\n".join(lines)
+
+
+def profile_calls(fn: Callable[[], object], iterations: int,
+                  interval: float = DEFAULT_INTERVAL) -> SamplingProfiler:
+    """Call ``fn`` ``iterations`` times under one profiler; samples aggregate."""
+    with SamplingProfiler(interval) as prof:
+        for _ in range(iterations):
+            fn()
+    return prof
@@ -0,0 +1,252 @@
+"""Adaptive per-game poll scheduler keyed on game regime.
+
+Each tracked game gets a poll interval from its regime (``classify_regime``):
+clutch and overtime games are polled every few seconds, blowouts and
+breaks rarely, pregame games slowly, and final games not at all. Requests
+are jittered, and a token bucket per source host caps the request rate;
+when more games are due than the budget allows, the most important (then
+most overdue) games go first.
+Layer: src/runtime (orchestration over data/adapters/state)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.state.game_state import GameState
+from src.state.regime import classify_regime
+
+
+# Seconds between polls per regime. None = stop polling.
+REGIME_INTERVALS: dict[str, float | None] = {
+    "clutch": 3.0,
+    "overtime": 3.0,
+    "closing": 6.0,
+    "mid": 10.0,
+    "early": 12.0,
+    "garbage": 30.0,
+    "pregame": 120.0,
+    "final": None,
+}
+# Dead ball between periods / halftime (clock reads 0:00 or END mid-game).
+BREAK_INTERVAL = 30.0
+
+# Lower = served first when the budget is short.
+REGIME_PRIORITY = {
+    "clutch": 0, "overtime": 0, "closing": 1, "mid": 2, "early": 3,
+    "break": 4, "garbage": 5, "pregame": 6, "final": 9,
+}
+
+# Requests per second allowed per source host, and burst size.
+DEFAULT_BUDGETS = {"espn": 2.0, "nba": 2.0}
+DEFAULT_BURST = 5.0
+
+
+def poll_regime(state: GameState) -> str:
+    """``classify_regime`` plus a "break" regime for dead time between periods."""
+    regime = classify_regime(state)
+    if state.status == "in" and regime not in ("final", "pregame") and state.period < 4:
+        if state.clock and state.clock_tenths == 0:
+            return "break"
+    return regime
+
+
+@dataclass
+class _Game:
+    game_id: str
+    source: str
+    regime: str
+    interval: float | None
+    next_due: float
+    last_polled: float | None = None
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+    def wait_time(self) -> float:
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+
+class PollScheduler:
+    """Decides which games to poll next.
+
+    Typical loop::
+
+        sched.track(state)              # once per game (from a scoreboard)
+        while sched.active:
+            for gid in sched.due():
+                sched.update(poll(gid))  # new GameState after each poll
+            time.sleep(sched.next_wakeup())
+
+    Args:
+        budgets: Max requests/second per source host.
+        intervals: Poll interval per regime (None stops polling).
+        jitter: Fractional +/- randomization of each interval, so games
+            tracked together don't poll in lockstep.
+        burst: Token bucket size per host.
+        clock: Monotonic time source.
+        rng: Random source for jitter.
+    """
+
+    def __init__(
+        self,
+        budgets: dict[str, float] | None = None,
+        intervals: dict[str, float | None] | None = None,
+        jitter: float = 0.15,
+        burst: float = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ):
+        self.budgets = dict(DEFAULT_BUDGETS if budgets is None else budgets)
+        self.intervals = dict(REGIME_INTERVALS)
+        self.intervals["break"] = BREAK_INTERVAL
+        if intervals:
+            self.intervals.update(intervals)
+        self.jitter = jitter
+        self.burst = burst
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._games: dict[str, _Game] = {}
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    # --- Tracking ---
+
+    def track(self, state: GameState, source: str | None = None) -> None:
+        """Start tracking a game; it is due immediately unless final."""
+        self._games.pop(state.game_id, None)
+        regime = poll_regime(state)
+        interval = self.intervals.get(regime)
+        self._games[state.game_id] = _Game(
+            game_id=state.game_id,
+            source=source or state.source,
+            regime=regime,
+            interval=interval,
+            next_due=self.clock() if interval is not None else float("inf"),
+        )
+
+    def update(self, state: GameState) -> None:
+        """Record a completed poll and schedule the game's next one."""
+        game = self._games.get(state.game_id)
+        if game is None:
+            self.track(state)
+            game = self._games[state.game_id]
+        now = self.clock()
+        game.last_polled = now
+        game.regime = poll_regime(state)
+        game.interval = self.intervals.get(game.regime)
+        game.next_due = now + self._jittered(game.interval) if game.interval is not None else float("inf")
+
+    def mark_failed(self, game_id: str, retry_in: float | None = None) -> None:
+        """Re-schedule a game whose poll failed (default: its normal interval)."""
+        game = self._games.get(game_id)
+        if game is not None and game.interval is not None:
+            game.next_due = self.clock() + (retry_in if retry_in is not None else game.interval)
+
+    def remove(self, game_id: str) -> None:
+        self._games.pop(game_id, None)
+
+    @property
+    def active(self) -> bool:
+        """True while any tracked game still needs polling."""
+        return any(g.interval is not None for g in self._games.values())
+
+    def regime(self, game_id: str) -> str:
+        return self._games[game_id].regime
+
+    # --- Dispatch ---
+
+    def due(self) -> list[str]:
+        """game_ids to poll now, within each host's budget, most urgent first.
+
+        Returned games are charged against the budget; games left out stay
+        due and get more overdue (and so more urgent) next time.
+        """
+        now = self.clock()
+        ready = [g for g in self._games.values() if g.next_due <= now]
+        ready.sort(key=lambda g: (REGIME_PRIORITY.get(g.regime, 5), g.next_due))
+        out = []
+        for game in ready:
+            if self._bucket(game.source, now).take():
+                out.append(game.game_id)
+                # Don't hand the same game out twice before update() arrives.
+                game.next_due = now + (game.interval or 0.0)
+        return out
+
+    def next_wakeup(self) -> float:
+        """Seconds until the next game could be dispatched (0 if one is ready)."""
+        now = self.clock()
+        best = float("inf")
+        for game in self._games.values():
+            if game.interval is None:
+                continue
+            wait = max(0.0, game.next_due - now)
+            wait = max(wait, self._bucket(game.source, now).wait_time())
+            best = min(best, wait)
+        return best
+
+    def _bucket(self, source: str, now: float) -> _TokenBucket:
+        bucket = self._buckets.get(source)
+        if bucket is None:
+            rate = self.budgets.get(source, min(self.budgets.values(), default=1.0))
+            bucket = self._buckets[source] = _TokenBucket(rate, self.burst, now)
+        bucket.refill(now)
+        return bucket
+
+    def _jittered(self, interval: float) -> float:
+        if not self.jitter:
+            return interval
+        return interval * (1.0 + self.rng.uniform(-self.jitter, self.jitter))
+
+
+def run_loop(
+    scheduler: PollScheduler,
+    poll: Callable[[list[str]], list[GameState]],
+    sleep: Callable[[float], None] = time.sleep,
+    max_cycles: int | None = None,
+    max_sleep: float = 5.0,
+) -> int:
+    """Drive ``poll`` from the scheduler until every game is final.
+
+    Args:
+        poll: Fetch + normalize for a list of game_ids; returns the new
+            GameStates (games missing from the result are retried later).
+        max_cycles: Stop after this many dispatch cycles (None = until done).
+        max_sleep: Upper bound on a single sleep, so newly tracked games
+            are picked up promptly.
+
+    Returns:
+        Number of games polled in total.
+    """
+    polled = 0
+    cycles = 0
+    while scheduler.active and (max_cycles is None or cycles < max_cycles):
+        cycles += 1
+        game_ids = scheduler.due()
+        if game_ids:
+            states = {s.game_id: s for s in poll(game_ids)}
+            for gid in game_ids:
+                if gid in states:
+                    scheduler.update(states[gid])
+                else:
+                    scheduler.mark_failed(gid)
+            polled += len(game_ids)
+        sleep(min(scheduler.next_wakeup(), max_sleep))
+    return polled
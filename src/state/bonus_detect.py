@@ -1,34 +1,39 @@
-"""Bonus detection logic stub.
+"""Bonus detection logic.
 
 Detects team foul bonus / double-bonus state.
 Pure function. No I/O.
 Layer: src/state
 """
 
+from __future__ import annotations
+
+from src.state.foul_tracker import FoulTracker
 from src.state.game_state import GameState
 
 
-def detect_bonus(state: GameState) -> dict:
+def detect_bonus(state: GameState, tracker: FoulTracker | None = None) -> dict:
     """Detect bonus status for both teams.
 
     Args:
         state: Current GameState.
+        tracker: Optional FoulTracker for this game. When omitted, the flags
+            maintained in ``state.extra`` (written by PBPReducer) are used.
 
     Returns:
         Dict with keys:
-            home_bonus: bool
+            home_bonus: bool   (home team shoots penalty free throws)
             away_bonus: bool
             home_double_bonus: bool
             away_double_bonus: bool
 
     Note:
-        Stub implementation. Requires foul count data from PBP feed
-        to be fully functional. Returns all False until wired up.
+        NBA bonus: a team's 5th team foul in a quarter (4th in overtime), or
+        its 2nd in the last 2:00 of a period, gives penalty free throws.
+        Double bonus isn't standard NBA but the slot is kept for
+        flexibility. Answers come from maintained counters: O(1), no scans.
     """
-    # TODO: Wire up foul counts from play-by-play adapter.
-    # NBA bonus: 5th team foul in a quarter → bonus (1-and-1 doesn't apply in NBA,
-    # but penalty FTs start at 5th foul). Double bonus isn't standard NBA
-    # but keeping the slot for flexibility.
+    if tracker is not None:
+        return tracker.bonus(state.period or None)
     return {
         "home_bonus": state.extra.get("home_bonus", False),
         "away_bonus": state.extra.get("away_bonus", False),
@@ -0,0 +1,97 @@
+"""Game clock helpers.
+
+Converts between the feed clock formats and display strings.
+Pure functions. No I/O.
+Layer: src/state
+"""
+
+from __future__ import annotations
+
+
+# Period lengths in tenths of a second.
+REGULATION_PERIOD_TENTHS = 12 * 600
+OVERTIME_PERIOD_TENTHS = 5 * 600
+
+
+def parse_clock_tenths(clock: str) -> int | None:
+    """Parse a feed clock into tenths of a second remaining in the period.
+
+    Accepts NBA ISO durations ('PT05M32.00S'), display clocks ('5:32') and
+    ESPN sub-minute clocks ('45.3'). 'END'/'FINAL'/'' mean 0. Tenths are
+    truncated, not rounded ('PT00M04.99S' -> 49).
+
+    Returns:
+        Tenths of a second, or None if the clock can't be parsed.
+    """
+    if not clock:
+        return 0
+    # Fast paths for the two shapes the feeds send on nearly every row:
+    # fixed-width slices + int(), no float parsing.
+    n = len(clock)
+    if n == 11 and clock[4] == "M" and clock[7] == "." and clock[:2] == "PT":
+        try:
+            return int(clock[2:4]) * 600 + int(clock[5:7]) * 10 + int(clock[8])
+        except ValueError:
+            pass
+    elif (n == 4 or n == 5) and clock[-3] == ":":
+        try:
+            return int(clock[:-3]) * 600 + int(clock[-2:]) * 10
+        except ValueError:
+            pass
+    c = clock.strip().upper()
+    if c in ("END", "FINAL"):
+        return 0
+    try:
+        if c.startswith("PT"):
+            body = c[2:].rstrip("S")
+            minutes, _, seconds = body.rpartition("M")
+            return int(minutes or 0) * 600 + round(float(seconds or 0) * 100) // 10
+        minutes, sep, seconds = c.partition(":")
+        if sep:
+            return int(minutes) * 600 + round(float(seconds) * 100) // 10
+        return round(float(c) * 100) // 10
+    except ValueError:
+        return None
+
+
+def period_length_tenths(period: int) -> int:
+    """Length of ``period`` (1-4 regulation, 5+ overtime) in tenths."""
+    return REGULATION_PERIOD_TENTHS if period <= 4 else OVERTIME_PERIOD_TENTHS
+
+
+def elapsed_tenths(period: int, clock_tenths: int | None) -> int | None:
+    """Tenths of a second of game time played before this clock reading.
+
+    Returns:
+        0 before tip-off (period <= 0), None if the clock is unknown.
+    """
+    if period <= 0:
+        return 0
+    if clock_tenths is None:
+        return None
+    before = min(period - 1, 4) * REGULATION_PERIOD_TENTHS
+    before += max(period - 5, 0) * OVERTIME_PERIOD_TENTHS
+    length = period_length_tenths(period)
+    played = length - min(max(clock_tenths, 0), length)
+    return before + played
+
+
+def elapsed_seconds(period: int, clock_tenths: int | None) -> int | None:
+    """Whole seconds of game time played before this clock reading.
+
+    Returns:
+        0 before tip-off (period <= 0), None if the clock is unknown.
+    """
+    tenths = elapsed_tenths(period, clock_tenths)
+    return tenths if tenths is None else tenths // 10
+
+
+def display_clock(clock: str) -> str:
+    """Render a feed clock as the GameState display string ('5:32')."""
+    if not clock or not clock.startswith("PT"):
+        return clock
+    tenths = parse_clock_tenths(clock)
+    if tenths is None:
+        return clock
+    seconds = tenths // 10
+    return f"{seconds // 60}:{seconds % 60:02d}"
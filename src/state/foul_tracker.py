@@ -0,0 +1,108 @@
+"""Incremental team-foul counter and NBA penalty (bonus) state.
+
+Maintains per-period team fouls and last-two-minute fouls for one game in
+O(1) per foul, so bonus queries never rescan play-by-play.
+Pure logic. No I/O.
+Layer: src/state
+"""
+
+from __future__ import annotations
+
+
+# A team is "in the penalty" once it has this many team fouls in a period;
+# every further team foul gives the opponent free throws.
+REGULATION_FOUL_LIMIT = 4
+OVERTIME_FOUL_LIMIT = 3
+# In the last 2:00 of any period a team under the limit gets one foul
+# "to give"; after it the next foul is a penalty foul.
+LAST_TWO_MINUTES_TENTHS = 1200
+
+
+def foul_limit(period: int) -> int:
+    return REGULATION_FOUL_LIMIT if period <= 4 else OVERTIME_FOUL_LIMIT
+
+
+class FoulTracker:
+    """Team fouls for one game, keyed by period and side ("home"/"away").
+
+    Counts reset naturally each period (including every overtime) because
+    they are keyed by period. Each foul is remembered by event_id so an
+    edited or deleted PBP event can be removed again in O(1).
+    """
+
+    def __init__(self):
+        self._fouls: dict[tuple[int, str], int] = {}
+        self._late: dict[tuple[int, str], int] = {}  # fouls inside the last 2:00
+        self._records: dict[str, tuple[int, str, bool]] = {}  # event_id -> (period, side, late)
+        self.period = 0
+
+    def add(self, event_id: str, period: int, side: str, clock_tenths: int | None = None) -> None:
+        """Count one team foul committed by ``side`` with ``clock_tenths`` left."""
+        if event_id in self._records:
+            self.remove(event_id)
+        late = clock_tenths is not None and clock_tenths <= LAST_TWO_MINUTES_TENTHS
+        key = (period, side)
+        self._fouls[key] = self._fouls.get(key, 0) + 1
+        if late:
+            self._late[key] = self._late.get(key, 0) + 1
+        self._records[event_id] = (period, side, late)
+        if period > self.period:
+            self.period = period
+
+    def remove(self, event_id: str) -> None:
+        record = self._records.pop(event_id, None)
+        if record is None:
+            return
+        period, side, late = record
+        self._fouls[(period, side)] -= 1
+        if late:
+            self._late[(period, side)] -= 1
+
+    def fouls(self, side: str, period: int | None = None) -> int:
+        """Team fouls committed by ``side`` in ``period`` (default: latest)."""
+        return self._fouls.get((period or self.period, side), 0)
+
+    def in_penalty(self, side: str, period: int | None = None) -> bool:
+        """True if every further foul by ``side`` gives free throws."""
+        period = period or self.period
+        key = (period, side)
+        return self._fouls.get(key, 0) >= foul_limit(period) or self._late.get(key, 0) >= 1
+
+    def bonus(self, period: int | None = None) -> dict:
+        """Bonus flags in the ``detect_bonus`` shape.
+
+        ``home_bonus`` means the home team shoots free throws on the next
+        away foul (the away team is in the penalty), and vice versa. The NBA
+        has no double bonus; those keys are always False.
+        """
+        return {
+            "home_bonus": self.in_penalty("away", period),
+            "away_bonus": self.in_penalty("home", period),
+            "home_double_bonus": False,
+            "away_double_bonus": False,
+        }
+
+    def set_period(self, period: int) -> None:
+        """Advance the current period (e.g. on a period-start event)."""
+        if period > self.period:
+            self.period = period
+
+    # --- Snapshot / restore ---
+
+    def snapshot(self) -> dict:
+        return {
+            "period": self.period,
+            "records": {eid: list(rec) for eid, rec in self._records.items()},
+        }
+
+    @classmethod
+    def restore(cls, snap: dict) -> FoulTracker:
+        tracker = cls()
+        tracker.period = snap["period"]
+        for eid, (period, side, late) in snap["records"].items():
+            key = (period, side)
+            tracker._fouls[key] = tracker._fouls.get(key, 0) + 1
+            if late:
+                tracker._late[key] = tracker._late.get(key, 0) + 1
+            tracker._records[eid] = (period, side, late)
+        return tracker
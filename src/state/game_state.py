@@ -5,9 +5,12 @@ Layer: src/state
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
+from src.state.clock import elapsed_seconds as _elapsed_seconds, parse_clock_tenths
+
 
 @dataclass
 class GameState:
@@ -31,6 +34,11 @@ class GameState:
     period: int = 0
     period_label: str = ""  # "Q1", "Q2", "OT1", etc.
     clock: str = ""  # "5:32", "END", ""
+    # Pre-parsed clock, always derived from ``clock``. Adapters may pass the
+    # raw feed's clock_tenths to keep sub-second precision; it is kept only
+    # while it reads as ``clock`` (see ``_tenths_for``), so a stale value
+    # copied by ``dataclasses.replace(state, clock=...)`` is re-derived.
+    clock_tenths: Optional[int] = None  # tenths of a second left in period
 
     # Derived
     score_diff: int = 0  # home - away
@@ -47,3 +55,185 @@ class GameState:
         self.score_diff = self.home_score - self.away_score
         if self.status == "post":
             self.is_final = True
+        self.clock_tenths = _tenths_for(self.clock, self.clock_tenths)
+        self._clock_tracked = True
+
+    @property
+    def elapsed_seconds(self) -> Optional[int]:
+        """Game time played so far, from ``period`` and ``clock_tenths``."""
+        return _elapsed_seconds(self.period, self.clock_tenths)
+
+    def set_clock(self, clock: str, clock_tenths: Optional[int] = None) -> None:
+        """Update ``clock``, keeping feed-precision ``clock_tenths`` if it matches."""
+        self.clock = clock
+        if clock_tenths is not None:
+            self.clock_tenths = _tenths_for(clock, clock_tenths)
+
+
+# Every construction parses its clock; a game night repeats the same few
+# thousand display clocks, so memoize them (bounded, in case of odd feeds).
+_PARSED_CLOCKS_MAX = 4096
+_parsed_clocks: dict[str, Optional[int]] = {}
+
+
+def _tenths_for(clock: str, clock_tenths: Optional[int]) -> Optional[int]:
+    """``clock_tenths`` if it displays as ``clock``, else ``clock`` parsed.
+
+    A display clock drops precision ('5:32' covers 3320-3329 tenths, '45.3'
+    only 453); a value outside that window belongs to some other clock.
+    """
+    try:
+        parsed = _parsed_clocks[clock]
+    except KeyError:
+        if len(_parsed_clocks) >= _PARSED_CLOCKS_MAX:
+            _parsed_clocks.clear()
+        parsed = _parsed_clocks[clock] = parse_clock_tenths(clock)
+    if clock_tenths is None or parsed is None:
+        return parsed
+    if parsed <= clock_tenths < parsed + (1 if "." in clock else 10):
+        return clock_tenths
+    return parsed
+
+
+def _get_clock(self) -> str:
+    return self._clock
+
+
+def _set_clock(self, clock: str) -> None:
+    self._clock = clock
+    if self._clock_tracked:  # reassigned after __init__: re-derive
+        self.clock_tenths = parse_clock_tenths(clock)
+
+
+# Installed after @dataclass so ``clock`` stays an ordinary init field while
+# assignments keep ``clock_tenths`` in step (only clock writes pay for it).
+# No ``self.__dict__`` access here: that would de-optimize attribute reads.
+GameState.clock = property(_get_clock, _set_clock)
+GameState._clock_tracked = False  # set by __post_init__
+
+
+GAME_STATE_FIELDS = (
+    "game_id",
+    "source",
+    "status",
+    "home_team",
+    "away_team",
+    "home_abbr",
+    "away_abbr",
+    "home_score",
+    "away_score",
+    "period",
+    "period_label",
+    "clock",
+    "clock_tenths",
+    "score_diff",
+    "is_final",
+    "start_time_utc",
+    "venue",
+)
+
+# Low-cardinality fields shared across many snapshots.
+_INTERNED = frozenset(
+    {"source", "status", "home_team", "away_team", "home_abbr", "away_abbr", "period_label", "venue"}
+)
+
+
+class CompactGameState:
+    """Slotted GameState with interned team/status strings and lazy ``extra``.
+
+    Same attribute API as GameState; use for large snapshot histories.
+    ``score_diff`` / ``is_final`` are derived on construction exactly like
+    ``GameState.__post_init__``; ``clock_tenths`` follows ``clock`` and
+    ``elapsed_seconds`` is computed, as on GameState.
+    """
+
+    __slots__ = tuple(f for f in GAME_STATE_FIELDS if f != "clock") + ("_clock", "_extra")
+
+    def __init__(
+        self,
+        game_id: str,
+        source: str,
+        status: str,
+        home_team: str = "",
+        away_team: str = "",
+        home_abbr: str = "",
+        away_abbr: str = "",
+        home_score: int = 0,
+        away_score: int = 0,
+        period: int = 0,
+        period_label: str = "",
+        clock: str = "",
+        clock_tenths: Optional[int] = None,
+        score_diff: int = 0,
+        is_final: bool = False,
+        start_time_utc: str = "",
+        venue: str = "",
+        extra: Optional[dict] = None,
+    ):
+        intern = sys.intern
+        self.game_id = game_id
+        self.source = intern(source)
+        self.status = intern(status)
+        self.home_team = intern(home_team)
+        self.away_team = intern(away_team)
+        self.home_abbr = intern(home_abbr)
+        self.away_abbr = intern(away_abbr)
+        self.home_score = home_score
+        self.away_score = away_score
+        self.period = period
+        self.period_label = intern(period_label)
+        self._clock = clock
+        self.clock_tenths = _tenths_for(clock, clock_tenths)
+        self.start_time_utc = start_time_utc
+        self.venue = intern(venue)
+        self._extra = dict(extra) if extra else None  # a copy: the caller's dict stays theirs
+        self.score_diff = home_score - away_score
+        self.is_final = is_final or status == "post"
+
+    @property
+    def clock(self) -> str:
+        return self._clock
+
+    @clock.setter
+    def clock(self, clock: str) -> None:
+        self._clock = clock
+        self.clock_tenths = parse_clock_tenths(clock)
+
+    @property
+    def elapsed_seconds(self) -> Optional[int]:
+        return _elapsed_seconds(self.period, self.clock_tenths)
+
+    set_clock = GameState.set_clock
+
+    @property
+    def extra(self) -> dict:
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: dict) -> None:
+        self._extra = value or None
+
+    @classmethod
+    def from_state(cls, state: GameState) -> CompactGameState:
+        kwargs = {f: getattr(state, f) for f in GAME_STATE_FIELDS}
+        return cls(**kwargs, extra=state.extra)
+
+    def to_state(self) -> GameState:
+        kwargs = {f: getattr(self, f) for f in GAME_STATE_FIELDS}
+        gs = GameState(**kwargs, extra=dict(self._extra or {}))
+        gs.is_final = self.is_final
+        return gs
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompactGameState, GameState)):
+            other_extra = other._extra if isinstance(other, CompactGameState) else other.extra
+            return all(getattr(self, f) == getattr(other, f) for f in GAME_STATE_FIELDS) and (
+                (self._extra or {}) == (other_extra or {})
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in GAME_STATE_FIELDS)
+        return f"CompactGameState({fields})"
@@ -0,0 +1,229 @@
+"""Event-sourced GameState reducer driven by play-by-play.
+
+Folds PBPEvents into a GameState (score, period, clock, status, team fouls
+and timeouts in ``extra``) with O(1) work per event, so PBP polling alone
+keeps game state fresh without a separate scoreboard request.
+Pure logic. No I/O.
+Layer: src/state
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Iterable
+
+from src.state.clock import display_clock
+from src.state.foul_tracker import FoulTracker
+from src.state.game_state import GameState
+
+if TYPE_CHECKING:  # adapters sit above state; only needed for annotations
+    from src.adapters.playbyplay_adapter import PBPEvent
+
+
+# NBA team-foul rules: technicals and offensive fouls don't count toward
+# the team foul total (the feed omits the ".T<n>" count on those actions).
+_NON_TEAM_FOUL_MARKERS = ("technical", "offensive", "charge", "double")
+
+
+def is_team_foul(event: PBPEvent) -> bool:
+    """True if the event is a foul that counts toward the team foul total."""
+    etype = event.event_type.lower()
+    if event.source == "nba":
+        if etype != "foul":
+            return False
+        sub_type = event.extra.get("sub_type", "").lower()
+        return not any(m in sub_type for m in _NON_TEAM_FOUL_MARKERS)
+    if "foul" not in etype:
+        return False
+    return not any(m in etype for m in _NON_TEAM_FOUL_MARKERS)
+
+
+def is_timeout(event: PBPEvent) -> bool:
+    return "timeout" in event.event_type.lower()
+
+
+def _is_period_end(event: PBPEvent) -> bool:
+    etype = event.event_type.lower()
+    if event.source == "nba":
+        return etype == "period" and event.extra.get("sub_type") == "end"
+    return etype.startswith("end period") or etype.startswith("end of")
+
+
+def _is_game_end(event: PBPEvent) -> bool:
+    etype = event.event_type.lower()
+    if event.source == "nba":
+        return etype == "game" and event.extra.get("sub_type") == "end"
+    return etype in ("end game", "end of game")
+
+
+def _period_label(period: int) -> str:
+    if period <= 4:
+        return f"Q{period}" if period > 0 else ""
+    return f"OT{period - 4}"
+
+
+class PBPReducer:
+    """Incrementally folds PBPEvents into one game's GameState.
+
+    ``state`` is updated in place, including the bonus flags ``detect_bonus``
+    reads. Team fouls live in ``fouls`` (a FoulTracker). Per-event
+    contributions (fouls, timeouts) are remembered by event_id so edited or deleted events from a
+    PBPCursor delta can be re-applied or undone in O(1).
+
+    Score, period and clock are absolute in every event, so they follow the
+    most recently applied event; a removal leaves them until the next event.
+
+    Args:
+        state: Starting GameState; must carry home/away abbreviations so
+            team events can be attributed.
+    """
+
+    def __init__(self, state: GameState):
+        self.state = state
+        self.fouls = FoulTracker()
+        self._timeouts: dict[str, int] = {"home": 0, "away": 0}
+        self._applied: dict[str, tuple[str, int, str]] = {}  # event_id -> (kind, period, side)
+        self._last_event_id = ""
+        self._sync_extra()
+
+    # --- Event folding ---
+
+    def apply(self, event: PBPEvent) -> GameState:
+        """Fold one new event into the state."""
+        self._fold(event)
+        self._record(event)
+        self._last_event_id = event.event_id
+        self._sync_extra()
+        return self.state
+
+    def _fold(self, event: PBPEvent) -> None:
+        """Take score / period / clock / status from an event."""
+        s = self.state
+        if event.period:
+            if event.period != s.period:
+                s.period = event.period
+                s.period_label = _period_label(event.period)
+                self.fouls.set_period(event.period)
+            s.set_clock(display_clock(event.clock), event.clock_tenths)
+        s.home_score = event.home_score
+        s.away_score = event.away_score
+        s.score_diff = s.home_score - s.away_score
+        if s.status == "pre":
+            s.status = "in"
+        if _is_period_end(event):
+            s.set_clock("END", 0)
+        if _is_game_end(event):
+            s.status = "post"
+            s.is_final = True
+
+    def apply_all(self, events: Iterable[PBPEvent]) -> GameState:
+        for event in events:
+            self.apply(event)
+        return self.state
+
+    def apply_delta(self, delta) -> GameState:
+        """Apply a PBPCursor delta: undo removed, re-apply updated, fold added."""
+        for event_id in delta.removed:
+            self._unrecord(event_id)
+        for event in delta.updated:
+            self._unrecord(event.event_id)
+            self._record(event)
+            if event.event_id == self._last_event_id:
+                self._fold(event)
+        for event in delta.added:
+            self.apply(event)
+        self._sync_extra()
+        return self.state
+
+    # --- Counters ---
+
+    def team_fouls(self, side: str, period: int | None = None) -> int:
+        """Team fouls for "home"/"away" in a period (default: current)."""
+        return self.fouls.fouls(side, period or self.state.period)
+
+    def timeouts_used(self, side: str) -> int:
+        return self._timeouts[side]
+
+    def _side(self, event: PBPEvent) -> str:
+        s = self.state
+        abbr = event.team_abbr
+        if abbr:
+            if abbr == s.home_abbr:
+                return "home"
+            if abbr == s.away_abbr:
+                return "away"
+            return ""
+        team_id = event.extra.get("team_id")
+        if team_id:
+            if team_id == s.extra.get("home_team_id"):
+                return "home"
+            if team_id == s.extra.get("away_team_id"):
+                return "away"
+        return ""
+
+    def _record(self, event: PBPEvent) -> None:
+        if is_team_foul(event):
+            kind = "foul"
+        elif is_timeout(event):
+            kind = "timeout"
+        else:
+            return
+        side = self._side(event)
+        if not side:  # official timeouts, unknown teams
+            return
+        if kind == "foul":
+            self.fouls.add(event.event_id, event.period, side, event.clock_tenths)
+        else:
+            self._timeouts[side] += 1
+        self._applied[event.event_id] = (kind, event.period, side)
+
+    def _unrecord(self, event_id: str) -> None:
+        applied = self._applied.pop(event_id, None)
+        if applied is None:
+            return
+        kind, period, side = applied
+        if kind == "foul":
+            self.fouls.remove(event_id)
+        else:
+            self._timeouts[side] -= 1
+
+    def _sync_extra(self) -> None:
+        extra = self.state.extra
+        extra["home_fouls"] = self.team_fouls("home")
+        extra["away_fouls"] = self.team_fouls("away")
+        extra.update(self.fouls.bonus(self.state.period))
+        extra["home_timeouts_used"] = self._timeouts["home"]
+        extra["away_timeouts_used"] = self._timeouts["away"]
+
+    # --- Snapshot / restore ---
+
+    def snapshot(self) -> dict:
+        """Plain-data copy of the reducer, safe to pickle or JSON-encode."""
+        return {
+            "state": asdict(self.state),
+            "fouls": self.fouls.snapshot(),
+            "timeouts": dict(self._timeouts),
+            "applied": {eid: list(rec) for eid, rec in self._applied.items()},
+            "last_event_id": self._last_event_id,
+        }
+
+    @classmethod
+    def restore(cls, snap: dict) -> PBPReducer:
+        """Rebuild a reducer from ``snapshot()`` output."""
+        state_fields = copy.deepcopy(snap["state"])
+        derived = {k: state_fields.pop(k) for k in ("score_diff", "is_final")}
+        state = GameState(**state_fields)
+        state.score_diff, state.is_final = derived["score_diff"], derived["is_final"]
+        reducer = cls(state)
+        reducer.fouls = FoulTracker.restore(snap["fouls"])
+        reducer._timeouts = dict(snap["timeouts"])
+        reducer._applied = {eid: tuple(rec) for eid, rec in snap["applied"].items()}
+        reducer._last_event_id = snap["last_event_id"]
+        reducer._sync_extra()
+        return reducer
+
+
+def reduce_events(state: GameState, events: Iterable[PBPEvent]) -> GameState:
+    """Pure convenience: fold ``events`` into a copy of ``state``."""
+    return PBPReducer(copy.deepcopy(state)).apply_all(events)
@@ -7,6 +7,9 @@ Layer: src/state
 from src.state.game_state import GameState
 
 
+CLUTCH_TENTHS = 5 * 600  # clutch time starts under 5:00 left in Q4
+
+
 def classify_regime(state: GameState) -> str:
     """Classify the current game regime based on state.
 
@@ -39,28 +42,12 @@ def classify_regime(state: GameState) -> str:
         return "overtime"
 
     # period == 4
-    # Parse clock for minutes remaining
-    minutes_left = _parse_clock_minutes(state.clock)
-
     if abs_diff > 20:
         return "garbage"
 
-    if minutes_left is not None and minutes_left < 5.0 and abs_diff <= 5:
+    # Under 5:00 left (clock_tenths is pre-parsed; None = unknown clock).
+    tenths = state.clock_tenths
+    if tenths is not None and tenths < CLUTCH_TENTHS and abs_diff <= 5:
         return "clutch"
 
     return "closing"
-
-
-def _parse_clock_minutes(clock: str) -> float | None:
-    """Parse clock string like '5:32' into total minutes as float."""
-    if not clock or clock.upper() in ("END", "FINAL", "0.0", ""):
-        return 0.0
-    try:
-        parts = clock.replace(".", ":").split(":")
-        if len(parts) == 2:
-            return int(parts[0]) + int(parts[1]) / 60.0
-        elif len(parts) == 1:
-            return float(parts[0]) / 60.0
-    except (ValueError, IndexError):
-        return None
-    return None
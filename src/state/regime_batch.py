@@ -0,0 +1,155 @@
+"""Vectorized regime classification for many snapshots at once.
+
+``SnapshotBatch`` holds game snapshots as NumPy columns (status code,
+period, clock, score diff); ``classify_regimes`` applies the rules of
+``classify_regime`` to the whole batch in one pass and returns int8 regime
+codes. Results are identical to the scalar function: both read the
+pre-parsed ``clock_tenths``, so the rules see the same values.
+
+Requires ``numpy`` (installed with streamlit / pandas); imported on first use.
+Layer: src/state
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from src.state.clock import parse_clock_tenths
+from src.state.game_state import GameState
+from src.state.regime import CLUTCH_TENTHS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Regime codes: REGIMES[code] is the name classify_regime would return.
+REGIMES = ("pregame", "early", "mid", "clutch", "garbage", "closing", "overtime", "final")
+REGIME_CODES = {name: code for code, name in enumerate(REGIMES)}
+
+STATUS_PRE, STATUS_IN, STATUS_POST, STATUS_OTHER = 0, 1, 2, 3
+STATUS_CODES = {"pre": STATUS_PRE, "in": STATUS_IN, "post": STATUS_POST}
+
+NULL_TENTHS = -(2**31)  # int32 min: clock_tenths of an unparseable clock
+
+
+def _np():
+    try:
+        import numpy as np
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError("regime_batch requires numpy (pip install numpy)") from e
+    return np
+
+
+@dataclass
+class SnapshotBatch:
+    """Columnar game snapshots (one row per snapshot).
+
+    Attributes:
+        status: int8 status code (``STATUS_CODES``; anything else is STATUS_OTHER).
+        is_final: bool.
+        period: int16.
+        clock_tenths: int32 tenths of a second left in the period;
+            ``NULL_TENTHS`` where the clock is unknown.
+        score_diff: int32 home - away.
+    """
+
+    status: np.ndarray
+    is_final: np.ndarray
+    period: np.ndarray
+    clock_tenths: np.ndarray
+    score_diff: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.period)
+
+    @classmethod
+    def from_states(cls, states: Iterable[GameState]) -> "SnapshotBatch":
+        """Build a batch from GameStates (or anything with the same attributes)."""
+        np = _np()
+        states = list(states)
+        n = len(states)
+        status = np.fromiter(
+            (STATUS_CODES.get(s.status, STATUS_OTHER) for s in states), np.int8, n
+        )
+        is_final = np.fromiter((bool(s.is_final) for s in states), np.bool_, n)
+        period = np.fromiter((s.period for s in states), np.int16, n)
+        score_diff = np.fromiter((s.score_diff for s in states), np.int32, n)
+        clock_tenths = np.fromiter(
+            (NULL_TENTHS if s.clock_tenths is None else s.clock_tenths for s in states), np.int32, n
+        )
+        return cls(status, is_final, period, clock_tenths, score_diff)
+
+    @classmethod
+    def from_columns(
+        cls,
+        status: Iterable[str],
+        period: Iterable[int],
+        clock_tenths: Iterable[int | None],
+        score_diff: Iterable[int],
+        is_final: Iterable[bool] | None = None,
+    ) -> "SnapshotBatch":
+        """Build a batch from raw columns (e.g. read from an archive).
+
+        Use ``clock_tenths_column`` to convert clock strings first.
+        """
+        np = _np()
+        status_arr = np.array([STATUS_CODES.get(s, STATUS_OTHER) for s in status], np.int8)
+        period_arr = np.asarray(period, np.int16)
+        diff_arr = np.asarray(score_diff, np.int32)
+        if is_final is None:
+            final_arr = status_arr == STATUS_POST
+        else:
+            final_arr = np.asarray(is_final, np.bool_)
+        tenths_arr = np.array(
+            [NULL_TENTHS if t is None else t for t in clock_tenths], np.int32
+        )
+        return cls(status_arr, final_arr, period_arr, tenths_arr, diff_arr)
+
+
+def clock_tenths_column(clocks: Iterable[str]) -> list[int | None]:
+    """Parse clock strings to tenths (each distinct string parsed once)."""
+    cache: dict[str, int | None] = {}
+    out = []
+    for clock in clocks:
+        if clock not in cache:
+            cache[clock] = parse_clock_tenths(clock)
+        out.append(cache[clock])
+    return out
+
+
+def classify_regimes(batch: SnapshotBatch) -> np.ndarray:
+    """Regime code per snapshot; ``REGIMES[code]`` matches ``classify_regime``.
+
+    Returns:
+        int8 array of length ``len(batch)``.
+    """
+    np = _np()
+    period = batch.period
+    abs_diff = np.abs(batch.score_diff)
+    # First matching rule wins, in the same order as classify_regime.
+    conditions = [
+        batch.is_final | (batch.status == STATUS_POST),
+        batch.status == STATUS_PRE,
+        period <= 2,
+        period == 3,
+        period >= 5,
+        abs_diff > 20,
+        (batch.clock_tenths != NULL_TENTHS) & (batch.clock_tenths < CLUTCH_TENTHS) & (abs_diff <= 5),
+    ]
+    choices = [REGIME_CODES[name] for name in
+               ("final", "pregame", "early", "mid", "overtime", "garbage", "clutch")]
+    return np.select(conditions, choices, default=REGIME_CODES["closing"]).astype(np.int8)
+
+
+def regime_names(codes: np.ndarray) -> list[str]:
+    """Decode regime codes to names."""
+    np = _np()
+    return np.asarray(REGIMES, dtype=object)[codes].tolist()
+
+
+def regime_counts(codes: np.ndarray) -> dict[str, int]:
+    """Number of snapshots per regime (all regimes present, zeros included)."""
+    np = _np()
+    counts = np.bincount(codes, minlength=len(REGIMES))
+    return {name: int(counts[i]) for i, name in enumerate(REGIMES)}
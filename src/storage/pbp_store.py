@@ -0,0 +1,291 @@
+"""Columnar on-disk archive of normalized play-by-play.
+
+Writes PBPEvents from ``normalize_nba_pbp`` / ``normalize_espn_pbp`` as one
+Arrow IPC file per game (``<root>/game_id=<id>/pbp.arrow``), one record
+batch per period, with dictionary-encoded strings and the clock as integer
+tenths of a second. Reads memory-map the files, prune partitions by
+game_id and record batches by period before touching any data, and filter
+event_type with Arrow compute. ``ArchiveReader`` keeps partitions mapped
+across reads until ``close()``; ``read()`` opens and closes them per call
+(returned tables stay valid after close). Parquet export is available for
+sharing.
+
+Requires ``pyarrow`` (installed with streamlit); imported on first use.
+Layer: src/storage (archive of adapter output; no fetching, no state logic)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+from typing import Iterable
+
+from src.adapters.playbyplay_adapter import PBPEvent
+
+
+PARTITION_PREFIX = "game_id="
+FILE_NAME = "pbp.arrow"
+_PERIODS_META = b"periods"  # JSON list: period of each record batch
+
+_DICT_COLUMNS = ("source", "game_id", "clock", "event_type", "team_abbr", "player_name", "extra")
+
+
+def _pa():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute  # noqa: F401  (registers pa.compute)
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise ImportError("pbp_store requires pyarrow (pip install pyarrow)") from e
+    return pa
+
+
+def schema():
+    """Arrow schema of the archive."""
+    pa = _pa()
+    dict_str = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("event_id", pa.string()),
+        ("source", dict_str),
+        ("game_id", dict_str),
+        ("period", pa.int8()),
+        ("clock", dict_str),
+        ("clock_tenths", pa.int32()),  # tenths of a second left in period; null if unparseable
+        ("event_type", dict_str),
+        ("description", pa.string()),
+        ("team_abbr", dict_str),
+        ("player_name", dict_str),
+        ("home_score", pa.int16()),
+        ("away_score", pa.int16()),
+        ("extra", dict_str),  # JSON-encoded extra dict, null when empty
+        ("elapsed_seconds", pa.int32()),  # game time played at the event
+    ])
+
+
+def partition_path(root: str, game_id: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", game_id) or "_"
+    return os.path.join(root, f"{PARTITION_PREFIX}{safe}", FILE_NAME)
+
+
+def _record_batch(events: list[PBPEvent]):
+    pa = _pa()
+    sch = schema()
+    columns = {
+        "event_id": [e.event_id for e in events],
+        "source": [e.source for e in events],
+        "game_id": [e.game_id for e in events],
+        "period": [e.period for e in events],
+        "clock": [e.clock for e in events],
+        "clock_tenths": [e.clock_tenths for e in events],
+        "event_type": [e.event_type for e in events],
+        "description": [e.description for e in events],
+        "team_abbr": [e.team_abbr for e in events],
+        "player_name": [e.player_name for e in events],
+        "home_score": [e.home_score for e in events],
+        "away_score": [e.away_score for e in events],
+        "extra": [json.dumps(e.extra, sort_keys=True) if e.extra else None for e in events],
+        "elapsed_seconds": [e.elapsed_seconds for e in events],
+    }
+    arrays = []
+    for f in sch:
+        values = columns[f.name]
+        if f.name in _DICT_COLUMNS:
+            arrays.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, f.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=sch)
+
+
+def write_game(root: str, game_id: str, events: Iterable[PBPEvent]) -> str:
+    """Write (replace) one game's partition atomically.
+
+    Returns:
+        Path of the written file.
+    """
+    pa = _pa()
+    # Stable sort by period so each period is one contiguous slice; slices
+    # of a single batch share one dictionary per column, as IPC files require.
+    events = sorted(events, key=lambda e: e.period)
+    batch = _record_batch(events)
+    periods: list[int] = []
+    bounds: list[int] = []
+    for i, ev in enumerate(events):
+        if not periods or ev.period != periods[-1]:
+            periods.append(ev.period)
+            bounds.append(i)
+    bounds.append(len(events))
+
+    path = partition_path(root, game_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    sch = schema().with_metadata({_PERIODS_META: json.dumps(periods).encode()})
+    tmp = f"{path}.tmp{os.getpid()}"
+    replaced = False
+    try:
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, sch) as writer:
+            for start, end in zip(bounds, bounds[1:]):
+                writer.write_batch(batch.slice(start, end - start))
+        os.replace(tmp, path)
+        replaced = True
+    finally:
+        if not replaced:  # failed write: don't leave the partial file behind
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp)
+    return path
+
+
+def write_events(root: str, events: Iterable[PBPEvent]) -> list[str]:
+    """Write events from any number of games, one partition per game_id."""
+    by_game: dict[str, list[PBPEvent]] = {}
+    for ev in events:
+        by_game.setdefault(ev.game_id, []).append(ev)
+    return [write_game(root, gid, evs) for gid, evs in by_game.items()]
+
+
+def list_games(root: str) -> list[str]:
+    """game_ids with a partition under ``root`` (sanitized directory names)."""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name[len(PARTITION_PREFIX):]
+        for name in os.listdir(root)
+        if name.startswith(PARTITION_PREFIX)
+        and os.path.exists(os.path.join(root, name, FILE_NAME))
+    )
+
+
+class ArchiveReader:
+    """Memory-mapped reads over one archive root.
+
+    Partitions are mapped on first use and stay open for later reads until
+    ``close()`` (or the end of a ``with`` block). Tables already returned
+    stay valid after close: their buffers keep the mapping alive.
+
+    Args:
+        root: Archive root directory.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._files: dict[str, tuple] = {}  # game_id -> (memory map, IPC file reader)
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release every mapped file."""
+        files, self._files = self._files, {}
+        for source, _ in files.values():
+            source.close()
+
+    def _open(self, game_id: str):
+        opened = self._files.get(game_id)
+        if opened is None:
+            path = partition_path(self.root, game_id)
+            if not os.path.exists(path):
+                return None
+            pa = _pa()
+            source = pa.memory_map(path, "r")
+            try:
+                opened = self._files[game_id] = (source, pa.ipc.open_file(source))
+            except BaseException:
+                source.close()
+                raise
+        return opened[1]
+
+    def read(
+        self,
+        game_ids: Iterable[str] | None = None,
+        periods: Iterable[int] | None = None,
+        event_types: Iterable[str] | None = None,
+        columns: list[str] | None = None,
+    ):
+        """Read archived PBP as a ``pyarrow.Table``.
+
+        Args:
+            game_ids: Only these games (partition pruning; others never opened).
+            periods: Only these periods (record batches for other periods are
+                skipped without reading their buffers).
+            event_types: Only these event types.
+            columns: Column subset to return.
+
+        Returns:
+            pyarrow.Table with the archive schema (or ``columns``).
+        """
+        pa = _pa()
+        gids = list_games(self.root) if game_ids is None else list(game_ids)
+        wanted_periods = set(periods) if periods is not None else None
+
+        batches = []
+        for gid in gids:
+            reader = self._open(gid)
+            if reader is None:
+                continue
+            batch_periods = json.loads(reader.schema.metadata.get(_PERIODS_META, b"[]"))
+            for i in range(reader.num_record_batches):
+                if (
+                    wanted_periods is not None
+                    and i < len(batch_periods)
+                    and batch_periods[i] not in wanted_periods
+                ):
+                    continue
+                batches.append(reader.get_batch(i))
+
+        if not batches:
+            table = schema().empty_table()
+        else:
+            table = pa.Table.from_batches(batches)
+        if event_types is not None:
+            # Compare on decoded values; dictionaries differ between files.
+            etype = table.column("event_type").cast(pa.string())
+            table = table.filter(pa.compute.is_in(etype, value_set=pa.array(list(event_types), pa.string())))
+        if columns is not None:
+            table = table.select(columns)
+        return table
+
+
+def read(
+    root: str,
+    game_ids: Iterable[str] | None = None,
+    periods: Iterable[int] | None = None,
+    event_types: Iterable[str] | None = None,
+    columns: list[str] | None = None,
+):
+    """Read archived PBP as a ``pyarrow.Table`` via memory mapping.
+
+    One-shot ``ArchiveReader.read``: the files are closed before returning.
+    """
+    with ArchiveReader(root) as reader:
+        return reader.read(game_ids, periods, event_types, columns)
+
+
+def to_events(table) -> list[PBPEvent]:
+    """Materialize PBPEvents from a full-schema table returned by ``read``."""
+    fields = [f for f in PBPEvent.__dataclass_fields__ if f != "extra"]
+    data = table.to_pydict()
+    extras = data.get("extra", [None] * table.num_rows)
+    return [
+        PBPEvent(
+            **{f: data[f][i] for f in fields},
+            extra=json.loads(extras[i]) if extras[i] else {},
+        )
+        for i in range(table.num_rows)
+    ]
+
+
+def export_parquet(root: str, path: str, **filters) -> int:
+    """Export (optionally filtered) archive to a single Parquet file.
+
+    Returns:
+        Number of rows written.
+    """
+    _pa()
+    import pyarrow.parquet as pq
+
+    table = read(root, **filters)
+    pq.write_table(table, path, compression="zstd")
+    return table.num_rows
@@ -6,11 +6,26 @@ Layer: src/ui/panels
 """
 
 from __future__ import annotations
+from src import metrics
 from src.state.game_state import GameState
 from src.state.regime import classify_regime
 from src.state.bonus_detect import detect_bonus
 
 
+EVAL_HEADER = f"{'ID':<14} {'Matchup':<28} {'Score':>11} {'Regime':<10} {'Diff':>5} {'Bonus':<9}"
+
+
+def eval_row(s: GameState) -> str:
+    """One game's eval line (no header)."""
+    matchup = f"{s.away_abbr} @ {s.home_abbr}"
+    score = f"{s.away_score}-{s.home_score}"
+    regime = classify_regime(s)
+    diff = f"{s.score_diff:+d}"
+    bonus = _bonus_label(s)
+    return f"{s.game_id:<14} {matchup:<28} {score:>11} {regime:<10} {diff:>5} {bonus:<9}"
+
+
+@metrics.timed("render", panel="eval")
 def render_eval(states: list[GameState]) -> str:
     """Render evaluation table with regime classification.
 
@@ -23,21 +38,20 @@ def render_eval(states: list[GameState]) -> str:
     if not states:
         return "No games to evaluate."
 
-    lines = []
-    header = f"{'ID':<14} {'Matchup':<28} {'Score':>11} {'Regime':<10} {'Diff':>5}"
-    lines.append(header)
-    lines.append("-" * len(header))
+    lines = [EVAL_HEADER, "-" * len(EVAL_HEADER)]
+    lines.extend(eval_row(s) for s in states)
+    return "\n".join(lines)
 
-    for s in states:
-        matchup = f"{s.away_abbr} @ {s.home_abbr}"
-        score = f"{s.away_score}-{s.home_score}"
-        regime = classify_regime(s)
-        diff = f"{s.score_diff:+d}"
-        lines.append(
-            f"{s.game_id:<14} {matchup:<28} {score:>11} {regime:<10} {diff:>5}"
-        )
 
-    return "\n".join(lines)
+def _bonus_label(s: GameState) -> str:
+    """Teams currently in the bonus, e.g. 'BOS LAL'. Reads maintained flags only."""
+    b = detect_bonus(s)
+    teams = []
+    if b["away_bonus"]:
+        teams.append(s.away_abbr)
+    if b["home_bonus"]:
+        teams.append(s.home_abbr)
+    return " ".join(teams)
 
 
 def print_eval(states: list[GameState]) -> None:
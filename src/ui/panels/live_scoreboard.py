@@ -5,9 +5,21 @@ Layer: src/ui/panels
 """
 
 from __future__ import annotations
+from src import metrics
 from src.state.game_state import GameState
 
 
+SCOREBOARD_HEADER = f"{'ID':<14} {'Matchup':<28} {'Score':>11} {'Period':<6} {'Clock':<8} {'Status':<6}"
+
+
+def scoreboard_row(s: GameState) -> str:
+    """One game's scoreboard line (no header)."""
+    matchup = f"{s.away_abbr} @ {s.home_abbr}"
+    score = f"{s.away_score}-{s.home_score}"
+    return f"{s.game_id:<14} {matchup:<28} {score:>11} {s.period_label:<6} {s.clock:<8} {s.status:<6}"
+
+
+@metrics.timed("render", panel="scoreboard")
 def render_scoreboard(states: list[GameState]) -> str:
     """Render a text-based scoreboard table from GameState list.
 
@@ -20,18 +32,8 @@ def render_scoreboard(states: list[GameState]) -> str:
     if not states:
         return "No games found."
 
-    lines = []
-    header = f"{'ID':<14} {'Matchup':<28} {'Score':>11} {'Period':<6} {'Clock':<8} {'Status':<6}"
-    lines.append(header)
-    lines.append("-" * len(header))
-
-    for s in states:
-        matchup = f"{s.away_abbr} @ {s.home_abbr}"
-        score = f"{s.away_score}-{s.home_score}"
-        lines.append(
-            f"{s.game_id:<14} {matchup:<28} {score:>11} {s.period_label:<6} {s.clock:<8} {s.status:<6}"
-        )
-
+    lines = [SCOREBOARD_HEADER, "-" * len(SCOREBOARD_HEADER)]
+    lines.extend(scoreboard_row(s) for s in states)
     return "\n".join(lines)
 
 
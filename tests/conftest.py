@@ -0,0 +1,72 @@
+"""Shared fixtures: a local stand-in HTTP server for the src/data fetchers."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubServer:
+    """Tiny HTTP/1.1 server that serves canned responses by path.
+
+    ``routes[path]`` is either a dict (served as JSON 200) or a callable
+    ``(handler) -> (status, headers, body_bytes)``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []  # (path, headers, client_port)
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                path = self.path.split("?", 1)[0]
+                stub.requests.append((self.path, dict(self.headers), self.client_address[1]))
+                route = stub.routes.get(path)
+                if route is None:
+                    status, headers, body = 404, {}, b"{}"
+                elif callable(route):
+                    status, headers, body = route(self)
+                else:
+                    status, headers, body = 200, {}, json.dumps(route).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    """Start a stand-in server and point both sources' pools at it."""
+    from src.data import http_client
+
+    server = StubServer()
+    server.start()
+    for source in ("espn", "nba"):
+        http_client.configure(source, base_url=server.base_url, backoff_factor=0)
+    try:
+        yield server
+    finally:
+        http_client.reset()
+        server.stop()
@@ -6,9 +6,11 @@ from src.adapters.scoreboard_adapter import (
     _parse_nba_clock,
 )
 from src.adapters.playbyplay_adapter import (
+    PBPCursor,
     normalize_espn_pbp,
     normalize_nba_pbp,
 )
+from src.data.conditional import NOT_MODIFIED
 
 
 # --- ESPN Scoreboard Adapter ---
@@ -112,6 +114,8 @@ def test_nba_scoreboard_basic():
     assert s.away_score == 85
     assert s.period == 4
     assert s.clock == "5:32"
+    assert s.clock_tenths == 3320
+    assert s.elapsed_seconds == 3 * 720 + 388
     assert s.status == "in"
 
 
@@ -164,6 +168,8 @@ def test_espn_pbp_basic():
     assert len(events) == 1
     assert events[0].event_type == "Jumpball"
     assert events[0].source == "espn"
+    assert events[0].clock_tenths == 6000
+    assert events[0].elapsed_seconds == 120
 
 
 def test_nba_pbp_basic():
@@ -190,3 +196,130 @@ def test_nba_pbp_basic():
     assert events[0].event_type == "jumpball"
     assert events[0].source == "nba"
     assert events[0].player_name == "M. Robinson"
+    assert events[0].clock_tenths == 7200
+    assert events[0].elapsed_seconds == 0
+
+
+# --- Incremental PBP Cursor ---
+
+def _nba_action(n, edited="2026-02-28T01:00:00Z", **kw):
+    action = {
+        "actionNumber": n,
+        "period": 1,
+        "clock": "PT11M00.00S",
+        "actionType": "2pt",
+        "description": f"play {n}",
+        "teamTricode": "NYK",
+        "scoreHome": n,
+        "scoreAway": 0,
+        "edited": edited,
+    }
+    action.update(kw)
+    return action
+
+
+def _nba_raw(actions):
+    return {"game": {"gameId": "0022400100", "actions": actions}}
+
+
+def test_cursor_first_poll_adds_everything():
+    cursor = PBPCursor("nba")
+    delta = cursor.update(_nba_raw([_nba_action(1), _nba_action(2)]))
+    assert [e.event_id for e in delta.added] == ["1", "2"]
+    assert delta.updated == [] and delta.removed == []
+    assert cursor.game_id == "0022400100"
+    assert cursor.last_event_id == "2"
+
+
+def test_cursor_only_normalizes_tail(monkeypatch):
+    import src.adapters.playbyplay_adapter as pbp
+
+    actions = [_nba_action(i) for i in range(1, 501)]
+    cursor = PBPCursor("nba")
+    cursor.update(_nba_raw(actions))
+
+    calls = []
+    real = pbp._nba_action_to_event
+    monkeypatch.setattr(pbp, "_nba_action_to_event", lambda a, g: calls.append(a) or real(a, g))
+    cursor._to_event = pbp._nba_action_to_event
+
+    delta = cursor.update(_nba_raw(actions + [_nba_action(501), _nba_action(502)]))
+    assert [e.event_id for e in delta.added] == ["501", "502"]
+    assert len(calls) == 2
+    assert len(cursor) == 502
+
+
+def test_cursor_detects_edit():
+    cursor = PBPCursor("nba")
+    cursor.update(_nba_raw([_nba_action(1), _nba_action(2)]))
+    edited = _nba_action(1, edited="2026-02-28T01:05:00Z", description="play 1 (corrected)")
+    delta = cursor.update(_nba_raw([edited, _nba_action(2)]))
+    assert delta.added == []
+    assert [e.description for e in delta.updated] == ["play 1 (corrected)"]
+    assert cursor.events[0].description == "play 1 (corrected)"
+
+
+def test_cursor_detects_delete():
+    cursor = PBPCursor("nba")
+    cursor.update(_nba_raw([_nba_action(1), _nba_action(2), _nba_action(3)]))
+    delta = cursor.update(_nba_raw([_nba_action(1), _nba_action(3), _nba_action(4)]))
+    assert delta.removed == ["2"]
+    assert [e.event_id for e in delta.added] == ["4"]
+    assert [e.event_id for e in cursor.events] == ["1", "3", "4"]
+
+
+def test_cursor_detects_delete_and_insert_in_same_slot():
+    cursor = PBPCursor("nba")
+    cursor.update(_nba_raw([_nba_action(1), _nba_action(2), _nba_action(3)]))
+    replaced = [_nba_action(1), _nba_action(7, description="play 7"), _nba_action(3)]
+    delta = cursor.update(_nba_raw(replaced))
+    assert delta.removed == ["2"]
+    assert [e.event_id for e in delta.added] == ["7"]
+    assert [e.event_id for e in cursor.events] == ["1", "7", "3"]
+    assert cursor.events == normalize_nba_pbp(_nba_raw(replaced))
+
+
+def test_cursor_edit_tail_only_fingerprints_recent_actions():
+    cursor = PBPCursor("nba", edit_tail=2)
+    cursor.update(_nba_raw([_nba_action(i) for i in range(1, 6)]))
+    old = _nba_action(1, edited="2026-02-28T01:05:00Z", description="play 1 (corrected)")
+    recent = _nba_action(5, edited="2026-02-28T01:05:00Z", description="play 5 (corrected)")
+    delta = cursor.update(_nba_raw([old] + [_nba_action(i) for i in range(2, 5)] + [recent]))
+    assert [e.event_id for e in delta.updated] == ["5"]
+
+
+def test_cursor_tail_check_catches_old_delete():
+    cursor = PBPCursor("nba", edit_tail=2)
+    cursor.update(_nba_raw([_nba_action(i) for i in range(1, 7)]))
+    delta = cursor.update(_nba_raw([_nba_action(i) for i in (1, 3, 4, 5, 6, 7)]))
+    assert delta.removed == ["2"]
+    assert [e.event_id for e in delta.added] == ["7"]
+
+
+def test_cursor_poll_skips_actions_before_tail():
+    cursor = PBPCursor("nba", edit_tail=2)
+    cursor.update(_nba_raw([_nba_action(i) for i in range(1, 6)]))
+    # Only the first action and the tail are read: a middle one can't be scanned.
+    actions = [_nba_action(1), None, None, _nba_action(4), _nba_action(5), _nba_action(6)]
+    delta = cursor.update(_nba_raw(actions))
+    assert [e.event_id for e in delta.added] == ["6"]
+    assert delta.updated == [] and delta.removed == []
+
+
+def test_cursor_not_modified_is_empty_delta():
+    cursor = PBPCursor("nba")
+    cursor.update(_nba_raw([_nba_action(1)]))
+    assert not cursor.update(NOT_MODIFIED)
+    assert len(cursor) == 1
+
+
+def test_cursor_matches_full_normalize_espn():
+    plays = [
+        {"id": str(i), "period": {"number": 1}, "clock": {"displayValue": "10:00"},
+         "type": {"text": "Jumpshot"}, "text": f"play {i}", "homeScore": i, "awayScore": 0}
+        for i in range(1, 6)
+    ]
+    cursor = PBPCursor("espn", game_id="401584793")
+    cursor.update({"plays": plays[:3]})
+    cursor.update({"plays": plays})
+    assert cursor.events == normalize_espn_pbp({"plays": plays}, game_id="401584793")
@@ -0,0 +1,112 @@
+"""Tests for the historical backfill pipeline."""
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from benchmarks.fixtures import synthetic_espn_pbp
+from src.runtime.backfill import CHECKPOINT_NAME, INCOMING_DIR, Backfill, backfill, date_range
+from src.storage import pbp_store
+
+ESPN_SCOREBOARD_PATH = "/apis/site/v2/sports/basketball/nba/scoreboard"
+ESPN_SUMMARY_PATH = "/apis/site/v2/sports/basketball/nba/summary"
+
+
+def _query(handler, name):
+    return parse_qs(urlsplit(handler.path).query)[name][0]
+
+
+def _serve_season(stub_server, games_per_date=2, live=(), broken=(), extra=None):
+    """Scoreboards with ``games_per_date`` games per date; summaries for each.
+
+    ``extra``: date -> game ids also listed on that date.
+    """
+
+    def scoreboard(handler):
+        date = _query(handler, "dates")
+        events = []
+        for gid in [f"{date}{i}" for i in range(games_per_date)] + list((extra or {}).get(date, ())):
+            events.append({
+                "id": gid,
+                "competitions": [{"competitors": [
+                    {"homeAway": "home", "score": "100", "team": {"abbreviation": "BOS"}},
+                    {"homeAway": "away", "score": "90", "team": {"abbreviation": "NY"}},
+                ]}],
+                "status": {"period": 4, "displayClock": "0:00",
+                           "type": {"state": "in" if gid in live else "post"}},
+            })
+        return 200, {}, json.dumps({"events": events}).encode()
+
+    def summary(handler):
+        gid = _query(handler, "event")
+        if gid in broken:
+            return 404, {}, b"{}"
+        return 200, {}, json.dumps(synthetic_espn_pbp(gid, n_plays=40)).encode()
+
+    stub_server.routes[ESPN_SCOREBOARD_PATH] = scoreboard
+    stub_server.routes[ESPN_SUMMARY_PATH] = summary
+
+
+def _summary_requests(stub_server):
+    return [p for p, _, _ in stub_server.requests if p.startswith(ESPN_SUMMARY_PATH)]
+
+
+def test_date_range():
+    assert date_range("20260227", "20260302") == ["20260227", "20260228", "20260301", "20260302"]
+    assert date_range("20260301", "20260228") == []
+
+
+def test_backfill_archives_final_games(stub_server, tmp_path):
+    _serve_season(stub_server, live={"202603011"})
+    seen = []
+    stats = backfill(str(tmp_path), "20260228", "20260301", io_workers=4, processes=0,
+                     on_progress=lambda s: seen.append(s.games))
+
+    assert (stats.dates, stats.games, stats.skipped) == (2, 3, 1)
+    assert stats.events == 3 * 40
+    assert stats.games_per_sec > 0
+    assert seen == [1, 2, 3]
+    assert pbp_store.list_games(str(tmp_path)) == ["202602280", "202602281", "202603010"]
+    assert pbp_store.read(str(tmp_path), game_ids=["202602280"]).num_rows == 40
+
+    checkpoint = json.loads((tmp_path / CHECKPOINT_NAME).read_text())
+    assert checkpoint["dates"] == ["20260228"]  # 20260301 still has a live game
+    assert set(checkpoint["games"]) == {"202602280", "202602281", "202603010"}
+
+
+def test_rerun_resumes_from_checkpoint(stub_server, tmp_path):
+    _serve_season(stub_server, broken={"202602281"})
+    stats = backfill(str(tmp_path), "20260228", "20260301", processes=0)
+    assert set(stats.failed) == {"202602281"}
+    assert stats.games == 3
+
+    _serve_season(stub_server)  # the missing game is back
+    before = len(_summary_requests(stub_server))
+    stats = backfill(str(tmp_path), "20260228", "20260301", processes=0)
+    assert (stats.games, stats.skipped, stats.failed) == (1, 1, {})
+    assert len(_summary_requests(stub_server)) - before == 1
+
+    # Everything done: nothing is fetched at all.
+    before = len(stub_server.requests)
+    stats = Backfill(str(tmp_path), processes=0).run("20260228", "20260301")
+    assert (stats.dates, stats.games) == (0, 0)
+    assert len(stub_server.requests) == before
+
+
+def test_backfill_with_process_pool(stub_server, tmp_path):
+    _serve_season(stub_server, games_per_date=3)
+    stats = backfill(str(tmp_path), "20260228", "20260228", io_workers=3, processes=2)
+    assert (stats.games, stats.failed) == (3, {})
+    assert len(pbp_store.list_games(str(tmp_path))) == 3
+
+
+def test_game_listed_on_two_dates_fetched_once(stub_server, tmp_path):
+    _serve_season(stub_server, games_per_date=1, extra={"20260301": ["202602280"]})
+    stats = backfill(str(tmp_path), "20260228", "20260301", processes=0)
+    assert (stats.games, stats.failed) == (2, {})
+    assert len(_summary_requests(stub_server)) == 2
+    assert sorted(json.loads((tmp_path / CHECKPOINT_NAME).read_text())["dates"]) == ["20260228", "20260301"]
+    assert not list((tmp_path / INCOMING_DIR).iterdir())
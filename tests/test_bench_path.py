@@ -0,0 +1,57 @@
+"""Tests for the path benchmark's measurement and baseline check."""
+
+import dataclasses
+
+import pytest
+
+from benchmarks.bench_path import (
+    compare,
+    load_baseline,
+    percentile,
+    run,
+    save_baseline,
+    synthetic_inputs,
+)
+
+CASES = {
+    "decode espn scoreboard", "decode nba pbp", "normalize_espn_scoreboard",
+    "normalize_nba_scoreboard", "normalize_espn_pbp", "normalize_nba_pbp",
+    "classify_regime (slate)", "render_scoreboard", "render_eval",
+    "season decode+normalize_nba_pbp",
+}
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert (percentile(values, 50), percentile(values, 95), percentile(values, 99)) == (50, 95, 99)
+    assert percentile([7], 99) == 7 and percentile([], 50) == 0.0
+
+
+def test_run_covers_path_and_baseline_round_trip(tmp_path):
+    results = run(synthetic_inputs(), samples=4, season_games=2)
+    assert {r.name for r in results} == CASES
+    for r in results:
+        assert r.throughput > 0 and r.p50_us <= r.p95_us <= r.p99_us and r.peak_kib >= 0
+
+    path = tmp_path / "baseline.json"
+    save_baseline(results, str(path))
+    baseline = load_baseline(str(path))
+    assert compare(results, baseline) == []
+
+    slower = [dataclasses.replace(r, p50_us=r.p50_us * 2 + 1) for r in results]
+    assert len(compare(slower, baseline)) == len(CASES)
+    heavier = [dataclasses.replace(results[0], peak_kib=results[0].peak_kib * 2 + 10)]
+    assert compare(heavier, baseline) == [
+        f"{results[0].name}: peak {heavier[0].peak_kib:,.1f}KiB "
+        f"vs baseline {results[0].peak_kib:,.1f}KiB"
+    ]
+    assert compare(slower, {"cases": {}}) == []
+    assert compare(slower, baseline, check_time=False) == []
+
+
+def test_compare_refuses_other_input_kind(tmp_path):
+    results = run(synthetic_inputs(), samples=2, season_games=1)
+    path = tmp_path / "baseline.json"
+    save_baseline(results, str(path), inputs="synthetic")
+    with pytest.raises(ValueError, match="synthetic inputs, this run on recording"):
+        compare(results, load_baseline(str(path)), inputs="recording")
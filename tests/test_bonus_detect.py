@@ -1,7 +1,11 @@
-"""Tests for bonus detection stub."""
+"""Tests for bonus detection and the foul tracker."""
 
+from src.adapters.playbyplay_adapter import PBPEvent
 from src.state.game_state import GameState
 from src.state.bonus_detect import detect_bonus
+from src.state.clock import parse_clock_tenths
+from src.state.foul_tracker import FoulTracker
+from src.state.pbp_reducer import PBPReducer
 
 
 def test_bonus_defaults():
@@ -23,3 +27,59 @@ def test_bonus_from_extra():
     result = detect_bonus(gs)
     assert result["home_bonus"] is True
     assert result["away_bonus"] is False
+
+
+# --- FoulTracker ---
+
+def _foul_n(tracker, side, n, period=1, clock="8:00", start=0):
+    for i in range(n):
+        tracker.add(f"{side}-{period}-{start + i}", period, side, parse_clock_tenths(clock))
+
+
+def test_fifth_foul_penalty_in_regulation():
+    t = FoulTracker()
+    _foul_n(t, "away", 3)
+    assert t.bonus()["home_bonus"] is False
+    _foul_n(t, "away", 1, start=3)
+    assert t.fouls("away") == 4
+    assert t.bonus()["home_bonus"] is True
+    assert t.bonus()["away_bonus"] is False
+
+
+def test_last_two_minutes_rule():
+    t = FoulTracker()
+    _foul_n(t, "home", 1, clock="PT05M00.00S")
+    _foul_n(t, "home", 1, clock="PT01M45.00S", start=1)
+    assert t.fouls("home") == 2
+    assert t.bonus()["away_bonus"] is True
+
+
+def test_counts_reset_each_period_and_overtime_limit():
+    t = FoulTracker()
+    _foul_n(t, "away", 5, period=4)
+    assert t.bonus()["home_bonus"] is True
+    _foul_n(t, "away", 2, period=5)
+    assert t.bonus()["home_bonus"] is False
+    _foul_n(t, "away", 1, period=5, start=2)
+    assert t.bonus()["home_bonus"] is True
+    assert t.bonus(period=4)["home_bonus"] is True
+
+
+def test_remove_undoes_foul():
+    t = FoulTracker()
+    _foul_n(t, "away", 4)
+    t.remove("away-1-3")
+    assert t.fouls("away") == 3
+    assert t.bonus()["home_bonus"] is False
+
+
+def test_detect_bonus_from_tracker_and_reducer():
+    gs = GameState(game_id="5", source="nba", status="in", home_abbr="NYK", away_abbr="MIA")
+    reducer = PBPReducer(gs)
+    for i in range(4):
+        ev = PBPEvent(event_id=str(i), source="nba", period=2, clock="PT06M00.00S",
+                      event_type="foul", team_abbr="MIA", extra={"sub_type": "personal"})
+        reducer.apply(ev)
+    assert detect_bonus(gs, reducer.fouls)["home_bonus"] is True
+    assert detect_bonus(gs)["home_bonus"] is True
+    assert detect_bonus(gs)["away_bonus"] is False
@@ -0,0 +1,88 @@
+"""Tests for compact PBPEvent / GameState representations."""
+
+from src.adapters import pbp_compact
+from src.adapters.pbp_compact import CompactPBPEvent, PBPEventBatch, to_compact
+from src.adapters.playbyplay_adapter import PBPEvent, normalize_nba_pbp
+from src.state.game_state import CompactGameState, GameState
+from src.state.regime import classify_regime
+
+
+def _events():
+    raw = {
+        "game": {
+            "gameId": "0022400100",
+            "actions": [
+                {"actionNumber": i, "period": 1 + i // 3, "clock": "PT05M00.00S",
+                 "actionType": "foul" if i % 2 else "2pt", "subType": "personal" if i % 2 else "",
+                 "teamTricode": "NYK", "playerNameI": "J. Brunson", "description": f"play {i}",
+                 "scoreHome": str(i), "scoreAway": "0"}
+                for i in range(1, 8)
+            ],
+        }
+    }
+    return normalize_nba_pbp(raw)
+
+
+def test_compact_event_same_attributes_and_interning():
+    events = _events()
+    compact = to_compact(events)
+    assert compact == events
+    assert compact[0].team_abbr is compact[1].team_abbr
+    assert compact[0].home_score == 1
+    assert not hasattr(compact[0], "__dict__")
+
+
+def test_compact_event_lazy_extra_is_private():
+    a = CompactPBPEvent(event_id="1", extra={"sub_type": "personal"})
+    b = CompactPBPEvent(event_id="2", extra={"sub_type": "personal"})
+    a.extra["sub_type"] = "shooting"
+    assert b.extra == {"sub_type": "personal"}
+    c = CompactPBPEvent(event_id="3")
+    assert c._extra is None
+    c.extra["k"] = 1
+    assert c.to_event() == PBPEvent(event_id="3", extra={"k": 1})
+
+
+def test_shared_extras_table_is_bounded(monkeypatch):
+    monkeypatch.setattr(pbp_compact, "FROZEN_EXTRAS_MAX", 3)
+    monkeypatch.setattr(pbp_compact, "_frozen_extras", type(pbp_compact._frozen_extras)())
+    first = CompactPBPEvent(event_id="0", extra={"n": 0})
+    for i in range(10):
+        CompactPBPEvent(event_id=str(i), extra={"n": i})
+    assert len(pbp_compact._frozen_extras) == 3
+    assert first.extra == {"n": 0}  # evicted from the table, still intact on the event
+    again = CompactPBPEvent(event_id="x", extra={"n": 9})
+    assert again._extra is CompactPBPEvent(event_id="y", extra={"n": 9})._extra
+
+
+def test_batch_roundtrip_and_columns():
+    events = _events()
+    batch = PBPEventBatch.from_events(events)
+    assert len(batch) == len(events)
+    assert batch.to_events() == events
+    assert batch[-1] == events[-1]
+    assert batch.column("event_id") == [e.event_id for e in events]
+    assert batch.column("period") == [e.period for e in events]
+    assert batch.dictionary("event_type") == ["foul", "2pt"]
+
+
+def test_batch_falls_back_to_string_ids():
+    batch = PBPEventBatch([PBPEvent(event_id="7"), PBPEvent(event_id="a-1"), PBPEvent(event_id="007")])
+    assert batch.column("event_id") == ["7", "a-1", "007"]
+
+
+def test_compact_game_state_matches_dataclass():
+    gs = GameState(game_id="1", source="nba", status="in", home_abbr="NYK", away_abbr="MIA",
+                   home_score=100, away_score=98, period=4, clock="2:00")
+    compact = CompactGameState.from_state(gs)
+    assert compact == gs
+    assert compact.score_diff == 2
+    assert compact._extra is None
+    assert classify_regime(compact) == classify_regime(gs) == "clutch"
+    assert compact.to_state() == gs
+    assert CompactGameState("2", "espn", "post").is_final
+
+    extra = {"sources": ["nba"]}
+    frozen = CompactGameState("3", "nba", "in", extra=extra)
+    extra["sources"] = ["espn"]
+    assert frozen.extra == {"sources": ["nba"]}
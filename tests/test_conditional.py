@@ -0,0 +1,84 @@
+"""Tests for conditional GET (ETag / If-Modified-Since) in the fetchers."""
+
+import json
+
+from src.data.conditional import NOT_MODIFIED, ValidatorStore, is_not_modified, request_key
+from src.data.espn_scoreboard import fetch_scoreboard as fetch_espn_scoreboard
+from src.data.nba_playbyplay import fetch_playbyplay as fetch_nba_pbp
+from src.data.nba_scoreboard import fetch_scoreboard as fetch_nba_scoreboard
+from src.data.playbyplay_batch import fetch_playbyplay_many
+
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+NBA_PBP_PATH = "/static/json/liveData/playbyplay/playbyplay_{}.json"
+
+
+def _etag_route(payload, etag='"v1"'):
+    body = json.dumps(payload).encode()
+
+    def route(handler):
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag, "Last-Modified": "Sat, 28 Feb 2026 01:00:00 GMT"}, body
+    return route
+
+
+def test_second_poll_is_not_modified(stub_server):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _etag_route({"scoreboard": {"games": []}})
+    validators = ValidatorStore()
+
+    first = fetch_nba_scoreboard(validators=validators)
+    second = fetch_nba_scoreboard(validators=validators)
+
+    assert first == {"scoreboard": {"games": []}}
+    assert second is NOT_MODIFIED
+    assert is_not_modified(second)
+    _, headers, _ = stub_server.requests[1]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "Sat, 28 Feb 2026 01:00:00 GMT"
+
+
+def test_without_validators_always_full(stub_server):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _etag_route({"scoreboard": {"games": []}})
+    fetch_nba_scoreboard()
+    assert fetch_nba_scoreboard() == {"scoreboard": {"games": []}}
+    _, headers, _ = stub_server.requests[1]
+    assert "If-None-Match" not in headers
+
+
+def test_changed_payload_returns_new_body(stub_server):
+    state = {"etag": '"v1"'}
+
+    def route(handler):
+        if handler.headers.get("If-None-Match") == state["etag"]:
+            return 304, {}, b""
+        return 200, {"ETag": state["etag"]}, json.dumps({"v": state["etag"]}).encode()
+
+    stub_server.routes[NBA_PBP_PATH.format("1")] = route
+    validators = ValidatorStore()
+    assert fetch_nba_pbp("1", validators) == {"v": '"v1"'}
+    state["etag"] = '"v2"'
+    assert fetch_nba_pbp("1", validators) == {"v": '"v2"'}
+    assert fetch_nba_pbp("1", validators) is NOT_MODIFIED
+
+
+def test_validators_keyed_by_params(stub_server):
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/scoreboard"] = _etag_route({"events": []})
+    validators = ValidatorStore()
+    fetch_espn_scoreboard("20260227", validators=validators)
+    assert fetch_espn_scoreboard("20260228", validators=validators) == {"events": []}
+    assert fetch_espn_scoreboard("20260228", validators=validators) is NOT_MODIFIED
+    assert len(validators) == 2
+
+
+def test_batch_passes_validators(stub_server):
+    for gid in ("a", "b"):
+        stub_server.routes[NBA_PBP_PATH.format(gid)] = _etag_route({"game": {"gameId": gid}})
+    validators = ValidatorStore()
+    fetch_playbyplay_many(["a", "b"], validators=validators)
+    res = fetch_playbyplay_many(["a", "b"], validators=validators)
+    assert res.results == {"a": NOT_MODIFIED, "b": NOT_MODIFIED}
+
+
+def test_request_key_sorted_params():
+    assert request_key("u", {"b": 1, "a": 2}) == request_key("u", {"a": 2, "b": 1})
+    assert request_key("u") == "u"
@@ -0,0 +1,189 @@
+"""Tests for the on-disk response cache."""
+
+import json
+import os
+import threading
+
+import pytest
+import requests
+
+from src.data.conditional import ValidatorStore, is_not_modified, request_key
+from src.data.disk_cache import DiskCache, caching, payload_status, pins_date
+from src.data.nba_playbyplay import fetch_playbyplay
+from src.data.nba_scoreboard import fetch_scoreboard
+
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+def _scoreboard(status, score=80):
+    return {"scoreboard": {"games": [{"gameId": "1", "gameStatus": status, "period": 4,
+                                      "homeTeam": {"teamTricode": "NYK", "score": score},
+                                      "awayTeam": {"teamTricode": "MIA", "score": 80}}]}}
+
+
+def _route(payloads, etag=True):
+    """Serve payloads in turn (last one repeats), honoring If-None-Match."""
+    state = {"i": 0}
+
+    def route(handler):
+        i = min(state["i"], len(payloads) - 1)
+        state["i"] += 1
+        tag = f'"{i}"'
+        if etag and handler.headers.get("If-None-Match") == tag:
+            return 304, {"ETag": tag}, b""
+        return 200, {"ETag": tag} if etag else {}, json.dumps(payloads[i]).encode()
+
+    return route
+
+
+def test_payload_status():
+    assert payload_status(_scoreboard(3)) == "post"
+    assert payload_status(_scoreboard(2)) == "in"
+    assert payload_status({"events": [{"status": {"type": {"state": "post"}}},
+                                      {"status": {"type": {"state": "pre"}}}]}) == "pre"
+    assert payload_status({"game": {"actions": [{"actionType": "game", "subType": "end"}]}}) == "post"
+    assert payload_status({"header": {"competitions": [{"status": {"type": {"state": "in"}}}]}}) == "in"
+    assert payload_status({"events": []}) is None
+    assert payload_status([1, 2]) is None
+
+
+def test_final_games_served_from_disk_across_runs(stub_server, tmp_path):
+    gid = "0022500802"
+    stub_server.routes[f"/static/json/liveData/playbyplay/playbyplay_{gid}.json"] = {
+        "game": {"gameId": gid, "actions": [{"actionType": "game", "subType": "end"}]}}
+    with caching(str(tmp_path)) as cache:
+        first = fetch_playbyplay(gid)
+    assert cache.misses == 1
+    assert list(tmp_path.rglob("*.json.gz"))
+
+    # A new process (new DiskCache over the same directory) never hits the network.
+    with caching(str(tmp_path), clock=lambda: 1e12) as cache:
+        assert fetch_playbyplay(gid) == first
+    assert cache.hits == 1
+    assert len(stub_server.requests) == 1
+
+
+def test_pins_date():
+    assert pins_date("https://x/scoreboard", {"dates": "20260228"})
+    assert pins_date("https://x/summary", {"event": "401"})
+    assert pins_date("https://cdn/playbyplay/playbyplay_0022500802.json", None)
+    assert not pins_date("https://cdn/scoreboard/todaysScoreboard_00.json", None)
+
+
+def test_all_final_today_board_rolls_over(stub_server, tmp_path):
+    tonight = _scoreboard(3, 95)
+    tomorrow = {"scoreboard": {"games": [{**tonight["scoreboard"]["games"][0], "gameId": "2",
+                                           "gameStatus": 1}]}}
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _route([tonight, tomorrow])
+    now = {"t": 1000.0}
+    with caching(str(tmp_path), clock=lambda: now["t"]) as cache:
+        fetch_scoreboard()
+        now["t"] += 60
+        fetch_scoreboard()  # still fresh
+        assert cache.hits == 1
+
+        now["t"] += 12 * 3600  # next day: same URL, new slate
+        assert fetch_scoreboard()["scoreboard"]["games"][0]["gameId"] == "2"
+    assert len(stub_server.requests) == 2
+
+
+def test_live_entries_expire_and_revalidate(stub_server, tmp_path):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _route([_scoreboard(2, 90)])
+    now = {"t": 1000.0}
+    with caching(str(tmp_path), clock=lambda: now["t"]) as cache:
+        fetch_scoreboard()
+        now["t"] += 1
+        fetch_scoreboard()  # fresh
+        assert (cache.hits, len(stub_server.requests)) == (1, 1)
+
+        now["t"] += 10  # past the "in" TTL
+        data = fetch_scoreboard()
+        assert data["scoreboard"]["games"][0]["homeTeam"]["score"] == 90
+        assert cache.revalidated == 1
+        assert stub_server.requests[-1][1]["If-None-Match"] == '"0"'
+
+        now["t"] += 1  # revalidation refreshed the entry
+        fetch_scoreboard()
+        assert cache.hits == 2
+    assert len(stub_server.requests) == 2
+
+
+def test_live_entry_replaced_when_changed(stub_server, tmp_path):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _route([_scoreboard(2, 90), _scoreboard(3, 95)])
+    now = {"t": 1000.0}
+    with caching(str(tmp_path), clock=lambda: now["t"]):
+        fetch_scoreboard()
+        now["t"] += 10
+        assert fetch_scoreboard()["scoreboard"]["games"][0]["homeTeam"]["score"] == 95
+        now["t"] += 60  # now final (a "today" board: fresh for minutes, not forever)
+        assert fetch_scoreboard()["scoreboard"]["games"][0]["homeTeam"]["score"] == 95
+    assert len(stub_server.requests) == 2
+
+
+def test_client_validators_get_304_from_cache(stub_server, tmp_path):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = _route([_scoreboard(3)])
+    validators = ValidatorStore()
+    with caching(str(tmp_path)):
+        assert not is_not_modified(fetch_scoreboard(validators=validators))
+        assert is_not_modified(fetch_scoreboard(validators=validators))
+    assert len(stub_server.requests) == 1
+
+
+def test_errors_not_cached(stub_server, tmp_path):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = lambda h: (404, {}, b"{}")
+    with caching(str(tmp_path)):
+        with pytest.raises(requests.HTTPError):
+            fetch_scoreboard()
+    assert not list(tmp_path.rglob("*.json.gz"))
+
+
+def test_lru_eviction_by_size(stub_server, tmp_path):
+    for gid in ("a", "b", "c"):
+        stub_server.routes[f"/static/json/liveData/playbyplay/playbyplay_{gid}.json"] = {
+            "game": {"gameId": gid, "actions": [{"actionType": "game", "subType": "end",
+                                                  "description": os.urandom(600).hex()}]}}
+    with caching(str(tmp_path)) as cache:
+        fetch_playbyplay("a")
+        (path_a,) = tmp_path.rglob("*.json.gz")
+        fetch_playbyplay("b")
+        (path_b,) = set(tmp_path.rglob("*.json.gz")) - {path_a}
+        os.utime(path_a, (1, 1))
+        os.utime(path_b, (2, 2))
+        cache.max_bytes = int(cache.size * 1.25)  # room for two entries
+
+        fetch_playbyplay("a")  # hit: a becomes most recently used
+        fetch_playbyplay("c")  # over budget: evicts b
+        assert cache.size <= cache.max_bytes
+        assert path_a.exists() and not path_b.exists()
+        fetch_playbyplay("a")
+        assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_concurrent_writers_never_expose_partial_entries(tmp_path):
+    body = json.dumps(_scoreboard(3)).encode()
+    caches = [DiskCache(str(tmp_path)) for _ in range(4)]
+    path = caches[0]._path(request_key("k", None))
+
+    class Resp:
+        content = body
+        headers = {"ETag": '"1"'}
+
+    def writer(cache):
+        for _ in range(20):
+            cache.store("k", None, Resp())
+
+    seen = []
+
+    def reader():
+        for _ in range(200):
+            entry = caches[0]._read(path)
+            if entry is not None:
+                seen.append(entry["body"] == body)
+
+    threads = [threading.Thread(target=writer, args=(c,)) for c in caches] + [threading.Thread(target=reader)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert all(seen)
+    assert not [p for p in tmp_path.rglob("*") if ".tmp" in p.name]
@@ -1,6 +1,9 @@
 """Tests for GameState dataclass."""
 
-from src.state.game_state import GameState
+import dataclasses
+
+from src.state.game_state import CompactGameState, GameState
+from src.state.regime import classify_regime
 
 
 def test_game_state_defaults():
@@ -28,3 +31,55 @@ def test_game_state_final():
 def test_game_state_negative_diff():
     gs = GameState(game_id="4", source="nba", status="in", home_score=80, away_score=92)
     assert gs.score_diff == -12
+
+
+def test_game_state_clock_fields_derived():
+    gs = GameState(game_id="5", source="espn", status="in", period=2, clock="5:32")
+    assert gs.clock_tenths == 3320
+    assert gs.elapsed_seconds == 720 + 388
+    gs.period = 3
+    gs.set_clock("45.3")
+    assert gs.clock_tenths == 453
+    assert gs.elapsed_seconds == 1440 + 674
+
+
+def test_game_state_reassigned_clock_rederives():
+    gs = GameState(game_id="7", source="nba", status="in", period=4, clock="6:00", clock_tenths=3604)
+    assert classify_regime(gs) == "closing"
+    gs.clock = "1:30"
+    assert (gs.clock_tenths, gs.elapsed_seconds) == (900, 2160 + 630)
+    assert classify_regime(gs) == "clutch"
+    compact = CompactGameState.from_state(gs)
+    compact.clock = "3:00"
+    assert (compact.clock_tenths, compact.elapsed_seconds) == (1800, 2160 + 540)
+
+
+def test_game_state_explicit_clock_tenths_kept():
+    gs = GameState(game_id="6", source="nba", status="in", period=5, clock="0:04", clock_tenths=47)
+    assert gs.clock_tenths == 47
+    assert gs.elapsed_seconds == 2880 + 295
+
+
+def test_game_state_replace_rederives_stale_clock_tenths():
+    gs = GameState(game_id="8", source="nba", status="in", period=4, clock="5:32", clock_tenths=3324)
+    moved = dataclasses.replace(gs, clock="1:59")
+    assert (moved.clock_tenths, moved.elapsed_seconds) == (1190, 2160 + 601)
+    assert classify_regime(moved) == "clutch"
+    assert dataclasses.replace(gs, home_score=3).clock_tenths == 3324  # same clock: precision kept
+    gs.set_clock("1:00", 3324)  # tenths from some other clock
+    assert gs.clock_tenths == 600
+    compact = CompactGameState(game_id="8", source="nba", status="in", clock="0:04", clock_tenths=3324)
+    assert compact.clock_tenths == 40
+
+
+def test_parse_clock_tenths_formats():
+    from src.state.clock import parse_clock_tenths
+
+    assert parse_clock_tenths("PT05M32.40S") == 3324
+    assert parse_clock_tenths("PT00M04.99S") == 49
+    assert parse_clock_tenths("PT1M2S") == 620
+    assert parse_clock_tenths("11:07") == 6670
+    assert parse_clock_tenths("45.3") == 453
+    assert parse_clock_tenths("END") == 0
+    assert parse_clock_tenths("") == 0
+    assert parse_clock_tenths("x:yy") is None
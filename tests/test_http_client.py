@@ -0,0 +1,72 @@
+"""Tests for the pooled HTTP client and the fetchers that use it."""
+
+import pytest
+
+from src.data import http_client
+from src.data.espn_scoreboard import fetch_scoreboard as fetch_espn_scoreboard
+from src.data.nba_playbyplay import fetch_playbyplay as fetch_nba_pbp
+
+
+def test_fetcher_uses_stub_server(stub_server):
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/scoreboard"] = {"events": []}
+    raw = fetch_espn_scoreboard("20260228")
+    assert raw == {"events": []}
+    path, _, _ = stub_server.requests[0]
+    assert "dates=20260228" in path
+
+
+def test_nba_default_headers_and_encoding(stub_server):
+    stub_server.routes["/static/json/liveData/playbyplay/playbyplay_0022400001.json"] = {"game": {}}
+    fetch_nba_pbp("0022400001")
+    _, headers, _ = stub_server.requests[0]
+    assert headers["Referer"] == "https://www.nba.com/"
+    assert "gzip" in headers["Accept-Encoding"]
+
+
+def test_keep_alive_reuses_connection(stub_server):
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/scoreboard"] = {"events": []}
+    for _ in range(5):
+        fetch_espn_scoreboard("20260228")
+    ports = {port for _, _, port in stub_server.requests}
+    assert len(stub_server.requests) == 5
+    assert len(ports) == 1
+
+
+def test_retries_transient_errors(stub_server):
+    calls = []
+
+    def flaky(handler):
+        calls.append(1)
+        if len(calls) < 3:
+            return 503, {}, b"{}"
+        return 200, {}, b'{"events": [1]}'
+
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/scoreboard"] = flaky
+    http_client.configure("espn", retries=2)
+    assert fetch_espn_scoreboard("20260228") == {"events": [1]}
+    assert len(calls) == 3
+
+
+def test_exhausted_retries_raise_http_error(stub_server):
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/scoreboard"] = lambda h: (503, {}, b"{}")
+    http_client.configure("espn", retries=1)
+    with pytest.raises(Exception) as exc:
+        fetch_espn_scoreboard("20260228")
+    assert "503" in str(exc.value)
+
+
+def test_configure_rebuilds_session():
+    try:
+        first = http_client.get_session("espn")
+        assert http_client.get_session("espn") is first
+        http_client.configure("espn", pool_maxsize=4)
+        assert http_client.get_session("espn") is not first
+        assert http_client.get_config("espn").pool_maxsize == 4
+    finally:
+        http_client.reset()
+    assert http_client.get_config("espn").pool_maxsize == 16
+
+
+def test_rebase_keeps_path_and_query():
+    url = http_client._rebase("https://cdn.nba.com/a/b.json?x=1", "http://127.0.0.1:9000")
+    assert url == "http://127.0.0.1:9000/a/b.json?x=1"
@@ -0,0 +1,141 @@
+"""Tests for the pub/sub state hub, its SSE server and the upstream poller."""
+
+import asyncio
+import json
+
+from benchmarks.fixtures import synthetic_nba_pbp
+from src.adapters.playbyplay_adapter import PBPCursor
+from src.runtime.hub import HubServer, StateHub, read_events
+from src.runtime.hub_poller import HubPoller
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src.state.game_state import GameState
+
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+NBA_PBP_PATH = "/static/json/liveData/playbyplay/playbyplay_0022400100.json"
+
+
+def _state(gid="g1", **kw):
+    return GameState(game_id=gid, source="nba", status="in", home_abbr="NYK", away_abbr="MIA", **kw)
+
+
+def _delta(n_actions):
+    return PBPCursor("nba", "0022400100").update(synthetic_nba_pbp(n_actions=n_actions))
+
+
+async def _get(port, path):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, body = raw.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_publish_diffs():
+    hub = StateHub()
+    first = hub.publish_state(_state(home_score=10))
+    assert first.kind == "game"
+    assert hub.publish_state(_state(home_score=10)) is None
+    diff = hub.publish_state(_state(home_score=12))
+    assert diff.kind == "game_diff"
+    payload = json.loads(diff.frame.decode().split("data: ", 1)[1])
+    assert payload["changes"] == {"home_score": 12, "score_diff": 12}
+    assert (first.seq, diff.seq) == (1, 2)
+
+
+def test_snapshot_keeps_recent_events():
+    hub = StateHub(recent_events=5)
+    hub.publish_state(_state("0022400100"))
+    delta = _delta(12)
+    hub.publish_pbp("0022400100", delta)
+    snap = hub.snapshot()
+    assert [g["game_id"] for g in snap["games"]] == ["0022400100"]
+    assert [e["event_id"] for e in snap["events"]["0022400100"]] == [str(n) for n in range(8, 13)]
+    assert hub.snapshot({"other"}) == {"seq": 2, "games": [], "events": {}}
+
+
+def test_slow_subscriber_dropped():
+    async def main():
+        hub = StateHub(max_queue=3)
+        sub, _ = hub.subscribe()
+        other, _ = hub.subscribe({"g2"})
+        for score in range(5):
+            hub.publish_state(_state(home_score=score))
+        assert sub.lagged and not other.lagged
+        assert await other.next_batch(0.01) == []
+    asyncio.run(main())
+
+
+def test_sse_fan_out_snapshot_then_diffs():
+    async def main():
+        hub = StateHub()
+        hub.publish_state(_state("g1", home_score=50))
+        server = HubServer(hub, port=0)
+        await server.start()
+
+        async def client(games=None):
+            received = []
+            async for event, data in read_events("127.0.0.1", server.port, games):
+                received.append((event, data))
+                if event == "game_diff":
+                    return received
+
+        tasks = [asyncio.create_task(client()) for _ in range(100)]
+        tasks.append(asyncio.create_task(client(["g2"])))
+        while hub.subscribers < 101:
+            await asyncio.sleep(0.01)
+        hub.publish_state(_state("g2", home_score=1))
+        hub.publish_state(_state("g2", home_score=3))
+        results = await asyncio.wait_for(asyncio.gather(*tasks), 10)
+
+        for received in results[:-1]:
+            (e0, snap), (e1, game), (e2, diff) = received
+            assert (e0, e1, e2) == ("snapshot", "game", "game_diff")
+            assert [g["home_score"] for g in snap["games"]] == [50]
+            assert game["game_id"] == "g2"
+            assert diff["changes"] == {"home_score": 3, "score_diff": 3}
+        filtered = results[-1]
+        assert filtered[0][1]["games"] == []  # snapshot filtered to g2
+
+        assert await _get(server.port, "/health") == (200, {"seq": 3, "subscribers": 0})
+        status, snap = await _get(server.port, "/snapshot?games=g1")
+        assert status == 200 and [g["game_id"] for g in snap["games"]] == ["g1"]
+        assert (await _get(server.port, "/nope"))[0] == 404
+        await server.stop()
+    asyncio.run(main())
+
+
+def test_poller_upstream_independent_of_subscribers(stub_server):
+    stub_server.routes[NBA_SCOREBOARD_PATH] = {"scoreboard": {"games": [{
+        "gameId": "0022400100", "gameStatus": 2, "period": 1, "gameClock": "PT11M00.00S",
+        "homeTeam": {"teamTricode": "NYK", "score": 0}, "awayTeam": {"teamTricode": "MIA", "score": 0},
+    }]}}
+    raw = synthetic_nba_pbp(n_actions=40)
+    stub_server.routes[NBA_PBP_PATH] = raw
+
+    async def run(n_subscribers):
+        hub = StateHub()
+        subs = [hub.subscribe()[0] for _ in range(n_subscribers)]
+        poller = HubPoller(hub, scoreboard=MergedScoreboard(sources=("nba",)))
+        await poller.poll_scoreboard()
+        for gid in poller.scheduler.due():
+            await poller.poll_pbp(gid)
+        return hub, subs, poller
+
+    before = len(stub_server.requests)
+    _, _, poller = asyncio.run(run(0))
+    quiet = len(stub_server.requests) - before
+
+    before = len(stub_server.requests)
+    hub, subs, poller = asyncio.run(run(200))
+    assert len(stub_server.requests) - before == quiet == poller.upstream_requests == 2
+
+    last = raw["game"]["actions"][-1]
+    state = hub.state("0022400100")
+    assert (state["home_score"], state["away_score"]) == (int(last["scoreHome"]), int(last["scoreAway"]))
+    assert state["period"] == 4
+
+    async def kinds():
+        return [m.kind for m in await subs[0].next_batch(0)]
+    assert asyncio.run(kinds()) == ["game", "pbp", "game_diff"]
@@ -0,0 +1,21 @@
+"""Entry points load heavy dependencies lazily.
+
+Millisecond budgets depend on the machine and are enforced by
+``python -m benchmarks.bench_import --check``, not here.
+"""
+
+import pytest
+
+from benchmarks.bench_import import ENTRY_POINTS, Entry, measure
+
+
+@pytest.mark.parametrize("entry", ENTRY_POINTS, ids=lambda e: e.name)
+def test_entry_point_imports_no_heavy_dependency(entry):
+    result = measure(entry, runs=1)
+    assert result.heavy == [], f"{entry.name} imports {result.heavy} at module load"
+
+
+def test_measure_flags_eager_heavy_import():
+    result = measure(Entry("numpy", budget_ms=1_000), runs=1)
+    assert result.heavy == ["numpy"] and not result.ok
+
@@ -0,0 +1,55 @@
+"""Tests for the pluggable JSON decoder."""
+
+import json
+
+import pytest
+
+from benchmarks.fixtures import synthetic_espn_pbp, synthetic_nba_scoreboard
+from src.data import json_decode
+from src.data.nba_scoreboard import fetch_scoreboard
+
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    previous = json_decode.backend()
+    json_decode.reset_stats()
+    yield
+    json_decode.set_backend(previous)
+    json_decode.reset_stats()
+
+
+def test_default_backend_is_best_available():
+    available = json_decode.available_backends()
+    assert available[-1] == "json"
+    assert json_decode.set_backend() == available[0]
+
+
+@pytest.mark.parametrize("name", json_decode.available_backends())
+def test_backends_agree(name):
+    payload = synthetic_espn_pbp(game_id="401", n_plays=50)
+    payload["text"] = "café — \U0001f3c0"
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    json_decode.set_backend(name)
+    assert json_decode.decode("espn", body) == payload
+    with pytest.raises(ValueError):
+        json_decode.decode("espn", b'{"broken": ')
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_decode.set_backend("yaml")
+
+
+def test_fetchers_record_decode_stats(stub_server):
+    payload = synthetic_nba_scoreboard(n_games=3)
+    stub_server.routes[NBA_SCOREBOARD_PATH] = payload
+    assert fetch_scoreboard() == payload
+    assert fetch_scoreboard() == payload
+
+    st = json_decode.stats()
+    assert set(st) == {"nba"}
+    assert st["nba"].calls == 2
+    assert st["nba"].bytes == 2 * len(json.dumps(payload).encode())
+    assert st["nba"].seconds > 0 and st["nba"].mean_ms > 0
@@ -0,0 +1,108 @@
+"""Tests for streaming extraction of PBP arrays."""
+
+import json
+
+import pytest
+
+from benchmarks.fixtures import synthetic_espn_pbp, synthetic_nba_pbp
+from src.adapters.playbyplay_adapter import (
+    iter_espn_pbp,
+    iter_nba_pbp,
+    normalize_espn_pbp,
+    normalize_nba_pbp,
+)
+from src.data import espn_playbyplay, nba_playbyplay
+from src.data.conditional import NOT_MODIFIED, ValidatorStore
+from src.data.json_stream import iter_array
+
+NBA_PBP_PATH = "/static/json/liveData/playbyplay/playbyplay_{}.json"
+ESPN_SUMMARY_PATH = "/apis/site/v2/sports/basketball/nba/summary"
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+TRICKY = {
+    "meta": {"version": 1, "note": "braces } ] { [ and \"quotes\" \\ in strings"},
+    "count": 3,
+    "title": "café — \U0001f3c0",
+    "game": {
+        "gameId": "0022400001",
+        "skip": [[1, 2, {"x": "]"}], {"y": "}"}],
+        "actions": [
+            {"n": 1, "s": "a\\\"b", "u": "éè"},
+            {"n": 2, "nested": {"deep": [1, 2, 3]}, "f": -1.5e3},
+            {"n": 3, "t": True, "z": None},
+        ],
+        "after": "ignored",
+    },
+}
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 16])
+def test_iter_array_any_chunking(size):
+    data = json.dumps(TRICKY, ensure_ascii=False).encode("utf-8")
+    meta = {}
+    items = list(iter_array(_chunks(data, size), ("game", "actions"), meta))
+    assert items == TRICKY["game"]["actions"]
+    assert meta == {"count": 3, "title": TRICKY["title"], "game.gameId": "0022400001"}
+
+
+def test_iter_array_scalar_items_and_missing_paths():
+    data = b'{"a": [10, 2.5, "x", true, null, 123456789]}'
+    assert list(iter_array(_chunks(data, 1), ("a",))) == [10, 2.5, "x", True, None, 123456789]
+    assert list(iter_array([b'{"a": []}'], ("a",))) == []
+    assert list(iter_array([b'{"b": [1]}'], ("a",))) == []
+    assert list(iter_array([b'{"a": {"b": 1}}'], ("a", "c"))) == []
+    assert list(iter_array([b'{"a": 5}'], ("a",))) == []
+
+
+def test_iter_array_truncated_raises():
+    with pytest.raises(ValueError):
+        list(iter_array([b'{"skip": {"x": [1, 2'], ("a",)))
+    with pytest.raises(ValueError):
+        list(iter_array([b'{"a": [{"n": 1}, {"n": '], ("a",)))
+
+
+def test_stream_nba_matches_normalize(stub_server):
+    raw = synthetic_nba_pbp(game_id="0022400001", n_actions=300)
+    stub_server.routes[NBA_PBP_PATH.format("0022400001")] = raw
+
+    stream = nba_playbyplay.stream_playbyplay("0022400001")
+    events = list(iter_nba_pbp(stream))
+    assert events == normalize_nba_pbp(raw)
+    assert events[0].game_id == "0022400001"
+
+    # The drained response leaves its connection in the pool for reuse.
+    nba_playbyplay.fetch_playbyplay("0022400001")
+    ports = {port for _, _, port in stub_server.requests}
+    assert len(ports) == 1
+
+
+def test_stream_espn_skips_other_sections(stub_server):
+    raw = synthetic_espn_pbp(game_id="401", n_plays=200)
+    assert {"boxscore", "news"} <= set(raw)
+    stub_server.routes[ESPN_SUMMARY_PATH] = raw
+
+    events = list(iter_espn_pbp(espn_playbyplay.stream_playbyplay("401"), game_id="401"))
+    assert events == normalize_espn_pbp(raw, game_id="401")
+
+
+def test_stream_conditional_and_errors(stub_server):
+    body = json.dumps({"game": {"gameId": "1", "actions": []}}).encode()
+
+    def route(handler):
+        if handler.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"'}, body
+
+    stub_server.routes[NBA_PBP_PATH.format("1")] = route
+    validators = ValidatorStore()
+    assert list(nba_playbyplay.stream_playbyplay("1", validators=validators)) == []
+    assert nba_playbyplay.stream_playbyplay("1", validators=validators) is NOT_MODIFIED
+
+    import requests
+
+    with pytest.raises(requests.HTTPError):
+        nba_playbyplay.stream_playbyplay("missing")
@@ -0,0 +1,122 @@
+"""Tests for the shared dashboard board and the Streamlit app wiring."""
+
+import threading
+
+import pytest
+
+from benchmarks.fixtures import synthetic_espn_scoreboard, synthetic_nba_scoreboard
+from src.runtime.live_board import TODAY_FINAL_TTL, LiveBoard, board_ttl
+from src.runtime.merged_scoreboard import MergeResult
+from src.state.game_state import GameState
+
+ESPN_SCOREBOARD_PATH = "/apis/site/v2/sports/basketball/nba/scoreboard"
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+def _state(gid, status="in", score=0):
+    return GameState(game_id=gid, source="nba", status=status, home_score=score,
+                     is_final=status == "post")
+
+
+class FakePoller:
+    def __init__(self, boards):
+        self.boards = list(boards)
+        self.calls = 0
+
+    def poll(self, date=None):
+        self.calls += 1
+        board = self.boards[min(self.calls, len(self.boards)) - 1]
+        if isinstance(board, Exception):
+            return MergeResult(errors={"nba": board})
+        return MergeResult(states=board)
+
+
+def test_board_ttl_by_status():
+    assert board_ttl([_state("a", "post"), _state("b", "in")]) == 5.0
+    assert board_ttl([_state("a", "post"), _state("b", "pre")]) == 60.0
+    assert board_ttl([_state("a", "post")]) is None
+    assert board_ttl([]) == 60.0
+
+
+def test_polls_only_when_stale_and_versions_changed_games():
+    now = {"t": 0.0}
+    poller = FakePoller([
+        [_state("a", score=10), _state("b", score=20)],
+        [_state("a", score=12), _state("b", score=20)],
+    ])
+    board = LiveBoard(poller=poller, clock=lambda: now["t"])
+    first = board.get()
+    for _ in range(50):
+        assert board.get() is first  # reruns within the TTL: no upstream call
+    assert poller.calls == 1
+
+    now["t"] = 5.0
+    second = board.get()
+    assert poller.calls == 2
+    assert first.versions == {"a": 1, "b": 1}
+    assert second.versions == {"a": 2, "b": 1}  # only "a" changed
+
+
+def test_final_board_never_refetched_and_failures_keep_last():
+    now = {"t": 0.0}
+    poller = FakePoller([[_state("a", "post")]])
+    board = LiveBoard("20260228", poller=poller, clock=lambda: now["t"])
+    board.get()
+    now["t"] = 1e9
+    board.get()
+    assert poller.calls == 1
+
+    poller = FakePoller([[_state("a")], RuntimeError("down")])
+    board = LiveBoard(poller=poller, clock=lambda: now["t"])
+    board.get()
+    now["t"] += 10
+    snap = board.get()
+    assert [s.game_id for s in snap.states] == ["a"]
+    assert snap.errors == {"nba": "down"}
+
+
+def test_all_final_today_board_rechecks():
+    now = {"t": 0.0}
+    poller = FakePoller([[_state("a", "post")], [_state("b", "pre")]])
+    board = LiveBoard(poller=poller, clock=lambda: now["t"])
+    assert board.get().ttl == TODAY_FINAL_TTL
+    now["t"] = TODAY_FINAL_TTL
+    assert [s.game_id for s in board.get().states] == ["b"]  # next day's slate
+    assert poller.calls == 2
+
+
+def test_concurrent_sessions_share_one_fetch():
+    gate = threading.Event()
+
+    class SlowPoller(FakePoller):
+        def poll(self, date=None):
+            gate.wait(1)
+            return super().poll(date)
+
+    poller = SlowPoller([[_state("a")]])
+    board = LiveBoard(poller=poller)
+    threads = [threading.Thread(target=board.get) for _ in range(20)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join()
+    assert poller.calls == 1
+
+
+def test_app_reruns_do_not_refetch(stub_server):
+    testing = pytest.importorskip("streamlit.testing.v1")
+    stub_server.routes[ESPN_SCOREBOARD_PATH] = synthetic_espn_scoreboard(n_games=3)
+    stub_server.routes[NBA_SCOREBOARD_PATH] = synthetic_nba_scoreboard(n_games=3)
+
+    app = testing.AppTest.from_file("../app.py", default_timeout=30)
+    app.run()
+    assert not app.exception
+    tables = [t.value for t in app.text]
+    assert "0022400000" in tables[0] and "Regime" in tables[1]
+    fetched = len(stub_server.requests)
+    assert fetched == 2
+
+    for _ in range(3):
+        app.run()  # reruns (user interaction, other sessions) share the cached board
+    assert len(stub_server.requests) == fetched
@@ -0,0 +1,130 @@
+"""Tests for hot-path metrics: stage timers, counters and export formats."""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+from benchmarks.fixtures import synthetic_nba_pbp, synthetic_nba_scoreboard
+from src import metrics
+from src.adapters.playbyplay_adapter import PBPCursor
+from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
+from src.data import espn_scoreboard, http_client, nba_scoreboard
+from src.runtime.hub import HubServer, StateHub
+from src.ui.panels.game_eval import render_eval
+from src.ui.panels.live_scoreboard import render_scoreboard
+
+ESPN_SCOREBOARD_PATH = "/apis/site/v2/sports/basketball/nba/scoreboard"
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+@pytest.fixture
+def recording_metrics():
+    metrics.reset()
+    metrics.enable()
+    try:
+        yield
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+
+def _stage(snap, stage, **labels):
+    return next(r for r in snap["stages"] if r["stage"] == stage and r["labels"] == labels)
+
+
+def _counter(snap, name, **labels):
+    return next((r["value"] for r in snap["counters"] if r["name"] == name and r["labels"] == labels), 0)
+
+
+def test_disabled_records_nothing():
+    metrics.reset()
+    assert not metrics.enabled()
+    states = normalize_nba_scoreboard(synthetic_nba_scoreboard())
+    render_scoreboard(states)
+    with metrics.timer("fetch", source="nba"):
+        pass
+    metrics.count("errors", source="nba")
+    snap = metrics.snapshot()
+    assert snap["stages"] == [] and snap["counters"] == []
+    assert metrics.report() == "No metrics recorded (metrics disabled)."
+
+
+def test_full_path_stages_and_counters(stub_server, recording_metrics):
+    body = json.dumps(synthetic_nba_scoreboard(n_games=15)).encode()
+    stub_server.routes[NBA_SCOREBOARD_PATH] = lambda h: (200, {}, body)
+    stub_server.routes[ESPN_SCOREBOARD_PATH] = lambda h: (503, {}, b"{}")
+    http_client.configure("espn", retries=0)
+
+    states = normalize_nba_scoreboard(nba_scoreboard.fetch_scoreboard())
+    render_scoreboard(states)
+    render_eval(states)
+    PBPCursor("nba").update(synthetic_nba_pbp(n_actions=30))
+    with pytest.raises(requests.HTTPError):
+        espn_scoreboard.fetch_scoreboard()
+
+    snap = metrics.snapshot()
+    for stage, labels in (("fetch", {"source": "nba"}), ("decode", {"source": "nba"}),
+                          ("normalize", {"source": "nba"}), ("render", {"panel": "scoreboard"}),
+                          ("render", {"panel": "eval"}), ("fetch", {"source": "espn"})):
+        assert _stage(snap, stage, **labels)["calls"] >= 1
+    assert [r["seconds"] for r in snap["stages"]] == sorted((r["seconds"] for r in snap["stages"]), reverse=True)
+    assert sum(r["share"] for r in snap["stages"]) == pytest.approx(1.0)
+
+    assert _counter(snap, "http_bytes", source="nba") == len(body)
+    assert _counter(snap, "http_responses", source="nba", status="200") == 1
+    assert _counter(snap, "games_normalized", source="nba") == 15
+    assert _counter(snap, "events_normalized", source="nba") == 30
+    assert _counter(snap, "errors", source="espn", kind="http") == 1
+    assert _counter(snap, "errors", source="nba", kind="http") == 0
+
+
+def test_export_formats(recording_metrics):
+    metrics.observe("fetch", 0.25, source="nba")
+    metrics.observe("fetch", 0.75, source="nba")
+    metrics.observe("render", 0.5, panel="eval")
+    metrics.count("http_bytes", 1_234_567, source="nba")
+    metrics.count("cache_requests", 3, cache="disk", result="hit")
+    metrics.count("cache_requests", cache="disk", result="miss")
+
+    assert metrics.cache_hit_ratios() == {"disk": 0.75}
+    text = metrics.prometheus()
+    for line in (
+        "# TYPE nbalab_stage_seconds summary",
+        'nbalab_stage_seconds_count{stage="fetch",source="nba"} 2',
+        'nbalab_stage_seconds_sum{stage="fetch",source="nba"} 1.000000',
+        'nbalab_stage_seconds_max{stage="fetch",source="nba"} 0.750000',
+        'nbalab_http_bytes_total{source="nba"} 1234567',
+        'nbalab_cache_requests_total{cache="disk",result="hit"} 3',
+        'nbalab_cache_hit_ratio{cache="disk"} 0.7500',
+    ):
+        assert line in text.splitlines()
+    report = metrics.report().splitlines()
+    assert report[2].startswith("fetch") and report[2].endswith("67%")
+    assert "cache hit ratio disk: 75%" in report
+
+
+def test_hub_serves_metrics(recording_metrics):
+    metrics.observe("fetch", 0.1, source="nba")
+
+    async def get(port, path):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+        await writer.drain()
+        raw = await reader.read()
+        writer.close()
+        return raw.split(b"\r\n\r\n", 1)
+
+    async def main():
+        server = HubServer(StateHub(), port=0)
+        await server.start()
+        try:
+            return await get(server.port, "/metrics"), await get(server.port, "/metrics?format=json")
+        finally:
+            await server.stop()
+
+    (head, text), (_, data) = asyncio.run(main())
+    assert b"Content-Type: text/plain" in head
+    assert b'nbalab_stage_seconds_count{stage="fetch",source="nba"} 1' in text
+    assert json.loads(data)["stages"][0]["labels"] == {"source": "nba"}
@@ -0,0 +1,92 @@
+"""Tests for historical NBA scoreboards (nba_api LeagueGameFinder)."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
+from src.data import nba_history
+from src.data.nba_scoreboard import fetch_scoreboard
+
+
+def _rows(game_id, day, home, away, home_pts, away_pts, minutes=240, wl=True):
+    common = {"GAME_ID": game_id, "GAME_DATE": day, "MIN": minutes}
+    return [
+        {**common, "TEAM_ABBREVIATION": home, "TEAM_NAME": "", "MATCHUP": f"{home} vs. {away}",
+         "PTS": home_pts, "WL": ("W" if home_pts > away_pts else "L") if wl else None},
+        {**common, "TEAM_ABBREVIATION": away, "TEAM_NAME": "", "MATCHUP": f"{away} @ {home}",
+         "PTS": away_pts, "WL": ("W" if away_pts > home_pts else "L") if wl else None},
+    ]
+
+
+@pytest.fixture
+def finder(monkeypatch):
+    """Stand-in for the nba_api call; records each (start, end) requested."""
+    calls = []
+    rows = (
+        _rows("0022500801", "2026-02-27", "BOS", "NYK", 110, 104)
+        + _rows("0022500802", "2026-02-28", "LAL", "GSW", 121, 119, minutes=265)
+        + _rows("0022500803", "2026-02-28", "POR", "DEN", 98, 101)
+    )
+
+    def find_rows(start, end, timeout=None):
+        calls.append((start, end))
+        return [r for r in rows if start.isoformat() <= r["GAME_DATE"] <= end.isoformat()]
+
+    monkeypatch.setattr(nba_history, "_find_rows", find_rows)
+    nba_history.clear_memory()
+    previous = nba_history.set_cache_dir(None)
+    yield calls
+    nba_history.clear_memory()
+    nba_history.set_cache_dir(previous)
+
+
+def test_games_from_rows():
+    games = nba_history.games_from_rows(
+        _rows("1", "2026-02-28", "LAL", "GSW", 121, 119, minutes=265)
+        + _rows("2", "2026-02-28", "BOS", "NYK", 50, 48, wl=False)
+        + _rows("3", "2026-02-28", "MIA", "ORL", 1, 2)[:1]  # away row missing
+    )
+    (ot, live) = games["2026-02-28"]
+    assert (ot["gameId"], ot["gameStatus"], ot["period"]) == ("1", 3, 5)
+    assert ot["homeTeam"] == {"teamName": "Lakers", "teamTricode": "LAL", "score": 121}
+    assert ot["awayTeam"]["teamTricode"] == "GSW"
+    assert live["gameStatus"] == 2
+
+
+def test_historical_date_normalizes_like_cdn(finder):
+    states = normalize_nba_scoreboard(fetch_scoreboard("20260228"))
+    assert [(s.game_id, s.status, s.period_label, s.away_abbr, s.home_abbr, s.home_score)
+            for s in states] == [
+        ("0022500802", "post", "OT1", "GSW", "LAL", 121),
+        ("0022500803", "post", "Q4", "DEN", "POR", 98),
+    ]
+    assert all(s.is_final for s in states)
+
+
+def test_one_call_per_window(finder):
+    fetch_scoreboard("2026-02-01")
+    for day in range(2, 29):
+        fetch_scoreboard(f"2026-02-{day:02d}")
+    assert finder == [(date(2026, 2, 1), date(2026, 3, 2))]
+
+    out = nba_history.fetch_range("20260225", "20260305")
+    assert list(out)[0] == "2026-02-25" and len(out) == 9
+    assert finder[-1] == (date(2026, 3, 3), date(2026, 3, 5))  # only the missing tail
+
+
+def test_disk_cache_survives_restart(finder, tmp_path):
+    nba_history.set_cache_dir(str(tmp_path))
+    first = nba_history.fetch_range("20260227", "20260228")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2026-02-27.json.gz", "2026-02-28.json.gz"]
+
+    nba_history.clear_memory()
+    assert nba_history.fetch_range("20260227", "20260228") == first
+    assert len(finder) == 1
+
+
+def test_unfinished_dates_not_cached(finder):
+    tomorrow = date.today() + timedelta(days=1)
+    fetch_scoreboard(tomorrow.isoformat())
+    fetch_scoreboard(tomorrow.isoformat())
+    assert len(finder) == 2
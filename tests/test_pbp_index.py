@@ -0,0 +1,108 @@
+"""Tests for the indexed PBP container: queries must match a linear scan."""
+
+import dataclasses
+import itertools
+import random
+
+import pytest
+
+from benchmarks.fixtures import synthetic_nba_pbp
+from src.adapters.pbp_index import PBPIndex
+from src.adapters.playbyplay_adapter import PBPCursor, PBPEvent, normalize_nba_pbp
+from src.state.clock import elapsed_tenths, parse_clock_tenths
+
+
+def _scan(events, period=None, team=None, player=None, event_type=None, start=None, end=None):
+    def ok(wanted, value):
+        return wanted is None or value in ([wanted] if isinstance(wanted, (str, int)) else wanted)
+
+    out = []
+    for e in events:
+        t = elapsed_tenths(e.period, e.clock_tenths)
+        if (start is not None or end is not None) and t is None:
+            continue
+        if start is not None and t < start or end is not None and t > end:
+            continue
+        if ok(period, e.period) and ok(team, e.team_abbr) and ok(player, e.player_name) and ok(event_type, e.event_type):
+            out.append(e)
+    return out
+
+
+def _random_queries(events, n, seed=0):
+    rng = random.Random(seed)
+    teams = sorted({e.team_abbr for e in events})
+    players = sorted({e.player_name for e in events})
+    types = sorted({e.event_type for e in events})
+    for _ in range(n):
+        q = {}
+        if rng.random() < 0.5:
+            q["period"] = rng.randint(1, 4) if rng.random() < 0.7 else [1, 4]
+        if rng.random() < 0.5:
+            q["team"] = rng.choice(teams)
+        if rng.random() < 0.3:
+            q["player"] = rng.choice(players)
+        if rng.random() < 0.5:
+            q["event_type"] = rng.choice(types) if rng.random() < 0.7 else rng.sample(types, 2)
+        if rng.random() < 0.5:
+            q["start"] = rng.randint(0, 28800)
+            q["end"] = q["start"] + rng.randint(0, 9000)
+        yield q
+
+
+def test_queries_match_linear_scan():
+    events = normalize_nba_pbp(synthetic_nba_pbp(n_actions=600))
+    index = PBPIndex(events)
+    assert len(index) == 600 and list(index) == events
+    for q in _random_queries(events, 300):
+        assert index.query(**q) == _scan(events, **q), q
+
+
+def test_fouls_by_team_after_two_minute_mark():
+    events = normalize_nba_pbp(synthetic_nba_pbp(n_actions=600))
+    index = PBPIndex(events)
+    got = index.query(team="NYK", event_type="foul", period=4, clock_max="2:00")
+    expected = [e for e in events if e.team_abbr == "NYK" and e.event_type == "foul"
+                and e.period == 4 and e.clock_tenths <= 1200]
+    assert got == expected and got
+    assert index.count(team="NYK", event_type="foul", period=4, clock_max="2:00") == len(got)
+    window = index.query(period=4, clock_max="6:00", clock_min="2:00")  # from 6:00 down to 2:00
+    assert window == [e for e in events if e.period == 4 and 1200 <= e.clock_tenths <= 3600]
+    with pytest.raises(ValueError):
+        index.query(clock_max="2:00")
+    with pytest.raises(ValueError):
+        index.query(period=4, clock_max="soon")
+
+
+def test_incremental_cursor_deltas_with_edits_and_removals():
+    raw = synthetic_nba_pbp(n_actions=200)
+    cursor, index = PBPCursor("nba"), PBPIndex()
+    actions = raw["game"]["actions"]
+    for n in range(20, 201, 20):  # feed grows poll by poll
+        index.apply(cursor.update({"game": {"gameId": "g", "actions": actions[:n]}}))
+    assert list(index) == cursor.events
+
+    edited = [dict(a) for a in actions]
+    edited[10] = {**edited[10], "teamTricode": "BOS", "actionType": "foul", "edited": "later"}
+    del edited[50]
+    index.apply(cursor.update({"game": {"gameId": "g", "actions": edited}}))
+    assert list(index) == cursor.events and len(index) == 199
+    assert index.get("11").team_abbr == "BOS" and "51" not in index
+    for q in _random_queries(cursor.events, 200, seed=1):
+        assert index.query(**q) == _scan(cursor.events, **q), q
+    assert "BOS" in index.values("team_abbr")
+
+
+def test_out_of_order_events_fall_back_to_exact_filter():
+    events = normalize_nba_pbp(synthetic_nba_pbp(n_actions=120))
+    shuffled = events[:]
+    random.Random(3).shuffle(shuffled)
+    unknown = PBPEvent(event_id="x", period=2, clock="", event_type="foul", team_abbr="NYK")
+    index = PBPIndex(shuffled + [unknown])
+    for q in itertools.islice(_random_queries(events, 200, seed=2), 200):
+        assert index.query(**q) == _scan(shuffled + [unknown], **q), q
+
+    ordered = PBPIndex(events)
+    late = dataclasses.replace(events[5], clock="PT00M01.00S", clock_tenths=None, elapsed_seconds=None)
+    ordered.replace(late)  # edit moves an early event to the end of its period
+    assert ordered.query(period=1, start=elapsed_tenths(1, parse_clock_tenths("0:05"))) == _scan(
+        list(ordered), period=1, start=elapsed_tenths(1, parse_clock_tenths("0:05")))
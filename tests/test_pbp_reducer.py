@@ -0,0 +1,108 @@
+"""Tests for the PBP-driven GameState reducer."""
+
+import json
+
+from src.adapters.playbyplay_adapter import PBPCursor, PBPEvent
+from src.state.game_state import GameState
+from src.state.pbp_reducer import PBPReducer, is_team_foul, reduce_events
+
+
+def _base() -> GameState:
+    return GameState(game_id="0022400100", source="nba", status="pre", home_abbr="NYK", away_abbr="MIA")
+
+
+def _ev(eid, event_type="2pt", team="NYK", period=1, clock="PT10M00.00S", home=0, away=0, sub_type=""):
+    ev = PBPEvent(
+        event_id=str(eid), source="nba", game_id="0022400100", period=period, clock=clock,
+        event_type=event_type, team_abbr=team, home_score=home, away_score=away,
+    )
+    if sub_type:
+        ev.extra["sub_type"] = sub_type
+    return ev
+
+
+def test_score_period_clock_follow_events():
+    r = PBPReducer(_base())
+    r.apply(_ev(1, home=2))
+    r.apply(_ev(2, team="MIA", period=2, clock="PT05M32.40S", home=2, away=3))
+    s = r.state
+    assert s.status == "in"
+    assert (s.home_score, s.away_score, s.score_diff) == (2, 3, -1)
+    assert s.period == 2 and s.period_label == "Q2"
+    assert s.clock == "5:32"
+
+
+def test_team_fouls_per_period_and_timeouts():
+    r = PBPReducer(_base())
+    r.apply(_ev(1, "foul", "NYK", sub_type="personal"))
+    r.apply(_ev(2, "foul", "NYK", sub_type="shooting"))
+    r.apply(_ev(3, "foul", "NYK", sub_type="offensive"))
+    r.apply(_ev(4, "foul", "MIA", sub_type="technical"))
+    r.apply(_ev(5, "timeout", "MIA", sub_type="full"))
+    r.apply(_ev(6, "timeout", "", sub_type="official"))
+    assert r.state.extra["home_fouls"] == 2
+    assert r.state.extra["away_fouls"] == 0
+    assert r.state.extra["away_timeouts_used"] == 1
+    assert r.state.extra["home_timeouts_used"] == 0
+
+    r.apply(_ev(7, "foul", "MIA", period=2, sub_type="personal"))
+    assert r.state.extra["home_fouls"] == 0
+    assert r.state.extra["away_fouls"] == 1
+    assert r.team_fouls("home", period=1) == 2
+
+
+def test_game_end_marks_final():
+    r = PBPReducer(_base())
+    r.apply(_ev(1, home=100, away=98, period=4))
+    r.apply(_ev(2, "game", "", period=4, clock="PT00M00.00S", home=100, away=98, sub_type="end"))
+    assert r.state.status == "post"
+    assert r.state.is_final
+
+
+def test_espn_fouls_attributed_by_team_id():
+    state = GameState(game_id="401", source="espn", status="in", extra={"home_team_id": "13", "away_team_id": "2"})
+    foul = PBPEvent(event_id="9", source="espn", period=1, clock="9:00", event_type="Shooting Foul")
+    foul.extra["team_id"] = "2"
+    r = PBPReducer(state)
+    r.apply(foul)
+    assert r.state.extra["away_fouls"] == 1
+    assert not is_team_foul(PBPEvent(source="espn", event_type="Offensive Charge"))
+
+
+def test_apply_delta_undoes_removed_and_edited_fouls():
+    actions = [
+        {"actionNumber": 1, "period": 1, "clock": "PT11M00.00S", "actionType": "foul",
+         "subType": "personal", "teamTricode": "NYK", "scoreHome": 0, "scoreAway": 0, "edited": "a"},
+        {"actionNumber": 2, "period": 1, "clock": "PT10M40.00S", "actionType": "foul",
+         "subType": "personal", "teamTricode": "NYK", "scoreHome": 0, "scoreAway": 0, "edited": "a"},
+    ]
+    cursor = PBPCursor("nba", game_id="0022400100")
+    r = PBPReducer(_base())
+    r.apply_delta(cursor.update({"game": {"actions": actions}}))
+    assert r.state.extra["home_fouls"] == 2
+
+    # Foul 1 reassigned to MIA; foul 2 deleted.
+    edited = dict(actions[0], teamTricode="MIA", edited="b")
+    r.apply_delta(cursor.update({"game": {"actions": [edited]}}))
+    assert r.state.extra["home_fouls"] == 0
+    assert r.state.extra["away_fouls"] == 1
+
+
+def test_snapshot_restore_roundtrip():
+    r = PBPReducer(_base())
+    r.apply(_ev(1, "foul", "NYK", sub_type="personal", home=0, away=0))
+    r.apply(_ev(2, home=2, period=2))
+    snap = json.loads(json.dumps(r.snapshot()))
+
+    restored = PBPReducer.restore(snap)
+    assert restored.state == r.state
+    restored.apply(_ev(3, "foul", "NYK", period=2, sub_type="personal", home=2))
+    assert restored.state.extra["home_fouls"] == 1
+    assert restored.team_fouls("home", period=1) == 1
+
+
+def test_reduce_events_does_not_mutate_input():
+    base = _base()
+    out = reduce_events(base, [_ev(1, home=3)])
+    assert out.home_score == 3
+    assert base.home_score == 0 and base.status == "pre"
@@ -0,0 +1,100 @@
+"""Tests for the columnar PBP archive."""
+
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.adapters.playbyplay_adapter import normalize_nba_pbp
+from src.storage import pbp_store
+
+
+def _raw(game_id, n=12):
+    return {
+        "game": {
+            "gameId": game_id,
+            "actions": [
+                {"actionNumber": i, "period": 1 + (i - 1) // 3, "clock": f"PT0{i % 10}M30.50S",
+                 "actionType": "foul" if i % 3 == 0 else "2pt",
+                 "subType": "personal" if i % 3 == 0 else "",
+                 "teamTricode": "BOS" if i % 2 else "LAL", "playerNameI": f"P. Player{i % 4}",
+                 "description": f"play {i}", "scoreHome": str(i), "scoreAway": "0"}
+                for i in range(1, n + 1)
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def archive(tmp_path):
+    root = str(tmp_path / "pbp")
+    for gid in ("0022400001", "0022400002"):
+        pbp_store.write_game(root, gid, normalize_nba_pbp(_raw(gid)))
+    return root
+
+
+def test_roundtrip(archive):
+    events = normalize_nba_pbp(_raw("0022400001"))
+    table = pbp_store.read(archive, game_ids=["0022400001"])
+    assert pbp_store.to_events(table) == events
+    assert pbp_store.list_games(archive) == ["0022400001", "0022400002"]
+
+
+def test_dictionary_encoding_and_integer_clock(archive):
+    table = pbp_store.read(archive, game_ids=["0022400001"])
+    assert str(table.schema.field("event_type").type).startswith("dictionary")
+    assert table.column("clock_tenths").to_pylist()[0] == 1 * 600 + 305
+
+
+def test_predicate_pushdown(archive):
+    table = pbp_store.read(archive, periods=[4], event_types=["foul"])
+    rows = pbp_store.to_events(table)
+    assert {e.game_id for e in rows} == {"0022400001", "0022400002"}
+    assert all(e.period == 4 and e.event_type == "foul" for e in rows)
+    assert len(rows) == 2
+
+    only_one = pbp_store.read(archive, game_ids=["0022400002"], columns=["game_id", "period"])
+    assert only_one.column_names == ["game_id", "period"]
+    assert set(only_one.column("game_id").to_pylist()) == {"0022400002"}
+
+
+def test_rewrite_replaces_partition(archive):
+    pbp_store.write_game(archive, "0022400001", normalize_nba_pbp(_raw("0022400001", n=3)))
+    assert pbp_store.read(archive, game_ids=["0022400001"]).num_rows == 3
+
+
+def test_reader_closes_its_files(archive):
+    with pbp_store.ArchiveReader(archive) as reader:
+        fouls = reader.read(event_types=["foul"])
+        assert reader.read(game_ids=["0022400002"], periods=[1]).num_rows == 3
+        sources = [source for source, _ in reader._files.values()]
+        assert len(sources) == 2
+    assert all(source.closed for source in sources) and not reader._files
+    assert fouls.num_rows == 8  # tables outlive the reader
+    assert fouls.column("event_type").to_pylist() == ["foul"] * 8
+
+
+def test_failed_write_leaves_no_temp_file(archive, monkeypatch):
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pbp_store.os, "replace", fail)
+    with pytest.raises(OSError):
+        pbp_store.write_game(archive, "0022400003", normalize_nba_pbp(_raw("0022400003")))
+    partition = os.path.dirname(pbp_store.partition_path(archive, "0022400003"))
+    assert os.listdir(partition) == []
+
+
+def test_missing_and_empty(tmp_path):
+    assert pbp_store.read(str(tmp_path / "nope")).num_rows == 0
+    assert pbp_store.read(str(tmp_path), game_ids=["x"]).num_rows == 0
+
+
+def test_export_parquet(archive, tmp_path):
+    import pyarrow.parquet as pq
+
+    out = str(tmp_path / "fouls.parquet")
+    n = pbp_store.export_parquet(archive, out, event_types=["foul"])
+    assert n == 8
+    assert pq.read_table(out).num_rows == 8
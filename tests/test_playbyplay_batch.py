@@ -0,0 +1,89 @@
+"""Tests for concurrent slate PBP fetching."""
+
+import asyncio
+import json
+import threading
+import time
+
+from src.data.playbyplay_batch import fetch_playbyplay_many
+
+NBA_PBP_PATH = "/static/json/liveData/playbyplay/playbyplay_{}.json"
+
+
+def _slow(delay, game_id):
+    def route(handler):
+        time.sleep(delay)
+        return 200, {}, json.dumps({"game": {"gameId": game_id, "actions": []}}).encode()
+    return route
+
+
+def test_slate_fetch_runs_concurrently(stub_server):
+    ids = [f"00224000{i:02d}" for i in range(6)]
+    for gid in ids:
+        stub_server.routes[NBA_PBP_PATH.format(gid)] = _slow(0.2, gid)
+
+    res = fetch_playbyplay_many(ids, source="nba", limit=6)
+
+    assert res.ok
+    assert set(res.results) == set(ids)
+    assert res.results[ids[0]]["game"]["gameId"] == ids[0]
+    assert res.elapsed < 0.2 * len(ids) / 2
+
+
+def test_limit_bounds_concurrency(stub_server):
+    ids = [f"00224001{i:02d}" for i in range(4)]
+    for gid in ids:
+        stub_server.routes[NBA_PBP_PATH.format(gid)] = _slow(0.1, gid)
+
+    res = fetch_playbyplay_many(ids, source="nba", limit=1)
+
+    assert res.ok
+    assert res.elapsed >= 0.1 * len(ids)
+
+
+def test_timed_out_request_keeps_its_slot(stub_server):
+    lock, live = threading.Lock(), {"now": 0, "max": 0}
+
+    def counted(delay, game_id):
+        inner = _slow(delay, game_id)
+
+        def route(handler):
+            with lock:
+                live["now"] += 1
+                live["max"] = max(live["max"], live["now"])
+            try:
+                return inner(handler)
+            finally:
+                with lock:
+                    live["now"] -= 1
+        return route
+
+    stub_server.routes[NBA_PBP_PATH.format("slow")] = counted(0.5, "slow")
+    for gid in ("a", "b"):
+        stub_server.routes[NBA_PBP_PATH.format(gid)] = counted(0, gid)
+
+    res = fetch_playbyplay_many(["slow", "a", "b"], source="nba", limit=1, timeout=0.1)
+
+    assert isinstance(res.errors["slow"], asyncio.TimeoutError)
+    assert set(res.results) == {"a", "b"}
+    assert live["max"] == 1  # the timed-out request still counted against the limit
+
+
+def test_partial_failure_and_timeout(stub_server):
+    stub_server.routes[NBA_PBP_PATH.format("good")] = _slow(0, "good")
+    stub_server.routes[NBA_PBP_PATH.format("slow")] = _slow(1.0, "slow")
+    # "missing" has no route -> 404
+
+    res = fetch_playbyplay_many(["good", "slow", "missing"], source="nba", timeout=0.3)
+
+    assert set(res.results) == {"good"}
+    assert isinstance(res.errors["slow"], asyncio.TimeoutError)
+    assert "404" in str(res.errors["missing"])
+    assert res.elapsed < 1.0
+
+
+def test_espn_source(stub_server):
+    stub_server.routes["/apis/site/v2/sports/basketball/nba/summary"] = {"plays": []}
+    res = fetch_playbyplay_many(["401584793", "401584794"], source="espn")
+    assert res.ok
+    assert res.results["401584793"] == {"plays": []}
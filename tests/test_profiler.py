@@ -0,0 +1,54 @@
+"""Tests for the sampling profiler used by the runners' --profile mode."""
+
+import time
+
+from benchmarks.fixtures import synthetic_nba_scoreboard
+from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
+from src.runtime.profiler import SamplingProfiler, profile_calls
+from src.ui.panels.game_eval import render_eval
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _outer():
+    _spin(0.05)
+
+
+def test_samples_aggregate_across_iterations(tmp_path):
+    prof = profile_calls(_outer, iterations=4, interval=0.001)
+    assert prof.samples >= 20  # ~200ms at 1ms; generous for slow CI
+    top = prof.functions()[0]
+    assert top.name == f"{__name__}:_spin"
+    assert top.self_samples >= prof.samples * 0.8
+    outer = next(f for f in prof.functions() if f.name == f"{__name__}:_outer")
+    assert outer.self_samples == 0 and outer.total_samples >= top.self_samples
+
+    lines = prof.collapsed()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.endswith(f"{__name__}:_outer;{__name__}:_spin") and int(count) > 0
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == prof.samples
+
+    out = tmp_path / "poll.folded"
+    prof.write_collapsed(str(out))
+    assert out.read_text().splitlines() == lines
+    assert f"{__name__}:_spin" in prof.report().splitlines()[3]
+
+
+def test_profiles_adapter_and_panel_path():
+    raw = synthetic_nba_scoreboard(n_games=15)
+
+    def poll():
+        render_eval(normalize_nba_scoreboard(raw))
+
+    with SamplingProfiler(interval=0.0005) as prof:
+        end = time.perf_counter() + 0.3
+        while time.perf_counter() < end:
+            poll()
+    names = {f.name for f in prof.functions()}
+    assert "src.adapters.scoreboard_adapter:normalize_nba_scoreboard" in names
+    assert "src.ui.panels.game_eval:render_eval" in names
+    assert SamplingProfiler().report() == "No samples collected."
@@ -0,0 +1,88 @@
+"""Tests for record-and-replay of raw feed responses."""
+
+import gzip
+import json
+
+from src.adapters.scoreboard_adapter import normalize_nba_scoreboard
+from src.data import http_client
+from src.data.conditional import NOT_MODIFIED, ValidatorStore
+from src.data.nba_playbyplay import fetch_playbyplay
+from src.data.nba_scoreboard import fetch_scoreboard
+from src.data.recorder import ReplaySource, read_recording, recording, replaying
+
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+def _scoreboard(score):
+    return {"scoreboard": {"games": [{"gameId": "1", "gameStatus": 2, "period": 4,
+                                      "homeTeam": {"teamTricode": "NYK", "score": score},
+                                      "awayTeam": {"teamTricode": "MIA", "score": 80}}]}}
+
+
+def _record_night(stub_server, path, scores):
+    state = {"i": 0}
+
+    def route(handler):
+        body = json.dumps(_scoreboard(scores[state["i"]])).encode()
+        state["i"] += 1
+        return 200, {"ETag": f'"{state["i"]}"'}, body
+
+    stub_server.routes[NBA_SCOREBOARD_PATH] = route
+    with recording(path) as rec:
+        for _ in scores:
+            fetch_scoreboard()
+    return rec
+
+
+def test_record_then_replay_max_speed(stub_server, tmp_path):
+    path = str(tmp_path / "night.jsonl.gz")
+    rec = _record_night(stub_server, path, [80, 82, 85])
+    assert rec.count == 3
+    records = list(read_recording(path))
+    assert records[0]["url"].endswith("todaysScoreboard_00.json")
+    assert records[0]["headers"]["ETag"] == '"1"'
+
+    with replaying(path, speed=None) as source:
+        scores = [normalize_nba_scoreboard(fetch_scoreboard())[0].home_score for _ in range(4)]
+        assert source.finished
+    assert scores == [80, 82, 85, 85]
+    assert len(stub_server.requests) == 3  # replay never touched the server
+
+
+def test_timed_replay_follows_clock(stub_server, tmp_path):
+    path = str(tmp_path / "night.jsonl.gz")
+    _record_night(stub_server, path, [80, 82])
+    records = list(read_recording(path))
+    span = records[1]["t"] - records[0]["t"]
+
+    now = {"t": 100.0}
+    source = ReplaySource(path, speed=2.0, clock=lambda: now["t"])
+    http_client.set_transport(source)
+    assert fetch_scoreboard()["scoreboard"]["games"][0]["homeTeam"]["score"] == 80
+    now["t"] += span / 2 + 0.001
+    assert fetch_scoreboard()["scoreboard"]["games"][0]["homeTeam"]["score"] == 82
+    assert source.finished
+
+
+def test_replay_honors_conditional_and_unknown_urls(stub_server, tmp_path):
+    path = str(tmp_path / "night.jsonl.gz")
+    _record_night(stub_server, path, [80])
+    with replaying(path, speed=1.0):
+        validators = ValidatorStore()
+        assert fetch_scoreboard(validators=validators) != NOT_MODIFIED
+        assert fetch_scoreboard(validators=validators) is NOT_MODIFIED
+        try:
+            fetch_playbyplay("missing")
+        except Exception as e:
+            assert "404" in str(e)
+        else:
+            raise AssertionError("expected HTTPError")
+
+
+def test_truncated_recording_is_readable(tmp_path):
+    path = tmp_path / "cut.jsonl.gz"
+    with gzip.open(path, "wt") as fh:
+        fh.write(json.dumps({"t": 1, "url": "u", "params": {}, "status": 200, "body": "{}"}) + "\n")
+    data = path.read_bytes()
+    path.write_bytes(data[:-8])  # drop the gzip trailer
+    assert len(list(read_recording(str(path)))) == 1
@@ -53,3 +53,14 @@ def test_closing():
 def test_overtime():
     s = _make_state(period=5, clock="3:00", home_score=110, away_score=110)
     assert classify_regime(s) == "overtime"
+
+
+def test_clutch_sub_minute_clock():
+    # ESPN shows "45.3" under a minute; it must read as 45.3 seconds, not minutes.
+    s = _make_state(period=4, clock="45.3", home_score=100, away_score=98)
+    assert classify_regime(s) == "clutch"
+
+
+def test_unparseable_clock_is_not_clutch():
+    s = _make_state(period=4, clock="??", home_score=100, away_score=98)
+    assert classify_regime(s) == "closing"
@@ -0,0 +1,71 @@
+"""Tests for the vectorized regime classifier: must match classify_regime exactly."""
+
+import itertools
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.state.game_state import GameState
+from src.state.regime import classify_regime
+from src.state.regime_batch import (
+    REGIMES,
+    SnapshotBatch,
+    classify_regimes,
+    clock_tenths_column,
+    regime_counts,
+    regime_names,
+)
+
+
+CLOCKS = ["", "END", "Final", "0.0", "0:00", "4:59", "5:00", "5:01", "12:00",
+          "45.3", "4.9", "PT04M30.00S", "garbage", "1:2:3", "-1:00"]
+STATUSES = ["pre", "in", "post", ""]
+
+
+def test_matches_scalar_exhaustive_grid():
+    states = [
+        GameState(game_id="g", source="espn", status=status, period=period,
+                  clock=clock, home_score=100 + diff, away_score=100)
+        for status, period, clock, diff in itertools.product(
+            STATUSES, range(0, 7), CLOCKS, (-25, -21, -20, -6, -5, 0, 5, 6, 20, 21)
+        )
+    ]
+    codes = classify_regimes(SnapshotBatch.from_states(states))
+    assert regime_names(codes) == [classify_regime(s) for s in states]
+
+
+def test_matches_scalar_random_and_is_final_override():
+    rng = random.Random(7)
+    states = []
+    for _ in range(2000):
+        s = GameState(
+            game_id="g", source="nba", status=rng.choice(STATUSES),
+            period=rng.randint(1, 6), clock=f"{rng.randint(0, 12)}:{rng.randint(0, 59):02d}",
+            home_score=rng.randint(60, 130), away_score=rng.randint(60, 130),
+        )
+        s.is_final = rng.random() < 0.05
+        states.append(s)
+    codes = classify_regimes(SnapshotBatch.from_states(states))
+    assert regime_names(codes) == [classify_regime(s) for s in states]
+
+
+def test_from_columns_and_counts():
+    batch = SnapshotBatch.from_columns(
+        status=["in", "in", "post", "pre"],
+        period=[4, 3, 4, 0],
+        clock_tenths=clock_tenths_column(["2:00", "6:00", "0:00", ""]),
+        score_diff=[3, 10, 8, 0],
+    )
+    codes = classify_regimes(batch)
+    assert regime_names(codes) == ["clutch", "mid", "final", "pregame"]
+    counts = regime_counts(codes)
+    assert set(counts) == set(REGIMES)
+    assert counts["clutch"] == 1 and counts["closing"] == 0
+
+
+def test_empty_batch():
+    batch = SnapshotBatch.from_states([])
+    assert len(batch) == 0
+    assert regime_names(classify_regimes(batch)) == []
@@ -0,0 +1,127 @@
+"""Tests for the adaptive poll scheduler."""
+
+from src.runtime.scheduler import PollScheduler, poll_regime, run_loop
+from src.state.game_state import GameState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _state(gid, status="in", period=2, clock="6:00", home=50, away=48, source="espn"):
+    return GameState(game_id=gid, source=source, status=status, period=period,
+                     clock=clock, home_score=home, away_score=away)
+
+
+def _sched(clock, **kw):
+    kw.setdefault("jitter", 0.0)
+    return PollScheduler(clock=clock, **kw)
+
+
+def test_poll_regime_break_between_periods():
+    assert poll_regime(_state("g", period=2, clock="0.0")) == "break"
+    assert poll_regime(_state("g", period=2, clock="PT00M00.00S")) == "break"
+    assert poll_regime(_state("g", period=2, clock="6:00")) == "early"
+    assert poll_regime(_state("g", period=4, clock="0:00", home=100, away=99)) == "clutch"
+
+
+def test_interval_follows_regime():
+    clock = FakeClock()
+    sched = _sched(clock)
+    sched.track(_state("clutch", period=4, clock="2:00", home=99, away=98))
+    sched.track(_state("blowout", period=4, clock="8:00", home=120, away=80))
+    assert sorted(sched.due()) == ["blowout", "clutch"]
+    sched.update(_state("clutch", period=4, clock="1:50", home=99, away=98))
+    sched.update(_state("blowout", period=4, clock="7:50", home=120, away=80))
+
+    clock.now += 3.0
+    assert sched.due() == ["clutch"]
+    clock.now += 27.0
+    assert "blowout" in sched.due()
+
+
+def test_final_games_stop_polling():
+    clock = FakeClock()
+    sched = _sched(clock)
+    sched.track(_state("g1"))
+    assert sched.due() == ["g1"]
+    sched.update(_state("g1", status="post", period=4, clock="0:00"))
+    assert not sched.active
+    clock.now += 3600
+    assert sched.due() == []
+    assert sched.next_wakeup() == float("inf")
+
+    sched.track(_state("done", status="post"))
+    assert sched.due() == []
+
+
+def test_budget_prefers_high_priority_regimes():
+    clock = FakeClock()
+    sched = _sched(clock, budgets={"espn": 1.0}, burst=2)
+    sched.track(_state("early", period=1))
+    sched.track(_state("garbage", period=4, clock="3:00", home=130, away=90))
+    sched.track(_state("ot", period=5, clock="1:00"))
+    first = sched.due()
+    assert first == ["ot", "early"]  # budget of 2 tokens, garbage time waits
+    assert sched.next_wakeup() > 0
+    clock.now += 1.0
+    assert sched.due() == ["garbage"]
+
+
+def test_budgets_are_per_host():
+    clock = FakeClock()
+    sched = _sched(clock, budgets={"espn": 1.0, "nba": 1.0}, burst=1)
+    sched.track(_state("a", source="espn"))
+    sched.track(_state("b", source="espn"))
+    sched.track(_state("c", source="nba"))
+    assert sorted(sched.due()) == ["a", "c"]
+
+
+def test_jitter_spreads_next_due():
+    clock = FakeClock()
+    sched = PollScheduler(clock=clock, jitter=0.2, budgets={"espn": 100.0}, burst=100)
+    for i in range(20):
+        sched.track(_state(f"g{i}", period=3))
+    for gid in sched.due():
+        sched.update(_state(gid, period=3))
+    due_times = {g.next_due for g in sched._games.values()}
+    assert len(due_times) > 1
+    assert all(clock.now + 8.0 <= t <= clock.now + 12.0 for t in due_times)
+
+
+def test_run_loop_until_final():
+    clock = FakeClock()
+    sched = _sched(clock)
+    sched.track(_state("g1", period=4, clock="1:00", home=100, away=99))
+    polls = []
+
+    def poll(game_ids):
+        polls.append(clock.now)
+        status = "post" if len(polls) >= 4 else "in"
+        return [_state(gid, status=status, period=4, clock="0:30", home=100, away=99) for gid in game_ids]
+
+    n = run_loop(sched, poll, sleep=clock.sleep)
+    assert n == 4
+    assert [round(b - a, 6) for a, b in zip(polls, polls[1:])] == [3.0, 3.0, 3.0]
+
+
+def test_run_loop_retries_missing_results():
+    clock = FakeClock()
+    sched = _sched(clock)
+    sched.track(_state("g1", period=3))
+    calls = []
+
+    def poll(game_ids):
+        calls.append(list(game_ids))
+        return []
+
+    run_loop(sched, poll, sleep=clock.sleep, max_cycles=5)
+    assert len(calls) >= 2
+    assert sched.active
@@ -0,0 +1,135 @@
+"""Tests for the ESPN + NBA merged scoreboard."""
+
+import json
+
+from benchmarks.fixtures import synthetic_espn_scoreboard, synthetic_nba_scoreboard
+from src.adapters.scoreboard_merge import canonical_abbr, match_games, merge_game, merge_scoreboards
+from src.data import nba_history
+from src.runtime.merged_scoreboard import MergedScoreboard
+from src.state.game_state import GameState
+
+ESPN_SCOREBOARD_PATH = "/apis/site/v2/sports/basketball/nba/scoreboard"
+NBA_SCOREBOARD_PATH = "/static/json/liveData/scoreboard/todaysScoreboard_00.json"
+
+
+def _espn(gid, home, away, start="2026-03-01T00:30Z", **kw):
+    return GameState(game_id=gid, source="espn", status=kw.pop("status", "in"),
+                     home_abbr=home, away_abbr=away, start_time_utc=start, **kw)
+
+
+def _nba(gid, home, away, start="2026-03-01T00:30:00Z", **kw):
+    return GameState(game_id=gid, source="nba", status=kw.pop("status", "in"),
+                     home_abbr=home, away_abbr=away, start_time_utc=start, **kw)
+
+
+def test_abbreviation_map():
+    assert [canonical_abbr(a) for a in ("GS", "NY", "NO", "SA", "UTAH", "WSH", "BOS")] == \
+        ["GSW", "NYK", "NOP", "SAS", "UTA", "WAS", "BOS"]
+
+
+def test_match_by_teams_and_start_time():
+    espn = [_espn("401", "GS", "NY"), _espn("402", "BOS", "MIA"),
+            _espn("403", "SA", "UTAH", start="2026-03-05T00:30Z")]
+    nba = [_nba("0022400001", "GSW", "NYK"), _nba("0022400003", "SAS", "UTA"),
+           _nba("0022400004", "DEN", "PHX")]
+    pairs = [(e and e.game_id, n and n.game_id) for e, n in match_games(espn, nba)]
+    assert pairs == [
+        ("401", "0022400001"),
+        (None, "0022400003"),  # same teams, four days apart: different game
+        (None, "0022400004"),
+        ("402", None),
+        ("403", None),
+    ]
+
+
+def test_fresher_source_wins():
+    espn = _espn("401", "GS", "NY", period=4, clock="2:00", home_score=100, away_score=98)
+    nba = _nba("0022400001", "GSW", "NYK", period=4, clock="2:35", home_score=98, away_score=98)
+    merged = merge_game(espn, nba)
+    assert merged.source == "espn"
+    assert merged.game_id == "0022400001"
+    assert (merged.home_score, merged.clock) == (100, "2:00")
+    assert merged.extra["espn_game_id"] == "401"
+    assert merged.extra["sources"] == ["espn", "nba"]
+    assert "score_disagreement" not in merged.extra
+
+    # Tie: the preferred source wins.
+    same = _espn("401", "GS", "NY", period=4, clock="2:35", home_score=98, away_score=98)
+    assert merge_game(same, nba).source == "nba"
+    assert merge_game(same, nba, prefer="espn").source == "espn"
+
+
+def test_tenths_tie_with_whole_second_clock():
+    # Same instant: NBA carries tenths, ESPN shows whole seconds.
+    espn = _espn("401", "GS", "NY", period=3, clock="5:32", home_score=70, away_score=68)
+    nba = _nba("0022400001", "GSW", "NYK", period=3, clock="PT05M32.40S", home_score=70, away_score=68)
+    assert merge_game(espn, nba, prefer="nba").source == "nba"
+    assert merge_game(espn, nba, prefer="espn").source == "espn"
+    later = _nba("0022400001", "GSW", "NYK", period=3, clock="PT05M31.90S", home_score=70, away_score=68)
+    assert merge_game(espn, later, prefer="espn").source == "nba"
+
+
+def test_score_disagreement_flagged():
+    espn = _espn("401", "GS", "NY", period=3, clock="5:00", home_score=70, away_score=66)
+    nba = _nba("0022400001", "GSW", "NYK", period=3, clock="5:00", home_score=72, away_score=66)
+    merged = merge_game(espn, nba)
+    assert merged.extra["score_disagreement"] == {"espn": [70, 66], "nba": [72, 66]}
+
+    # Fresher feed with fewer points than the lagging one can't be right either.
+    ahead = _espn("401", "GS", "NY", period=3, clock="4:00", home_score=70, away_score=68)
+    assert "score_disagreement" in merge_game(ahead, nba).extra
+
+
+def test_unmatched_pass_through():
+    merged = merge_scoreboards([_espn("402", "BOS", "MIA")], [])
+    assert [(s.game_id, s.extra["sources"]) for s in merged] == [("402", ["espn"])]
+
+
+def test_poller_merges_and_fails_over(stub_server):
+    espn_raw = synthetic_espn_scoreboard(n_games=4)
+    nba_raw = synthetic_nba_scoreboard(n_games=4)
+    stub_server.routes[ESPN_SCOREBOARD_PATH] = espn_raw
+    stub_server.routes[NBA_SCOREBOARD_PATH] = nba_raw
+
+    poller = MergedScoreboard()
+    result = poller.poll()
+    assert result.ok
+    assert len(result.states) == 4
+    assert all(s.extra["sources"] == ["espn", "nba"] for s in result.states)
+    assert all(s.game_id.startswith("00224") for s in result.states)
+
+    def broken(handler):
+        return 500, {}, json.dumps({"error": "down"}).encode()
+
+    stub_server.routes[NBA_SCOREBOARD_PATH] = broken
+    result = poller.poll()
+    assert set(result.errors) == {"nba"}
+    assert len(result.states) == 4
+    assert all(s.source == "espn" for s in result.states)
+
+
+def test_dated_poll_uses_nba_history(stub_server, monkeypatch):
+    stub_server.routes[ESPN_SCOREBOARD_PATH] = {"events": [{
+        "id": "401", "date": "2026-03-01T00:30Z",
+        "competitions": [{"competitors": [
+            {"homeAway": "home", "score": "110", "team": {"abbreviation": "GS"}},
+            {"homeAway": "away", "score": "104", "team": {"abbreviation": "NY"}},
+        ]}],
+        "status": {"period": 4, "displayClock": "0:00", "type": {"state": "post"}},
+    }]}
+    rows = [
+        {"GAME_ID": "0022500801", "GAME_DATE": "2026-02-28", "MIN": 240, "TEAM_ABBREVIATION": abbr,
+         "TEAM_NAME": "", "MATCHUP": matchup, "PTS": pts, "WL": wl}
+        for abbr, matchup, pts, wl in (("GSW", "GSW vs. NYK", 110, "W"), ("NYK", "NYK @ GSW", 104, "L"))
+    ]
+    monkeypatch.setattr(nba_history, "_find_rows", lambda start, end, timeout=None: rows)
+    nba_history.clear_memory()
+    try:
+        result = MergedScoreboard().poll("20260228")
+    finally:
+        nba_history.clear_memory()
+    assert result.ok
+    (merged,) = result.states
+    assert merged.game_id == "0022500801"
+    assert merged.extra["espn_game_id"] == "401"
+    assert "score_disagreement" not in merged.extra